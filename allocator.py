@@ -0,0 +1,351 @@
+#распределение оперативной памяти между задачами
+#
+#разделы памяти ОС (memory_blocks) остаются ячейками для задач, а распределитель
+#дополнительно выделяет задаче память из объема RAM: задача загружается, только если память нашлась
+import bisect
+import heapq
+from array import array
+from typing import Dict, List, Tuple
+from task import Task
+
+#модели памяти
+MEMORY_MODELS = ['fixed', 'first-fit', 'best-fit', 'worst-fit']
+
+#общая часть распределителей: учет занятой памяти и фрагментации по тактам
+class Allocator:
+    name = ''  #название модели памяти
+
+    #конструктор
+    def __init__(self, capacity: int):
+        self.capacity = capacity  #объем памяти в МБ
+        self.reset()
+
+    #возврат к пустой памяти
+    def reset(self):
+        self.used = 0  #память, занятая задачами, МБ
+        self.peak_fragmentation = 0.0  #наибольшая фрагментация за прогон
+        self.fragmentation_sum = 0.0  #сумма фрагментации по тактам
+        self.samples = 0  #количество учтенных тактов
+
+    #свободная память в МБ
+    def freeMemory(self) -> int:
+        return self.capacity - self.used
+
+    #учет фрагментации за count тактов
+    def sample(self, count: int = 1):
+        fragmentation = self.fragmentation()
+        self.fragmentation_sum += fragmentation * count
+        self.samples += count
+        if fragmentation > self.peak_fragmentation:
+            self.peak_fragmentation = fragmentation
+
+    #средняя фрагментация за прогон
+    def meanFragmentation(self) -> float:
+        return self.fragmentation_sum / self.samples if self.samples else 0.0
+
+    #сводка для отчетов
+    def summary(self) -> dict:
+        return {
+            'model': self.name,
+            'capacity': self.capacity,
+            'peak_fragmentation': self.peak_fragmentation,
+            'mean_fragmentation': self.meanFragmentation()
+        }
+
+    #статистика для контрольной точки
+    def getStats(self) -> dict:
+        return {'peak_fragmentation': self.peak_fragmentation,
+                'fragmentation_sum': self.fragmentation_sum, 'samples': self.samples}
+
+    #восстановление статистики из контрольной точки
+    def setStats(self, stats: dict):
+        self.peak_fragmentation = stats['peak_fragmentation']
+        self.fragmentation_sum = stats['fragmentation_sum']
+        self.samples = stats['samples']
+
+#дерево максимумов над ячейками 0..size-1 (значения неотрицательны)
+#изменение ячейки и поиск первой ячейки, значение которой не меньше заданного, за O(log n)
+class MaxTree:
+    #конструктор
+    def __init__(self, size: int):
+        self.leaves = 1  #количество листьев (степень двойки)
+        while self.leaves < size:
+            self.leaves *= 2
+        self.tree = array('q', bytes(16 * self.leaves))  #узел i - максимум узлов 2i и 2i+1, листья с номера leaves
+
+    #значение ячейки
+    def get(self, i: int) -> int:
+        return self.tree[i + self.leaves]
+
+    #изменение ячейки с пересчетом максимумов на пути к корню
+    def set(self, i: int, value: int):
+        tree = self.tree
+        i += self.leaves
+        tree[i] = value
+        i >>= 1
+        while i:
+            left, right = tree[2 * i], tree[2 * i + 1]
+            tree[i] = left if left >= right else right
+            i >>= 1
+
+    #наибольшее значение
+    def max(self) -> int:
+        return self.tree[1]
+
+    #первая ячейка с номером не меньше start и значением не меньше minimum (-1, если такой нет)
+    def findFirst(self, minimum: int, start: int = 0) -> int:
+        if start >= self.leaves:
+            return -1
+        tree = self.tree
+        i = start + self.leaves
+        while tree[i] < minimum:
+            #переход к следующему поддереву правее: подъем, пока узел - правый потомок
+            while i & 1:
+                i >>= 1
+            if not i:
+                return -1
+            i += 1
+        while i < self.leaves:
+            i = 2 * i if tree[2 * i] >= minimum else 2 * i + 1
+        return i - self.leaves
+
+#фиксированные разделы заданных размеров
+#задаче выделяется наименьший свободный раздел, в который она помещается (при равных размерах - с меньшим номером):
+#дерево по различным размерам разделов хранит количество свободных разделов каждого размера,
+#а номера свободных разделов одного размера лежат в куче, так что выделение и освобождение - O(log n)
+#фрагментация внутренняя: доля памяти занятых разделов, не используемая задачами
+class FixedPartitions(Allocator):
+    name = 'fixed'
+
+    #конструктор
+    def __init__(self, sizes: List[int]):
+        if not sizes or min(sizes) <= 0:
+            raise ValueError("Размеры фиксированных разделов должны быть положительными")
+        self.sizes = list(sizes)  #размеры разделов в МБ
+        self.distinct_sizes = sorted(set(self.sizes))  #различные размеры разделов по возрастанию
+        self.size_ranks = {size: rank for rank, size in enumerate(self.distinct_sizes)}  #место размера в этом списке
+        super().__init__(sum(self.sizes))
+
+    def reset(self):
+        super().reset()
+        self.free_counts = MaxTree(len(self.distinct_sizes))  #количество свободных разделов по месту размера
+        self.free_indices = [[] for _ in self.distinct_sizes]  #кучи номеров свободных разделов по месту размера
+        for i, size in enumerate(self.sizes):
+            self.addFree(i)
+        self.allocations: Dict[Task, int] = {}  #номер раздела по задаче
+        self.reserved = 0  #суммарный размер занятых разделов
+
+    #раздел i становится свободным
+    def addFree(self, i: int):
+        rank = self.size_ranks[self.sizes[i]]
+        heapq.heappush(self.free_indices[rank], i)
+        self.free_counts.set(rank, len(self.free_indices[rank]))
+
+    #может ли задача поместиться хотя бы в пустую память
+    def canEverFit(self, task: Task) -> bool:
+        return task.memory <= self.distinct_sizes[-1]
+
+    #найдется ли задаче свободный раздел сейчас (allocate тогда выделит его)
+    def canFitNow(self, task: Task) -> bool:
+        return self.free_counts.findFirst(1, bisect.bisect_left(self.distinct_sizes, task.memory)) >= 0
+
+    #выделение памяти задаче; False, если подходящего свободного раздела нет
+    def allocate(self, task: Task) -> bool:
+        rank = self.free_counts.findFirst(1, bisect.bisect_left(self.distinct_sizes, task.memory))
+        if rank < 0:
+            return False
+        i = heapq.heappop(self.free_indices[rank])
+        self.free_counts.set(rank, len(self.free_indices[rank]))
+        self.allocations[task] = i
+        self.used += task.memory
+        self.reserved += self.sizes[i]
+        return True
+
+    #освобождение памяти задачи
+    def release(self, task: Task):
+        i = self.allocations.pop(task, None)
+        if i is None:
+            return
+        self.addFree(i)
+        self.used -= task.memory
+        self.reserved -= self.sizes[i]
+
+    def fragmentation(self) -> float:
+        return (self.reserved - self.used) / self.reserved if self.reserved else 0.0
+
+    #выделенная память: задача и номер раздела
+    def getAllocations(self) -> List[Tuple[Task, int]]:
+        return list(self.allocations.items())
+
+    #восстановление выделенной памяти (свободные разделы - все остальные)
+    def setAllocations(self, allocations: List[Tuple[Task, int]]):
+        stats = self.getStats()
+        self.reset()
+        self.setStats(stats)
+        taken = set()
+        for task, i in allocations:
+            self.allocations[task] = i
+            self.used += task.memory
+            self.reserved += self.sizes[i]
+            taken.add(i)
+        self.free_indices = [[i for i in indices if i not in taken] for indices in self.free_indices]
+        for rank, indices in enumerate(self.free_indices):
+            heapq.heapify(indices)
+            self.free_counts.set(rank, len(indices))
+
+#переменные разделы: задаче выделяется ровно нужный объем из непрерывной свободной области
+#свободные области хранятся по началу и по концу (для слияния соседних) и в дереве максимумов по адресу:
+#первая подходящая по адресу и самая большая область находятся за O(log n).
+#для наилучшей - дерево по размерам с количеством областей каждого размера и кучи начал областей одного размера,
+#для наихудшей - куча (-размер, -начало). записи куч не удаляются сразу, а отбрасываются при извлечении,
+#если такой области уже нет; когда устаревших записей становится больше действующих, куча пересобирается
+#фрагментация внешняя: доля свободной памяти вне самой большой свободной области
+class VariablePartitions(Allocator):
+    #конструктор
+    #fit - выбор свободной области: first (первая по адресу), best (наименьшая подходящая), worst (наибольшая)
+    def __init__(self, capacity: int, fit: str = 'best'):
+        if fit not in ('first', 'best', 'worst'):
+            raise ValueError(f"Неизвестная стратегия размещения: {fit}")
+        self.fit = fit  #стратегия выбора свободной области
+        self.name = f"{fit}-fit"
+        super().__init__(capacity)
+
+    def reset(self):
+        super().reset()
+        self.hole_sizes = {}  #размер свободной области по ее началу
+        self.hole_ends = {}  #начало свободной области по ее концу
+        self.by_address = MaxTree(self.capacity)  #размер свободной области по ее началу (0 - области нет)
+        self.size_counts = MaxTree(self.capacity + 1) if self.fit == 'best' else None  #количество областей по размеру
+        self.starts_by_size = {}  #для наилучшей: кучи начал областей по размеру
+        self.largest = []  #для наихудшей: куча (-размер, -начало)
+        self.allocations: Dict[Task, Tuple[int, int]] = {}  #начало и размер выделенной области по задаче
+        if self.capacity > 0:
+            self.addHole(0, self.capacity)
+
+    #есть ли свободная область с таким началом и размером (проверка записей куч)
+    def isHole(self, start: int, size: int) -> bool:
+        return self.hole_sizes.get(start) == size
+
+    #добавление свободной области
+    def addHole(self, start: int, size: int):
+        self.hole_sizes[start] = size
+        self.hole_ends[start + size] = start
+        self.by_address.set(start, size)
+        if self.fit == 'best':
+            self.size_counts.set(size, self.size_counts.get(size) + 1)
+            starts = self.starts_by_size.setdefault(size, [])
+            heapq.heappush(starts, start)
+            if len(starts) > 2 * self.size_counts.get(size) + 8:
+                self.starts_by_size[size] = starts = sorted({start for start in starts if self.isHole(start, size)})
+        elif self.fit == 'worst':
+            heapq.heappush(self.largest, (-size, -start))
+            if len(self.largest) > 2 * len(self.hole_sizes) + 8:
+                self.largest = [(-size, -start) for start, size in self.hole_sizes.items()]
+                heapq.heapify(self.largest)
+
+    #удаление свободной области (записи куч остаются и отбрасываются позже)
+    def removeHole(self, start: int):
+        size = self.hole_sizes.pop(start)
+        del self.hole_ends[start + size]
+        self.by_address.set(start, 0)
+        if self.fit == 'best':
+            self.size_counts.set(size, self.size_counts.get(size) - 1)
+
+    def canEverFit(self, task: Task) -> bool:
+        return task.memory <= self.capacity
+
+    #найдется ли задаче свободная область сейчас: при любой стратегии подходит любая достаточно большая область
+    def canFitNow(self, task: Task) -> bool:
+        return self.by_address.max() >= max(task.memory, 1)
+
+    #выбор свободной области не меньше size; None, если такой нет
+    def findHole(self, size: int):
+        #у любой свободной области размер не меньше 1, а 0 в дереве означает отсутствие области
+        size = max(size, 1)
+        if self.by_address.max() < size:
+            return None
+        if self.fit == 'first':
+            return self.by_address.findFirst(size)
+        if self.fit == 'best':
+            hole = self.size_counts.findFirst(1, size)
+            starts = self.starts_by_size[hole]
+            while not self.isHole(starts[0], hole):
+                heapq.heappop(starts)
+            return starts[0]
+        while not self.isHole(-self.largest[0][1], -self.largest[0][0]):
+            heapq.heappop(self.largest)
+        return -self.largest[0][1]
+
+    def allocate(self, task: Task) -> bool:
+        size = task.memory
+        start = self.findHole(size)
+        if start is None:
+            return False
+        hole = self.hole_sizes[start]
+        self.removeHole(start)
+        if hole > size:
+            self.addHole(start + size, hole - size)
+        self.allocations[task] = (start, size)
+        self.used += size
+        return True
+
+    #освобождение памяти задачи со слиянием с соседними свободными областями
+    def release(self, task: Task):
+        allocation = self.allocations.pop(task, None)
+        if allocation is None:
+            return
+        start, size = allocation
+        self.used -= size
+        if size == 0:
+            return
+        following = start + size
+        if following in self.hole_sizes:
+            size += self.hole_sizes[following]
+            self.removeHole(following)
+        previous = self.hole_ends.get(start)
+        if previous is not None:
+            start, size = previous, size + self.hole_sizes[previous]
+            self.removeHole(previous)
+        self.addHole(start, size)
+
+    def fragmentation(self) -> float:
+        free = self.capacity - self.used
+        if not free:
+            return 0.0
+        return 1 - self.by_address.max() / free
+
+    def getAllocations(self) -> List[Tuple[Task, Tuple[int, int]]]:
+        return list(self.allocations.items())
+
+    #восстановление выделенной памяти: свободные области - промежутки между выделенными
+    def setAllocations(self, allocations: List[Tuple[Task, Tuple[int, int]]]):
+        stats = self.getStats()
+        self.reset()
+        self.setStats(stats)
+        if self.capacity > 0:
+            self.removeHole(0)
+        position = 0
+        for task, (start, size) in sorted(allocations, key=lambda item: item[1][0]):
+            #задача без памяти не разделяет свободную область
+            if size:
+                if start > position:
+                    self.addHole(position, start - position)
+                position = max(position, start + size)
+            self.allocations[task] = (start, size)
+            self.used += size
+        if position < self.capacity:
+            self.addHole(position, self.capacity - position)
+
+#создание распределителя памяти
+#ram - объем RAM в ГБ; для фиксированных разделов без заданных размеров RAM делится поровну на blocks разделов
+def createAllocator(model: str, ram: int, blocks: int, partition_sizes: List[int] = None) -> Allocator:
+    capacity = ram * 1024
+    if model == 'fixed':
+        if partition_sizes is None:
+            partition_sizes = [capacity // blocks] * blocks
+        if sum(partition_sizes) > capacity:
+            raise ValueError(f"Разделы ({sum(partition_sizes)} МБ) не помещаются в RAM ({capacity} МБ)")
+        return FixedPartitions(partition_sizes)
+    if model in MEMORY_MODELS:
+        return VariablePartitions(capacity, model.split('-')[0])
+    raise ValueError(f"Неизвестная модель памяти: {model} (доступны: {', '.join(MEMORY_MODELS)})")
@@ -0,0 +1,179 @@
+#пакетный запуск симуляций без графического интерфейса
+import argparse
+import csv
+import itertools
+import json
+import sys
+from simulation import Simulation
+from packetcache import configureCache
+from scheduler import SCHEDULERS
+from allocator import MEMORY_MODELS
+from controller import CONTROLLERS
+
+#поля строки csv-отчета
+CSV_FIELDS = [
+    'json_file', 'max_blocks_count', 'ram', 'max_tacts', 'cpu_count', 'scheduler', 'memory_model', 'controller', 'quantum', 'swap_cost', 'total_tacts', 'run_time',
+    'tact', 'memory_blocks_used', 'cpu_state', 'WAIT', 'RUN', 'READY', 'memory_usage'
+]
+
+#запуск одной симуляции и сбор результатов
+def runConfig(json_file: str, max_blocks_count: int, ram: int, max_tacts: int, log=None,
+              event_driven: bool = False, streaming: bool = False, cpu_count: int = None,
+              scheduler: str = 'fifo', memory_model: str = None, partition_sizes: list = None,
+              controller: str = 'shrink', quantum: int = None, swap_cost: int = 0) -> dict:
+    sim = Simulation(
+        max_blocks_count=max_blocks_count,
+        ram=ram,
+        json_file=json_file,
+        max_tacts=max_tacts,
+        event_driven=event_driven,
+        streaming=streaming,
+        cpu_count=cpu_count,
+        scheduler=scheduler,
+        memory_model=memory_model,
+        partition_sizes=partition_sizes,
+        controller=controller,
+        quantum=quantum,
+        swap_cost=swap_cost
+    )
+    if log:
+        sim.os.setOutputCallback(log)
+    sim.start()
+
+    return {
+        'json_file': json_file,
+        'max_blocks_count': max_blocks_count,
+        'ram': ram,
+        'max_tacts': max_tacts,
+        'cpu_count': cpu_count,
+        'scheduler': scheduler,
+        'memory_model': memory_model,
+        'controller': controller,
+        'total_tacts': sim.total_tacts,
+        'final_blocks_count': sim.os.max_blocks_count,
+        'reloads': sim.os.reload_count,
+        'controller_stats': sim.os.controller.getState(),
+        'quantum': quantum,
+        'swap_cost': swap_cost,
+        'preemptions': sim.os.preemption.preemptions if sim.os.preemption is not None else 0,
+        'swap_tacts': sim.os.preemption.swap_tacts if sim.os.preemption is not None else 0,
+        'task_times': sim.os.task_times.summary(),
+        'rejected': len(sim.os.rejected_tasks),
+        'memory': sim.os.allocator.summary() if sim.os.allocator is not None else None,
+        'run_time': sim.getRunTime(),
+        'cpu_state_counts': sim.os.getCpuStateCounts(),
+        'core_state_counts': sim.os.getCoreStateCounts(),
+        'history': sim.os.history.asDict()
+    }
+
+#все комбинации параметров в фиксированном порядке
+#cpus - количества ядер (None - без учета ядер), schedulers - названия политик планирования,
+#memory_models - модели памяти (None - объем памяти задач не учитывается),
+#controllers - политики изменения количества разделов,
+#quantums - кванты времени для вытеснения (None - без вытеснения), swap_costs - стоимость подгрузки в тактах
+def buildGrid(packets: list, blocks: list, rams: list, tacts: list, cpus: list = (None,),
+              schedulers: list = ('fifo',), memory_models: list = (None,), controllers: list = ('shrink',),
+              quantums: list = (None,), swap_costs: list = (0,)) -> list:
+    return [
+        {'json_file': json_file, 'max_blocks_count': max_blocks_count, 'ram': ram, 'max_tacts': max_tacts,
+         'cpu_count': cpu_count, 'scheduler': scheduler, 'memory_model': memory_model, 'controller': controller,
+         'quantum': quantum, 'swap_cost': swap_cost}
+        for json_file, max_blocks_count, ram, max_tacts, cpu_count, scheduler, memory_model, controller, quantum, swap_cost
+        in itertools.product(packets, blocks, rams, tacts, cpus, schedulers, memory_models, controllers,
+                             quantums, swap_costs)
+    ]
+
+#вывод результатов в формате json
+def writeJson(results: list, stream):
+    json.dump(results, stream, ensure_ascii=False, indent=2)
+    stream.write("\n")
+
+#вывод результатов в формате csv (одна строка на такт каждой симуляции)
+def writeCsv(results: list, stream):
+    writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for result in results:
+        history = result['history']
+        for i, tact in enumerate(history['tacts']):
+            writer.writerow({
+                'json_file': result['json_file'],
+                'max_blocks_count': result['max_blocks_count'],
+                'ram': result['ram'],
+                'max_tacts': result['max_tacts'],
+                'cpu_count': result['cpu_count'],
+                'scheduler': result['scheduler'],
+                'memory_model': result['memory_model'],
+                'controller': result['controller'],
+                'quantum': result['quantum'],
+                'swap_cost': result['swap_cost'],
+                'total_tacts': result['total_tacts'],
+                'run_time': f"{result['run_time']:.6f}",
+                'tact': tact,
+                'memory_blocks_used': history['memory_blocks_used'][i],
+                'cpu_state': history['cpu_states'][i],
+                'WAIT': history['task_states']['WAIT'][i],
+                'RUN': history['task_states']['RUN'][i],
+                'READY': history['task_states']['READY'][i],
+                'memory_usage': history['memory_usage'][i]
+            })
+
+#разбор аргументов командной строки
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(description="Запуск симуляции без графического интерфейса")
+    parser.add_argument('packets', nargs='+', help="файлы пакетов в формате JSON")
+    parser.add_argument('-b', '--blocks', type=int, nargs='+', default=[1],
+                        help="количество разделов памяти (можно несколько значений)")
+    parser.add_argument('-r', '--ram', type=int, nargs='+', default=[1],
+                        help="объем RAM в ГБ (можно несколько значений)")
+    parser.add_argument('-t', '--tacts', type=int, nargs='+', default=[1000],
+                        help="максимальное количество тактов (можно несколько значений)")
+    parser.add_argument('-c', '--cpus', type=int, nargs='+', default=[None],
+                        help="количество ядер процессора (можно несколько значений; по умолчанию без учета ядер)")
+    parser.add_argument('-s', '--scheduler', nargs='+', choices=list(SCHEDULERS), default=['fifo'],
+                        help="политика выбора задачи для загрузки (можно несколько значений)")
+    parser.add_argument('-m', '--memory-model', nargs='+', choices=MEMORY_MODELS, default=[None],
+                        help="модель памяти RAM (можно несколько значений; по умолчанию объем памяти задач не учитывается)")
+    parser.add_argument('--partition-sizes', type=int, nargs='+', default=None,
+                        help="размеры фиксированных разделов в МБ для модели fixed")
+    parser.add_argument('--controller', nargs='+', choices=list(CONTROLLERS), default=['shrink'],
+                        help="политика изменения количества разделов (можно несколько значений)")
+    parser.add_argument('-q', '--quantum', type=int, nargs='+', default=[None],
+                        help="квант времени в тактах для вытеснения задач (можно несколько значений; 0 - без вытеснения)")
+    parser.add_argument('--swap-cost', type=int, nargs='+', default=[0],
+                        help="сколько тактов вытесненная задача подгружается обратно (можно несколько значений)")
+    parser.add_argument('-f', '--format', choices=['json', 'csv'], default='json',
+                        help="формат вывода")
+    parser.add_argument('-o', '--output', default=None,
+                        help="файл для вывода (по умолчанию stdout)")
+    parser.add_argument('--log', action='store_true',
+                        help="выводить ход симуляции в stderr")
+    parser.add_argument('--event-driven', action='store_true',
+                        help="пропускать такты, в которых ничего не меняется")
+    parser.add_argument('--streaming', action='store_true',
+                        help="читать задачи из файла по мере надобности (для файлов .jsonl всегда)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="каталог для сохранения разобранных пакетов между запусками")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parseArgs(argv)
+    log = (lambda message: print(message, file=sys.stderr)) if args.log else None
+    if args.cache_dir:
+        configureCache(directory=args.cache_dir)
+
+    results = [
+        runConfig(log=log, event_driven=args.event_driven, streaming=args.streaming,
+                  partition_sizes=args.partition_sizes, **config)
+        for config in buildGrid(args.packets, args.blocks, args.ram, args.tacts, args.cpus, args.scheduler,
+                                args.memory_model, args.controller, args.quantum, args.swap_cost)
+    ]
+
+    write = writeCsv if args.format == 'csv' else writeJson
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write(results, f)
+    else:
+        write(results, sys.stdout)
+
+if __name__ == "__main__":
+    main()
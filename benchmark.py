@@ -0,0 +1,231 @@
+#замеры производительности симулятора
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from simulation import Simulation
+from eventlog import LogLevel
+from packet import Packet
+from packetbin import convertToBinary, openPacket
+
+#бюджет времени от запуска программы до готовности окна, мс
+STARTUP_BUDGET_MS = 300
+
+#сколько раз запускается окно при замере запуска
+STARTUP_RUNS = 5
+
+#программа замера запуска окна (выполняется в отдельном процессе, чтобы импорты были холодными):
+#выводит время до готовности окна и до вывода сведений о пакете, с
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+import main
+window = main.MainWindow()
+failed = []
+window.packet_loader.failed.disconnect()
+window.packet_loader.failed.connect(lambda file, message: failed.append(message))
+app.processEvents()
+ready = time.perf_counter()
+while window.packet is None and not failed:
+    app.processEvents()
+    time.sleep(0.001)
+print(ready - start, time.perf_counter() - start)
+"""
+
+#отбрасывающий получатель сообщений: измеряется стоимость их формирования, а не вывода
+def nullSink(message: str):
+    pass
+
+#прогон симуляции заданное число раз, возвращает тактов в секунду
+def measureTactsPerSecond(json_file: str, max_blocks_count: int, repeats: int, level: LogLevel = None) -> float:
+    total_tacts = 0
+    elapsed = 0.0
+    for _ in range(repeats):
+        sim = Simulation(max_blocks_count=max_blocks_count, ram=16, json_file=json_file, max_tacts=10**9)
+        if level is not None:
+            sim.os.setOutputCallback(nullSink, level)
+        start = time.perf_counter()
+        sim.start()
+        elapsed += time.perf_counter() - start
+        total_tacts += sim.total_tacts
+    return total_tacts / elapsed
+
+#сравнение скорости с отключенным и включенным журналом
+def benchLogging(json_file: str, max_blocks_count: int, repeats: int):
+    print(f"Журнал: {json_file}, разделов: {max_blocks_count}, повторов: {repeats}")
+    for title, level in [("выключен", None), ("SUMMARY", LogLevel.SUMMARY),
+                         ("INFO", LogLevel.INFO), ("TRACE", LogLevel.TRACE)]:
+        rate = measureTactsPerSecond(json_file, max_blocks_count, repeats, level)
+        print(f"  {title:<10} {rate:>12.0f} тактов/с")
+
+#запись синтетического пакета заданного размера
+def writeSyntheticPacket(path: str, count: int, seed: int = 0):
+    rng = random.Random(seed)
+    tasks = []
+    for num in range(1, count + 1):
+        task_type = rng.choice(["MATH", "INOUT"])
+        memory = rng.randint(100, 1000) if task_type == "MATH" else rng.randint(50, 500)
+        tasks.append({"num": num, "type": task_type, "memory": memory})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"tasks": tasks}, f)
+
+#зависимость времени симуляции от размера пакета
+#при линейной сложности время на одну задачу не должно расти с размером пакета
+def benchScaling(sizes: list, max_blocks_count: int):
+    print(f"Масштабирование: разделов {max_blocks_count}")
+    print(f"  {'задач':>10} {'тактов':>10} {'время, с':>10} {'мкс/задачу':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"pack_{size}.json")
+            writeSyntheticPacket(path, size)
+            sim = Simulation(max_blocks_count=max_blocks_count, ram=16, json_file=path, max_tacts=10**9)
+            start = time.perf_counter()
+            sim.start()
+            elapsed = time.perf_counter() - start
+            print(f"  {size:>10} {sim.total_tacts:>10} {elapsed:>10.3f} {elapsed / size * 1e6:>12.2f}")
+
+#сравнение потактового и событийного режимов на одном пакете
+def benchEngines(json_file: str, max_blocks_count: int, repeats: int):
+    print(f"Режимы: {json_file}, разделов: {max_blocks_count}, повторов: {repeats}")
+    for title, event_driven in [("потактовый", False), ("событийный", True)]:
+        elapsed = 0.0
+        for _ in range(repeats):
+            sim = Simulation(max_blocks_count=max_blocks_count, ram=16, json_file=json_file,
+                             max_tacts=10**9, event_driven=event_driven)
+            start = time.perf_counter()
+            sim.start()
+            elapsed += time.perf_counter() - start
+        print(f"  {title:<12} {sim.total_tacts:>8} тактов {elapsed / repeats * 1000:>10.3f} мс/прогон")
+
+#пиковая память при обычной и потоковой загрузке пакета
+#число тактов ограничено, чтобы объем истории был одинаковым для всех размеров пакета
+def benchStreaming(sizes: list, max_blocks_count: int, max_tacts: int = 10000):
+    print(f"Память: разделов {max_blocks_count}, тактов {max_tacts}")
+    print(f"  {'задач':>10} {'обычно, МБ':>12} {'потоково, МБ':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"pack_{size}.json")
+            writeSyntheticPacket(path, size)
+            peaks = []
+            for streaming in (False, True):
+                tracemalloc.start()
+                sim = Simulation(max_blocks_count=max_blocks_count, ram=16, json_file=path,
+                                 max_tacts=max_tacts, streaming=streaming)
+                sim.start()
+                peaks.append(tracemalloc.get_traced_memory()[1] / 2**20)
+                tracemalloc.stop()
+                del sim
+            print(f"  {size:>10} {peaks[0]:>12.1f} {peaks[1]:>14.1f}")
+
+#время получения сведений о пакете из JSON и из двоичного формата
+def benchLoading(sizes: list, repeats: int = 5):
+    print(f"Загрузка пакета: повторов {repeats}")
+    print(f"  {'задач':>10} {'JSON, мс':>10} {'двоичный, мс':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"pack_{size}.json")
+            binary_path = os.path.join(tmp, f"pack_{size}.pkb")
+            writeSyntheticPacket(path, size)
+            convertToBinary(path, binary_path)
+            times = []
+            for open_packet, filename in ((Packet, path), (openPacket, binary_path)):
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    packet = open_packet(filename)
+                    packet.getMathTasks()
+                    packet.getInOutTasks()
+                times.append((time.perf_counter() - start) / repeats * 1000)
+            print(f"  {size:>10} {times[0]:>10.2f} {times[1]:>14.2f}")
+
+#повторные прогоны одного пакета: новая симуляция на каждый прогон против сброса существующей
+def benchRerun(json_file: str, max_blocks_count: int, repeats: int, max_tacts: int = 50):
+    print(f"Повторные прогоны: {json_file}, разделов: {max_blocks_count}, тактов: {max_tacts}, повторов: {repeats}")
+    start = time.perf_counter()
+    for _ in range(repeats):
+        sim = Simulation(max_blocks_count=max_blocks_count, ram=16, json_file=json_file, max_tacts=max_tacts)
+        sim.start()
+    fresh = (time.perf_counter() - start) / repeats * 1000
+    start = time.perf_counter()
+    for _ in range(repeats):
+        sim.reset()
+        sim.start()
+    rerun = (time.perf_counter() - start) / repeats * 1000
+    print(f"  {'новая симуляция':<16} {fresh:>10.3f} мс/прогон")
+    print(f"  {'сброс':<16} {rerun:>10.3f} мс/прогон")
+
+#разбор отчета python -X importtime: список (модуль, собственное время, время с вложенными импортами, вложенность), мкс
+def parseImportTimes(report: str) -> list:
+    entries = []
+    for line in report.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+#время запуска окна в отдельных процессах и самые долгие импорты верхнего уровня
+#возвращает False, если медианное время до готовности окна превышает бюджет
+def benchStartup(budget_ms: float = STARTUP_BUDGET_MS, runs: int = STARTUP_RUNS, top: int = 10) -> bool:
+    directory = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    ready_times = []
+    info_times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT], cwd=directory,
+                                env=env, capture_output=True, text=True, check=True)
+        ready, info = map(float, result.stdout.split()[-2:])
+        ready_times.append(ready * 1000)
+        info_times.append(info * 1000)
+    imports = [entry for entry in parseImportTimes(result.stderr) if entry[3] == 0]
+    imports.sort(key=lambda entry: entry[2], reverse=True)
+    ready_ms = statistics.median(ready_times)
+    print(f"Запуск окна: запусков {runs}, бюджет {budget_ms:.0f} мс")
+    print(f"  {'окно готово':<24} {ready_ms:>10.1f} мс")
+    print(f"  {'сведения о пакете':<24} {statistics.median(info_times):>10.1f} мс")
+    print(f"  импорты верхнего уровня (последний запуск, с вложенными):")
+    for name, _, cumulative_us, _ in imports[:top]:
+        print(f"    {name:<30} {cumulative_us / 1000:>10.1f} мс")
+    within = ready_ms <= budget_ms
+    print("  в пределах бюджета" if within else f"  превышение бюджета на {ready_ms - budget_ms:.1f} мс")
+    return within
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности симулятора")
+    parser.add_argument('bench', choices=['logging', 'scaling', 'engines', 'streaming', 'loading', 'rerun', 'startup'], help="какой замер выполнить")
+    parser.add_argument('--packet', default='ready_packets/balanced_big_pack.json', help="файл пакета")
+    parser.add_argument('-b', '--blocks', type=int, default=8, help="количество разделов памяти")
+    parser.add_argument('-n', '--repeats', type=int, default=200, help="количество повторов")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="размеры синтетических пакетов для замера масштабирования")
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_MS,
+                        help="бюджет времени запуска окна, мс (замер startup завершается с кодом 1 при превышении)")
+    args = parser.parse_args(argv)
+
+    if args.bench == 'logging':
+        benchLogging(args.packet, args.blocks, args.repeats)
+    elif args.bench == 'scaling':
+        benchScaling(args.sizes, args.blocks)
+    elif args.bench == 'engines':
+        benchEngines(args.packet, args.blocks, args.repeats)
+    elif args.bench == 'streaming':
+        benchStreaming(args.sizes, args.blocks)
+    elif args.bench == 'loading':
+        benchLoading(args.sizes)
+    elif args.bench == 'rerun':
+        benchRerun(args.packet, args.blocks, args.repeats)
+    elif args.bench == 'startup':
+        if not benchStartup(args.budget):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#контрольные точки: сохранение состояния ОС посреди прогона и продолжение с него
+#
+#контрольная точка - архив numpy (.npz): столбцы истории, состояния задач пакета,
+#задачи, на которые ссылаются разделы и очереди, и описание в JSON, сохраненное как массив байт.
+#сам пакет не сохраняется, при продолжении он загружается заново из своего файла.
+#завершенные задачи сохраняются только номерами строк таблицы пакета, а архив не сжимается:
+#иначе запись точки занимает время, растущее с длиной прогона и количеством завершенных задач
+import json
+import os
+import numpy as np
+from cpu import StateCPU
+from history import History, COLUMNS
+from packet import TASK_TYPES, TASK_STATES, TYPE_CODES, STATE_CODES
+from task import Task
+
+#версия формата контрольной точки
+#в версии 1 завершенные задачи сохранялись описаниями, как задачи разделов и очередей; такие точки тоже читаются
+CHECKPOINT_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+
+#столбцы описания задач в контрольной точке
+TASK_COLUMNS = {
+    'num': np.int64,
+    'type': np.int8,
+    'memory': np.int32,
+    'state': np.int8,
+    'execution_time': np.int32,
+    'index': np.int64
+}
+
+#номера задач для ссылок на них из разделов и очередей
+#одна задача может быть и в разделе, и в множествах выполняющихся и ожидающих ввод/вывод
+class TaskRefs:
+    #конструктор
+    def __init__(self):
+        self.ids = {}  #номер по задаче
+        self.tasks = []  #задачи по номеру
+
+    #номер задачи (-1 для пустой ссылки)
+    def ref(self, task: Task) -> int:
+        if task is None:
+            return -1
+        task_id = self.ids.get(task)
+        if task_id is None:
+            task_id = self.ids[task] = len(self.tasks)
+            self.tasks.append(task)
+        return task_id
+
+    #массив номеров задач
+    def refs(self, tasks) -> np.ndarray:
+        return np.array([self.ref(task) for task in tasks], dtype=np.int64)
+
+    #столбцы с описанием всех задач, получивших номер
+    def columns(self) -> dict:
+        tasks = self.tasks
+        return {
+            'num': np.array([task.num for task in tasks], dtype=np.int64),
+            'type': np.array([TYPE_CODES[task.type] for task in tasks], dtype=np.int8),
+            'memory': np.array([task.memory for task in tasks], dtype=np.int32),
+            'state': np.array([STATE_CODES[task.state] for task in tasks], dtype=np.int8),
+            'execution_time': np.array([task.execution_time for task in tasks], dtype=np.int32),
+            'index': np.array([task.index for task in tasks], dtype=np.int64)
+        }
+
+#состояние ОС в виде описания и массивов для записи в контрольную точку
+def captureOS(system) -> tuple:
+    refs = TaskRefs()
+    arrays = {
+        'memory_blocks': refs.refs(system.memory_blocks),
+        'wait_queue': refs.refs(system.wait_queue),
+        'preempted_queue': refs.refs(system.preempted_queue),
+        'running_tasks': refs.refs(system.running_tasks),
+        'io_wait_tasks': refs.refs(system.io_wait_tasks),
+        'ready_indices': np.fromiter((task.index for task in system.ready_queue), dtype=np.int64,
+                                     count=len(system.ready_queue)),
+        'free_blocks': np.array(system.free_blocks, dtype=np.int64),
+        'completed_blocks': np.array(system.completed_blocks, dtype=np.int64),
+        'core_tasks': refs.refs(core.current_task for core in system.cores)
+    }
+    cpu_task = refs.ref(system.cpu.current_task)
+    arrays['rejected_tasks'] = refs.refs(system.rejected_tasks)
+    allocations = system.allocator.getAllocations() if system.allocator is not None else []
+    arrays['allocated_tasks'] = refs.refs(task for task, _ in allocations)
+    arrays['allocations'] = np.array([allocation for _, allocation in allocations], dtype=np.int64)
+    arrivals = getattr(system.scheduler, 'arrivals', {})
+    arrays['scheduler_tasks'] = refs.refs(arrivals.keys())
+    arrays['scheduler_arrivals'] = np.array(list(arrivals.values()), dtype=np.int64)
+    start_tacts = system.task_times.start_tacts
+    arrays['started_tasks'] = refs.refs(start_tacts.keys())
+    arrays['start_tacts'] = np.array(list(start_tacts.values()), dtype=np.int64)
+    preemption = system.preemption
+    if preemption is not None:
+        arrays['slice_tasks'] = refs.refs(preemption.slices.keys())
+        arrays['slice_tacts'] = np.array(list(preemption.slices.values()), dtype=np.int64)
+        arrays['swapping_tasks'] = refs.refs(preemption.swapping.keys())
+        arrays['swapping_tacts'] = np.array(list(preemption.swapping.values()), dtype=np.int64)
+    for name, column in refs.columns().items():
+        arrays['task_' + name] = column
+    for name in COLUMNS:
+        arrays['history_' + name] = system.history.column(name)
+    arrays['history_core_states'] = system.history.coreStates()
+
+    saved_states = system.packet.saveStates() if system.packet else None
+    if saved_states is not None:
+        arrays['packet_states'], arrays['packet_execution_time'] = saved_states
+
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'packet_count': system.packet.getTasksCount() if system.packet else 0,
+        'packet_memory': system.packet.getTasksMemory() if system.packet else 0,
+        'ram': system.ram,
+        'max_blocks_count': system.max_blocks_count,
+        'current_tact': system.current_tact,
+        'pending_count': system.pending_count,
+        'ready_count': system.ready_count,
+        'keep_ready_tasks': system.keep_ready_tasks,
+        'used_blocks_count': system.used_blocks_count,
+        'running_math_count': system.running_math_count,
+        'running_io_count': system.running_io_count,
+        'cpu_state': system.cpu.state.value,
+        'cpu_task': cpu_task,
+        'cpu_state_counts': dict(system.cpu_state_counts),
+        'cpu_count': system.cpu_count,
+        'core_states': [core.state.value for core in system.cores],
+        'core_state_counts': system.getCoreStateCounts(),
+        'memory_model': system.allocator.name if system.allocator is not None else None,
+        'reload_count': system.reload_count,
+        'controller_state': system.controller.getState(),
+        'task_times': system.task_times.getState(),
+        'preemption': {'preemptions': preemption.preemptions, 'swap_tacts': preemption.swap_tacts}
+                      if preemption is not None else None,
+        'allocator_stats': system.allocator.getStats() if system.allocator is not None else None,
+        'task_types': dict(system.history.task_types)
+    }
+    return meta, arrays
+
+#завершенные задачи по номерам строк таблицы пакета, состояния которой уже восстановлены
+#задачи, на которые ссылаются еще и разделы, берутся из уже созданных, чтобы не появилось двух объектов одной задачи
+def readyTasks(table, indices: np.ndarray, tasks: list) -> list:
+    if not len(indices):
+        return []
+    known = {task.index: task for task in tasks if task.index >= 0}
+    columns = zip(indices.tolist(), table.nums[indices].tolist(), table.types[indices].tolist(),
+                  table.memory[indices].tolist(), table.states[indices].tolist(), table.execution_time[indices].tolist())
+    return [
+        known.get(index) or Task(num=num, type=TASK_TYPES[type_code], memory=memory, state=TASK_STATES[state_code],
+                                 execution_time=execution_time, index=index, table=table)
+        for index, num, type_code, memory, state_code, execution_time in columns
+    ]
+
+#восстановление состояния ОС из контрольной точки
+#ОС должна быть инициализирована тем же пакетом, с которым сохранялась контрольная точка
+def restoreOS(system, meta: dict, arrays: dict):
+    packet = system.packet
+    if (packet.getTasksCount(), packet.getTasksMemory()) != (meta['packet_count'], meta['packet_memory']):
+        raise ValueError("Контрольная точка сохранена для другого пакета")
+    if system.cpu_count != meta['cpu_count']:
+        raise ValueError("Контрольная точка сохранена для другого количества ядер")
+    if (system.allocator.name if system.allocator is not None else None) != meta['memory_model']:
+        raise ValueError("Контрольная точка сохранена для другой модели памяти")
+    if (system.preemption is not None) != (meta['preemption'] is not None):
+        raise ValueError("Контрольная точка сохранена для другого режима вытеснения")
+
+    if 'packet_states' in arrays:
+        packet.restoreStates((arrays['packet_states'], arrays['packet_execution_time']))
+
+    table = getattr(packet, 'table', None)
+    columns = zip(*(arrays['task_' + name].tolist() for name in TASK_COLUMNS))
+    tasks = [
+        Task(num=num, type=TASK_TYPES[type_code], memory=memory, state=TASK_STATES[state_code],
+             execution_time=execution_time, index=index, table=table if index >= 0 else None)
+        for num, type_code, memory, state_code, execution_time, index in columns
+    ]
+    def taskList(name: str) -> list:
+        return [tasks[task_id] if task_id >= 0 else None for task_id in arrays[name].tolist()]
+
+    system.max_blocks_count = meta['max_blocks_count']
+    system.memory_blocks = taskList('memory_blocks')
+    system.running_tasks = set(taskList('running_tasks'))
+    system.io_wait_tasks = set(taskList('io_wait_tasks'))
+    if 'ready_indices' in arrays:
+        system.ready_queue = readyTasks(table, arrays['ready_indices'], tasks)
+    else:
+        system.ready_queue = taskList('ready_queue')
+    system.keep_ready_tasks = meta['keep_ready_tasks']
+    system.ready_count = meta['ready_count']
+    system.free_blocks = arrays['free_blocks'].tolist()
+    system.completed_blocks = arrays['completed_blocks'].tolist()
+
+    system.openTaskSource()
+    system.wait_queue.extend(taskList('wait_queue'))
+    system.preempted_queue.extend(taskList('preempted_queue'))
+    system.pending_count = meta['pending_count']
+    system.task_source = packet.iterTasks(meta['packet_count'] - meta['pending_count'])
+
+    system.used_blocks_count = meta['used_blocks_count']
+    system.running_math_count = meta['running_math_count']
+    system.running_io_count = meta['running_io_count']
+    system.current_tact = meta['current_tact']
+    system.cpu.state = StateCPU(meta['cpu_state'])
+    system.cpu.current_task = tasks[meta['cpu_task']] if meta['cpu_task'] >= 0 else None
+    system.cpu_state_counts = dict(meta['cpu_state_counts'])
+    system.resetCores()
+    for k, (core, task_id, state) in enumerate(zip(system.cores, arrays['core_tasks'].tolist(), meta['core_states'])):
+        core.state = StateCPU(state)
+        if task_id >= 0:
+            core.current_task = tasks[task_id]
+            system.core_tasks[core.current_task] = k
+    system.core_state_counts = [dict(counts) for counts in meta['core_state_counts']]
+    system.reload_count = meta['reload_count']
+    system.controller.setState(meta['controller_state'])
+    system.rejected_tasks = taskList('rejected_tasks')
+    system.task_times.setState(meta['task_times'])
+    system.task_times.start_tacts = dict(zip(taskList('started_tasks'), arrays['start_tacts'].tolist()))
+    if system.preemption is not None:
+        system.preemption.preemptions = meta['preemption']['preemptions']
+        system.preemption.swap_tacts = meta['preemption']['swap_tacts']
+        system.preemption.slices = dict(zip(taskList('slice_tasks'), arrays['slice_tacts'].tolist()))
+        system.preemption.swapping = dict(zip(taskList('swapping_tasks'), arrays['swapping_tacts'].tolist()))
+    if system.allocator is not None:
+        system.allocator.setStats(meta['allocator_stats'])
+        system.allocator.setAllocations(list(zip(taskList('allocated_tasks'), arrays['allocations'].tolist())))
+    system.scheduler.reset()
+    if hasattr(system.scheduler, 'arrivals'):
+        system.scheduler.arrivals = dict(zip(taskList('scheduler_tasks'), arrays['scheduler_arrivals'].tolist()))
+    system.history = History.fromColumns(
+        {name: arrays['history_' + name] for name in COLUMNS}, meta['task_types'],
+        arrays['history_core_states'] if system.cores else None
+    )
+
+#запись контрольной точки
+#файл сначала пишется рядом под временным именем, чтобы прерванная запись не испортила прошлую точку
+#архив не сжимается: сжатие всей истории на каждой точке стоило дороже самого прогона
+def writeCheckpoint(filename: str, meta: dict, arrays: dict):
+    temp_filename = f"{filename}.{os.getpid()}.tmp"
+    encoded_meta = np.frombuffer(json.dumps(meta, ensure_ascii=False).encode('utf-8'), dtype=np.uint8)
+    with open(temp_filename, 'wb') as f:
+        np.savez(f, meta=encoded_meta, **arrays)
+    os.replace(temp_filename, filename)
+
+#чтение контрольной точки: описание и массивы
+def readCheckpoint(filename: str) -> tuple:
+    with np.load(filename, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = json.loads(arrays.pop('meta').tobytes().decode('utf-8'))
+    if meta.get('version') not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Неподдерживаемая версия контрольной точки: {meta.get('version')}")
+    return meta, arrays
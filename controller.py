@@ -0,0 +1,153 @@
+#управление количеством разделов памяти во время выполнения
+from dataclasses import dataclass
+from typing import ClassVar, Optional
+
+#прежнее поведение: раздел убирается, когда выполняется меньше половины разделов
+#лишние задачи при этом выгружаются обратно в очередь, даже выполняющиеся
+@dataclass
+class ShrinkController:
+    name: ClassVar[str] = 'shrink'  #название политики
+    grows: int = 0  #сколько раз разделы добавлялись
+    shrinks: int = 0  #сколько раз разделы убирались
+
+    #новое количество разделов или None, если менять не нужно; вызывается в начале каждого такта
+    def adjust(self, system) -> Optional[int]:
+        if len(system.running_tasks) < system.max_blocks_count // 2 and system.max_blocks_count > 2:
+            self.shrinks += 1
+            return max(system.max_blocks_count - 1, 2)
+        return None
+
+    #можно ли пропускать такты, в которых ничего не меняется, не вызывая adjust
+    def canSkip(self, system) -> bool:
+        return not (len(system.running_tasks) < system.max_blocks_count // 2 and system.max_blocks_count > 2)
+
+    #возврат к начальному состоянию перед новым прогоном
+    def reset(self):
+        self.grows = 0
+        self.shrinks = 0
+
+    #состояние для контрольной точки
+    def getState(self) -> dict:
+        return {'grows': self.grows, 'shrinks': self.shrinks}
+
+    #восстановление состояния из контрольной точки
+    def setState(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+#количество разделов не меняется
+@dataclass
+class FixedController(ShrinkController):
+    name: ClassVar[str] = 'fixed'
+
+    def adjust(self, system) -> Optional[int]:
+        return None
+
+    def canSkip(self, system) -> bool:
+        return True
+
+#адаптивное управление с гистерезисом
+#раздел добавляется, если все разделы заняты и очередь не пуста patience тактов подряд,
+#и убирается, если очередь пуста и занято меньше low_water разделов patience тактов подряд.
+#после каждого изменения cooldown тактов ничего не меняется.
+#разделы убираются только свободные, поэтому выполняющиеся задачи никогда не выгружаются.
+#если после добавления раздела пропускная способность (завершений за такт) не выросла,
+#текущее количество становится потолком и больше не увеличивается
+@dataclass
+class AdaptiveController(ShrinkController):
+    name: ClassVar[str] = 'adaptive'
+    min_blocks: int = 1  #наименьшее количество разделов
+    max_blocks: int = 64  #наибольшее количество разделов
+    low_water: float = 0.5  #доля занятых разделов, ниже которой разделы убираются
+    patience: int = 3  #сколько тактов подряд должно держаться условие изменения
+    cooldown: int = 5  #сколько тактов после изменения ничего не меняется
+    step: int = 1  #на сколько разделов меняется количество за раз
+    cooldown_left: int = 0  #оставшиеся такты ожидания после изменения
+    high_streak: int = 0  #сколько тактов подряд не хватает разделов
+    low_streak: int = 0  #сколько тактов подряд разделы простаивают
+    ceiling: Optional[int] = None  #количество, после которого добавление разделов не помогло
+    last_grow_throughput: Optional[float] = None  #пропускная способность до последнего добавления
+    changed_tact: int = 0  #такт последнего изменения
+    changed_ready: int = 0  #завершенных задач на момент последнего изменения
+
+    #нужно больше разделов: свободных нет, а очередь не пуста
+    def isHigh(self, system) -> bool:
+        limit = self.max_blocks if self.ceiling is None else min(self.max_blocks, self.ceiling)
+        return not system.free_blocks and system.hasWaitingTasks() and system.max_blocks_count < limit
+
+    #разделы простаивают: очередь пуста и занято меньше low_water разделов
+    def isLow(self, system) -> bool:
+        return (not system.hasWaitingTasks() and system.max_blocks_count > self.min_blocks
+                and system.used_blocks_count < system.max_blocks_count * self.low_water)
+
+    #завершений за такт с последнего изменения
+    def throughput(self, system) -> float:
+        tacts = system.current_tact - self.changed_tact
+        return (system.ready_count - self.changed_ready) / tacts if tacts else 0.0
+
+    #запомнить момент изменения
+    def changed(self, system):
+        self.cooldown_left = self.cooldown
+        self.high_streak = 0
+        self.low_streak = 0
+        self.changed_tact = system.current_tact
+        self.changed_ready = system.ready_count
+
+    def adjust(self, system) -> Optional[int]:
+        if self.cooldown_left > 0:
+            self.cooldown_left -= 1
+            return None
+        self.high_streak = self.high_streak + 1 if self.isHigh(system) else 0
+        self.low_streak = self.low_streak + 1 if self.isLow(system) else 0
+
+        if self.high_streak >= self.patience:
+            throughput = self.throughput(system)
+            if self.last_grow_throughput is not None and throughput <= self.last_grow_throughput:
+                self.ceiling = system.max_blocks_count
+                self.high_streak = 0
+                return None
+            self.last_grow_throughput = throughput
+            self.grows += 1
+            self.changed(system)
+            return min(system.max_blocks_count + self.step, self.max_blocks)
+
+        if self.low_streak >= self.patience:
+            new_count = max(system.max_blocks_count - self.step, self.min_blocks, system.used_blocks_count)
+            if new_count >= system.max_blocks_count:
+                return None
+            self.last_grow_throughput = None
+            self.shrinks += 1
+            self.changed(system)
+            return new_count
+        return None
+
+    #такты можно пропускать, только когда состояние устойчиво: ожидания нет и условия изменения не выполняются
+    def canSkip(self, system) -> bool:
+        return (self.cooldown_left == 0 and self.high_streak == 0 and self.low_streak == 0
+                and not self.isHigh(system) and not self.isLow(system))
+
+    def reset(self):
+        super().reset()
+        self.cooldown_left = 0
+        self.high_streak = 0
+        self.low_streak = 0
+        self.ceiling = None
+        self.last_grow_throughput = None
+        self.changed_tact = 0
+        self.changed_ready = 0
+
+    def getState(self) -> dict:
+        return {name: getattr(self, name) for name in (
+            'grows', 'shrinks', 'cooldown_left', 'high_streak', 'low_streak', 'ceiling',
+            'last_grow_throughput', 'changed_tact', 'changed_ready')}
+
+#политики по названию
+CONTROLLERS = {controller.name: controller for controller in (ShrinkController, FixedController, AdaptiveController)}
+
+#создание политики управления разделами по названию; готовая политика возвращается как есть
+def createController(controller='shrink', **options):
+    if isinstance(controller, ShrinkController):
+        return controller
+    if controller not in CONTROLLERS:
+        raise ValueError(f"Неизвестная политика управления разделами: {controller} (доступны: {', '.join(CONTROLLERS)})")
+    return CONTROLLERS[controller](**options)
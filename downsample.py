@@ -0,0 +1,119 @@
+#прореживание длинных рядов для графиков с сохранением минимумов и максимумов
+#
+#ряд разбивается на корзины по bucket точек (уровень 0), корзина уровня k+1 объединяет две корзины уровня k.
+#для каждой корзины хранятся номера точек с наименьшим и наибольшим значением, поэтому пики не теряются.
+#уровни досчитываются по мере поступления новых точек, а для видимого участка графика выбирается уровень,
+#на котором корзин не больше, чем пикселей по ширине графика
+import numpy as np
+
+#точек в корзине нулевого уровня
+BUCKET = 8
+
+class MinMaxLevels:
+    #конструктор
+    def __init__(self, bucket: int = BUCKET):
+        self.bucket = bucket
+        self.clear()
+
+    #удаление всех уровней
+    def clear(self):
+        self.size = 0  #сколько точек ряда учтено
+        self.counts = []  #по уровням: количество заполненных корзин
+        self.low = []  #по уровням: номера точек с наименьшим значением в корзинах
+        self.high = []  #по уровням: номера точек с наибольшим значением в корзинах
+
+    #ширина корзины уровня level в точках
+    def width(self, level: int) -> int:
+        return self.bucket << level
+
+    #запись новых корзин уровня; массивы уровня растут удвоением
+    def store(self, level: int, low: np.ndarray, high: np.ndarray):
+        if level == len(self.counts):
+            self.counts.append(0)
+            self.low.append(np.empty(0, dtype=np.int64))
+            self.high.append(np.empty(0, dtype=np.int64))
+        start = self.counts[level]
+        end = start + len(low)
+        if end > len(self.low[level]):
+            capacity = max(end, len(self.low[level]) * 2)
+            for arrays in (self.low, self.high):
+                grown = np.empty(capacity, dtype=np.int64)
+                grown[:start] = arrays[level][:start]
+                arrays[level] = grown
+        self.low[level][start:end] = low
+        self.high[level][start:end] = high
+        self.counts[level] = end
+
+    #учет новых точек: values - весь ряд, из которого первые self.size точек уже учтены
+    #досчитываются только корзины, заполненные новыми точками
+    def update(self, values: np.ndarray):
+        size = len(values)
+        if size < self.size:
+            self.clear()
+        level = 0
+        while True:
+            width = self.width(level)
+            done = self.counts[level] if level < len(self.counts) else 0
+            total = size // width
+            #если на уровне не добавилось корзин, на следующих их тоже не добавится
+            if total == done:
+                break
+            if level == 0:
+                buckets = values[done * width:total * width].reshape(-1, width)
+                first = np.arange(done, total, dtype=np.int64) * width
+                low = first + buckets.argmin(axis=1)
+                high = first + buckets.argmax(axis=1)
+            else:
+                left = self.low[level - 1][2 * done:2 * total:2]
+                right = self.low[level - 1][2 * done + 1:2 * total:2]
+                low = np.where(values[right] < values[left], right, left)
+                left = self.high[level - 1][2 * done:2 * total:2]
+                right = self.high[level - 1][2 * done + 1:2 * total:2]
+                high = np.where(values[right] > values[left], right, left)
+            self.store(level, low, high)
+            level += 1
+        self.size = size
+
+    #корзины уровня level (-1 - отдельные точки) начиная с точки position, целиком лежащие до точки end
+    #номера точек добавляются в parts; возвращает точку, на которой корзины закончились
+    def take(self, parts: list, level: int, position: int, end: int) -> int:
+        if level < 0:
+            if end > position:
+                parts.append(np.arange(position, end, dtype=np.int64))
+            return max(position, end)
+        width = self.width(level)
+        if position % width:
+            return position
+        first = position // width
+        last = min(end // width, self.counts[level])
+        if last <= first:
+            return position
+        low = self.low[level][first:last]
+        high = self.high[level][first:last]
+        parts.append(np.column_stack((np.minimum(low, high), np.maximum(low, high))).ravel())
+        return last * width
+
+    #номера точек для вывода участка [start, end) в порядке возрастания
+    #на участке не больше max_buckets корзин выбранного уровня (по две точки на корзину);
+    #края участка, не покрытые целыми корзинами этого уровня, выводятся корзинами младших уровней
+    #и отдельными точками, так что наименьшее и наибольшее значение участка сохраняются.
+    #первая и последняя точки участка выводятся всегда, чтобы кривая занимала его целиком
+    def select(self, start: int, end: int, max_buckets: int) -> np.ndarray:
+        start = max(start, 0)
+        end = min(end, self.size)
+        if end - start <= 2 * max_buckets or not self.counts:
+            return np.arange(start, max(start, end), dtype=np.int64)
+        level = 0
+        while level + 1 < len(self.counts) and end - start > max_buckets * self.width(level):
+            level += 1
+        parts = [np.array([start], dtype=np.int64)]
+        position = start
+        #начало участка: корзины все крупнее, пока начало не выровнено по корзине выбранного уровня
+        for k in range(-1, level):
+            next_width = self.width(k + 1)
+            position = self.take(parts, k, position, min(-(-position // next_width) * next_width, end))
+        #середина и конец участка: корзины все мельче
+        for k in range(level, -2, -1):
+            position = self.take(parts, k, position, end)
+        parts.append(np.array([end - 1], dtype=np.int64))
+        return np.concatenate(parts)
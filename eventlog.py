@@ -0,0 +1,66 @@
+#журнал событий симуляции
+import threading
+from enum import IntEnum
+from dataclasses import dataclass, field
+from typing import Callable, List, Tuple, Union
+
+#уровни подробности журнала
+class LogLevel(IntEnum):
+    TRACE = 10  #подробности такта: содержимое разделов, ход выполнения задач
+    INFO = 20  #события: загрузка и выгрузка задач, переключения процессора
+    SUMMARY = 30  #начало и итоги симуляции
+    OFF = 100  #журнал отключен
+
+@dataclass
+class EventLog:
+    sinks: List[Tuple[LogLevel, Callable[[str], None]]] = field(default_factory=list)  #получатели сообщений с их уровнями
+    min_level: LogLevel = LogLevel.OFF  #минимальный уровень, который хоть кому-то нужен
+
+    #подключение получателя сообщений начиная с заданного уровня
+    def addSink(self, sink: Callable[[str], None], level: LogLevel = LogLevel.TRACE):
+        self.sinks.append((level, sink))
+        self.min_level = min(self.min_level, level)
+
+    #отключение получателя сообщений
+    def removeSink(self, sink: Callable[[str], None]):
+        self.sinks = [(level, s) for level, s in self.sinks if s is not sink]
+        self.min_level = min((level for level, _ in self.sinks), default=LogLevel.OFF)
+
+    #отключение всех получателей
+    def clear(self):
+        self.sinks = []
+        self.min_level = LogLevel.OFF
+
+    #нужно ли вообще формировать сообщения этого уровня
+    def isEnabled(self, level: LogLevel) -> bool:
+        return level >= self.min_level
+
+    #запись сообщения
+    #сообщение может быть функцией, тогда строка строится только если ее кто-то получит
+    def log(self, level: LogLevel, message: Union[str, Callable[[], str]]):
+        if level < self.min_level:
+            return
+        if callable(message):
+            message = message()
+        for sink_level, sink in self.sinks:
+            if level >= sink_level:
+                sink(message)
+
+#получатель, копящий сообщения для вывода порциями
+#сообщения приходят из потока симуляции, а забираются потоком интерфейса с ограниченной частотой
+class BufferedSink:
+    #конструктор
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.messages = []  #накопленные с прошлой выдачи сообщения
+
+    #прием сообщения
+    def __call__(self, message: str):
+        with self.lock:
+            self.messages.append(message)
+
+    #выдача всех накопленных сообщений
+    def drain(self) -> list:
+        with self.lock:
+            messages, self.messages = self.messages, []
+        return messages
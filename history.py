@@ -0,0 +1,145 @@
+#история выполнения ОС в столбцовом виде
+import numpy as np
+from cpu import StateCPU
+
+#состояния процессора по их коду в истории
+CPU_STATES = list(StateCPU)
+
+#код состояния процессора для хранения в истории
+CPU_STATE_CODES = {state: code for code, state in enumerate(CPU_STATES)}
+
+#столбцы истории и их типы
+COLUMNS = {
+    'tacts': np.int64,
+    'memory_blocks_used': np.int32,
+    'cpu_states': np.int8,
+    'WAIT': np.int64,
+    'RUN': np.int32,
+    'READY': np.int64,
+    'memory_usage': np.float64
+}
+
+#наибольший объем, резервируемый заранее по max_tacts; дальше массивы растут удвоением
+MAX_RESERVE = 1 << 20
+
+class History:
+    #конструктор
+    #cores - количество ядер, для которых по тактам записываются их состояния (0 - не записывать)
+    def __init__(self, capacity: int = 1024, task_types: dict = None, cores: int = 0):
+        self.size = 0  #количество записанных тактов
+        self.capacity = 0  #объем выделенных массивов
+        self.columns = {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self.cores = cores  #количество ядер
+        self.core_states = np.empty((0, cores), dtype=np.int8)  #коды состояний ядер: строка на такт, столбец на ядро
+        self.task_types = task_types if task_types is not None else {'MATH': 0, 'INOUT': 0}
+        self.reserve(capacity)
+
+    #выделение места под capacity тактов без потери записанных данных
+    def reserve(self, capacity: int):
+        if capacity <= self.capacity:
+            return
+        for name, column in self.columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+        grown = np.empty((capacity, self.cores), dtype=np.int8)
+        grown[:self.size] = self.core_states[:self.size]
+        self.core_states = grown
+        self.capacity = capacity
+
+    #история из сохраненных столбцов
+    @classmethod
+    def fromColumns(cls, columns: dict, task_types: dict, core_states: np.ndarray = None) -> 'History':
+        size = len(columns['tacts'])
+        cores = core_states.shape[1] if core_states is not None else 0
+        history = cls(max(size, 1), task_types=task_types, cores=cores)
+        for name in COLUMNS:
+            history.columns[name][:size] = columns[name]
+        if cores:
+            history.core_states[:size] = core_states
+        history.size = size
+        return history
+
+    #запись одного такта
+    def append(self, tact: int, memory_blocks_used: int, cpu_state: StateCPU,
+               wait: int, run: int, ready: int, memory_usage: float, core_states: list = None):
+        self.appendRepeated(1, tact, memory_blocks_used, cpu_state, wait, run, ready, memory_usage, core_states)
+
+    #запись count подряд идущих тактов с одинаковыми показателями начиная с такта first_tact
+    #core_states - состояния ядер, если история ведется по ядрам
+    def appendRepeated(self, count: int, first_tact: int, memory_blocks_used: int, cpu_state: StateCPU,
+                       wait: int, run: int, ready: int, memory_usage: float, core_states: list = None):
+        start = self.size
+        end = start + count
+        if end > self.capacity:
+            self.reserve(max(end, self.capacity * 2))
+        columns = self.columns
+        if count == 1:
+            columns['tacts'][start] = first_tact
+        else:
+            columns['tacts'][start:end] = np.arange(first_tact, first_tact + count)
+        columns['memory_blocks_used'][start:end] = memory_blocks_used
+        columns['cpu_states'][start:end] = CPU_STATE_CODES[cpu_state]
+        columns['WAIT'][start:end] = wait
+        columns['RUN'][start:end] = run
+        columns['READY'][start:end] = ready
+        columns['memory_usage'][start:end] = memory_usage
+        if self.cores:
+            self.core_states[start:end] = [CPU_STATE_CODES[state] for state in core_states]
+        self.size = end
+
+    #количество записанных тактов
+    def __len__(self) -> int:
+        return self.size
+
+    #столбец истории без копирования данных
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name][:self.size]
+
+    #доступ в формате прежнего словаря истории, данные отдаются без копирования
+    def __getitem__(self, key: str):
+        if key == 'task_states':
+            return {state: self.column(state) for state in ('WAIT', 'RUN', 'READY')}
+        if key == 'task_types':
+            return self.task_types
+        return self.column(key)
+
+    #состояния ядер по тактам без копирования данных: строка на такт, столбец на ядро
+    def coreStates(self) -> np.ndarray:
+        return self.core_states[:self.size]
+
+    #словарь столбцов без копирования данных, состояния процессора в виде кодов
+    def views(self) -> dict:
+        views = {
+            'tacts': self.column('tacts'),
+            'memory_blocks_used': self.column('memory_blocks_used'),
+            'cpu_states': self.column('cpu_states'),
+            'task_states': self['task_states'],
+            'memory_usage': self.column('memory_usage'),
+            'task_types': dict(self.task_types)
+        }
+        if self.cores:
+            views['core_states'] = self.coreStates()
+        return views
+
+    #названия состояний процессора по тактам
+    def cpuStateNames(self) -> list:
+        return [CPU_STATES[code].value for code in self.column('cpu_states').tolist()]
+
+    #названия состояний каждого ядра по тактам: список на ядро
+    def coreStateNames(self) -> list:
+        return [[CPU_STATES[code].value for code in codes] for codes in self.coreStates().T.tolist()]
+
+    #копия истории в виде словаря списков (для вывода в json)
+    def asDict(self) -> dict:
+        result = {
+            'tacts': self.column('tacts').tolist(),
+            'memory_blocks_used': self.column('memory_blocks_used').tolist(),
+            'cpu_states': self.cpuStateNames(),
+            'task_states': {state: values.tolist() for state, values in self['task_states'].items()},
+            'memory_usage': self.column('memory_usage').tolist(),
+            'task_types': dict(self.task_types)
+        }
+        if self.cores:
+            result['core_states'] = self.coreStateNames()
+        return result
@@ -0,0 +1,155 @@
+#хранилище журнала симуляции на диске
+#
+#строки журнала дописываются во временный файл, в памяти держится только разреженный индекс:
+#смещение каждой block_lines-й строки и номер строки начала каждого такта.
+#сами строки в памяти не хранятся (кроме нескольких прочитанных блоков), индекс занимает
+#O(строк / block_lines + тактов): около 16 байт на такт и 8 байт на каждые block_lines строк.
+#любая строка читается одним обращением к файлу
+import bisect
+import re
+import tempfile
+from array import array
+from collections import OrderedDict
+
+#строк в одном блоке индекса
+BLOCK_LINES = 64
+
+#сколько прочитанных блоков держится в памяти
+CACHED_BLOCKS = 32
+
+#размер порции файла при поиске
+SEARCH_CHUNK = 1 << 22
+
+#заголовок такта в журнале ОС
+TACT_HEADER = re.compile(r'Такт-(\d+)$')
+
+class LogStore:
+    #конструктор
+    #directory - каталог для временного файла (по умолчанию системный)
+    def __init__(self, directory: str = None, block_lines: int = BLOCK_LINES):
+        self.directory = directory
+        self.block_lines = block_lines
+        self.file = None
+        self.clear()
+
+    #удаление всех строк
+    def clear(self):
+        if self.file is not None:
+            self.file.close()
+        self.file = tempfile.TemporaryFile(dir=self.directory)
+        self.count = 0  #количество строк
+        self.size = 0  #размер файла в байтах
+        self.block_offsets = array('q')  #смещение первой строки каждого блока
+        self.tacts = array('q')  #номера тактов по порядку их заголовков
+        self.tact_rows = array('q')  #строка заголовка каждого такта
+        self.cache = OrderedDict()  #прочитанные блоки: номер блока -> строки
+
+    #закрытие временного файла
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    #количество строк
+    def __len__(self) -> int:
+        return self.count
+
+    #разбиение сообщений на строки; пустые строки, отделяющие такты, отбрасываются
+    @staticmethod
+    def splitMessages(messages: list) -> list:
+        return [line for message in messages for line in message.split('\n') if line]
+
+    #добавление строк в конец журнала
+    def appendLines(self, lines: list):
+        if not lines:
+            return
+        #последний блок мог быть прочитан неполным, после добавления его нужно перечитать
+        self.cache.pop(len(self.block_offsets) - 1, None)
+        chunks = []
+        for line in lines:
+            if self.count % self.block_lines == 0:
+                self.block_offsets.append(self.size)
+            match = TACT_HEADER.match(line)
+            if match:
+                self.tacts.append(int(match.group(1)))
+                self.tact_rows.append(self.count)
+            data = line.encode('utf-8') + b'\n'
+            chunks.append(data)
+            self.size += len(data)
+            self.count += 1
+        self.file.seek(0, 2)
+        self.file.write(b''.join(chunks))
+
+    #добавление сообщений журнала
+    def append(self, messages: list):
+        self.appendLines(self.splitMessages(messages))
+
+    #строки блока с кэшированием последних прочитанных блоков
+    def readBlock(self, block: int) -> list:
+        lines = self.cache.get(block)
+        if lines is not None:
+            self.cache.move_to_end(block)
+            return lines
+        start = self.block_offsets[block]
+        end = self.block_offsets[block + 1] if block + 1 < len(self.block_offsets) else self.size
+        self.file.seek(start)
+        lines = self.file.read(end - start).decode('utf-8').split('\n')[:-1]
+        self.cache[block] = lines
+        if len(self.cache) > CACHED_BLOCKS:
+            self.cache.popitem(last=False)
+        return lines
+
+    #строка по номеру
+    def line(self, row: int) -> str:
+        if not 0 <= row < self.count:
+            raise IndexError(row)
+        block, i = divmod(row, self.block_lines)
+        return self.readBlock(block)[i]
+
+    #строка заголовка первого такта с номером не меньше tact (-1, если такого нет)
+    def tactRow(self, tact: int) -> int:
+        i = bisect.bisect_left(self.tacts, tact)
+        return self.tact_rows[i] if i < len(self.tacts) else -1
+
+    #номер строки, в которой находится байт с заданным смещением
+    def rowAt(self, offset: int) -> int:
+        block = bisect.bisect_right(self.block_offsets, offset) - 1
+        start = self.block_offsets[block]
+        self.file.seek(start)
+        return block * self.block_lines + self.file.read(offset - start).count(b'\n')
+
+    #смещение первого байта строки
+    def rowOffset(self, row: int) -> int:
+        if row >= self.count:
+            return self.size
+        block, i = divmod(row, self.block_lines)
+        lines = self.readBlock(block)
+        return self.block_offsets[block] + sum(len(line.encode('utf-8')) + 1 for line in lines[:i])
+
+    #первое вхождение needle в файле между смещениями start и end (-1, если нет)
+    def searchBytes(self, needle: bytes, start: int, end: int) -> int:
+        overlap = len(needle) - 1
+        position = start
+        while position < end:
+            self.file.seek(position)
+            chunk = self.file.read(min(SEARCH_CHUNK + overlap, end - position))
+            found = chunk.find(needle)
+            if found >= 0:
+                return position + found
+            if position + len(chunk) >= end:
+                break
+            position += SEARCH_CHUNK
+        return -1
+
+    #первая строка, начиная со строки start, в которой встречается text; поиск продолжается с начала журнала
+    #возвращает -1, если текст не найден
+    def find(self, text: str, start: int = 0) -> int:
+        needle = text.encode('utf-8')
+        if not needle or b'\n' in needle or not self.count:
+            return -1
+        start = min(max(start, 0), self.count)
+        start_offset = self.rowOffset(start)
+        found = self.searchBytes(needle, start_offset, self.size)
+        if found < 0:
+            found = self.searchBytes(needle, 0, min(start_offset + len(needle) - 1, self.size))
+        return self.rowAt(found) if found >= 0 else -1
@@ -0,0 +1,126 @@
+#просмотр журнала симуляции: отображаются только видимые строки хранилища на диске
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtWidgets import (QWidget, QTableView, QLineEdit, QPushButton, QSpinBox, QLabel,
+                             QVBoxLayout, QHBoxLayout, QAbstractItemView, QHeaderView)
+from logstore import LogStore
+
+#модель строк журнала (один столбец): строки читаются из хранилища только по запросу представления
+class LogModel(QAbstractListModel):
+    #конструктор
+    def __init__(self, store: LogStore, parent=None):
+        super().__init__(parent)
+        self.store = store
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.store)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.store.line(index.row())
+        return None
+
+    #добавление сообщений журнала
+    def appendMessages(self, messages: list):
+        lines = self.store.splitMessages(messages)
+        if not lines:
+            return
+        first = len(self.store)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self.store.appendLines(lines)
+        self.endInsertRows()
+
+    #удаление всех строк
+    def clear(self):
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+
+#панель журнала: список строк, поиск текста и переход к такту
+class LogView(QWidget):
+    #конструктор
+    def __init__(self, parent=None, store: LogStore = None):
+        super().__init__(parent)
+        self.store = store if store is not None else LogStore()
+        self.model = LogModel(self.store, self)
+
+        #таблица с одним столбцом и строками одной высоты: при вставке строк
+        #представление не пересчитывает размеры всех строк, как это делает QListView
+        self.view = QTableView(self)
+        self.view.setModel(self.model)
+        self.view.setShowGrid(False)
+        self.view.setWordWrap(False)
+        self.view.horizontalHeader().hide()
+        self.view.horizontalHeader().setStretchLastSection(True)
+        self.view.verticalHeader().hide()
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(self.view.fontMetrics().height() + 2)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+
+        self.searchedit = QLineEdit(self)
+        self.searchedit.setPlaceholderText("Поиск в журнале")
+        self.searchedit.returnPressed.connect(self.findNext)
+        self.searchbutton = QPushButton("Найти", self)
+        self.searchbutton.clicked.connect(self.findNext)
+
+        self.tactlabel = QLabel("Такт:", self)
+        self.tactvalue = QSpinBox(self)
+        self.tactvalue.setMinimum(1)
+        self.tactvalue.setMaximum(10**9)
+        self.tactbutton = QPushButton("Перейти", self)
+        self.tactbutton.clicked.connect(self.jumpToTact)
+
+        controls = QHBoxLayout()
+        controls.setContentsMargins(0, 0, 0, 0)
+        controls.addWidget(self.searchedit, 1)
+        controls.addWidget(self.searchbutton)
+        controls.addWidget(self.tactlabel)
+        controls.addWidget(self.tactvalue)
+        controls.addWidget(self.tactbutton)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+        layout.addWidget(self.view, 1)
+        layout.addLayout(controls)
+
+    #количество строк журнала
+    def lineCount(self) -> int:
+        return len(self.store)
+
+    #добавление сообщений; если список был прокручен до конца, он остается в конце
+    def appendMessages(self, messages: list):
+        scrollbar = self.view.verticalScrollBar()
+        at_end = scrollbar.value() >= scrollbar.maximum()
+        self.model.appendMessages(messages)
+        if at_end:
+            self.view.scrollToBottom()
+
+    #добавление одного сообщения
+    def appendPlainText(self, text: str):
+        self.appendMessages([text])
+
+    #удаление всех строк
+    def clear(self):
+        self.model.clear()
+
+    #выделение строки и прокрутка к ней
+    def showRow(self, row: int):
+        index = self.model.index(row)
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtTop)
+
+    #поиск текста со строки, следующей за выделенной
+    def findNext(self):
+        current = self.view.currentIndex()
+        start = current.row() + 1 if current.isValid() else 0
+        row = self.store.find(self.searchedit.text(), start)
+        if row >= 0:
+            self.showRow(row)
+
+    #переход к заголовку такта
+    def jumpToTact(self):
+        row = self.store.tactRow(self.tactvalue.value())
+        if row >= 0:
+            self.showRow(row)
@@ -1,376 +1,781 @@
-#операционная система
-
-from packet import Packet, Task, TypeTask, StateTask
-from cpu import CPU, StateCPU
-from dataclasses import dataclass, field
-from typing import List, Optional, Callable
-
-@dataclass
-class OS:
-    """Класс операционной системы для управления задачами и ресурсами"""
-    ram: int  #объем оперативной памяти в ГБ
-    max_blocks_count: int  #максимальное количество разделов памяти
-    packet: Optional[Packet] = None  #пакет задач для выполнения
-    memory_blocks: List[Optional[Task]] = field(default_factory=list)  #разделы памяти с задачами
-    wait_queue: List[Task] = field(default_factory=list)  #очередь ожидающих задач
-    ready_queue: List[Task] = field(default_factory=list)  #очередь завершенных задач
-    running_tasks: List[Task] = field(default_factory=list)  #список выполняющихся задач
-    io_wait_tasks: List[Task] = field(default_factory=list)  #список задач, ожидающих ввод/вывод
-    cpu: CPU = field(default_factory=CPU)  #процессор системы
-    current_tact: int = 0  #текущий такт выполнения
-    output_callback: Optional[Callable[[str], None]] = None  #функция для вывода информации
-    
-    #история выполнения для статистики
-    history: dict = field(default_factory=lambda: {
-        'tacts': [],
-        'memory_blocks_used': [],
-        'cpu_states': [],
-        'task_states': {'WAIT': [], 'RUN': [], 'READY': []},
-        'memory_usage': [],
-        'task_types': {'MATH': 0, 'INOUT': 0}
-    })
-    
-    #счетчики состояний процессора
-    cpu_state_counts: dict = field(default_factory=lambda: {
-        "ПРОСТОЙ": 0,
-        "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": 0,
-        "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": 0,
-        "ПЕРЕГРУЗКА": 0
-    })
-    
-    #инициализация системы
-    def initialize(self, json_file: str):
-        self.packet = Packet(json_file)
-        self.wait_queue = self.packet.tasks.copy()
-        self.memory_blocks = [None] * self.max_blocks_count
-        self.current_tact = 0
-        self.cpu.state = StateCPU.IDLE
-        
-        self.history = {
-            'tacts': [],
-            'memory_blocks_used': [],
-            'cpu_states': [],
-            'task_states': {'WAIT': [], 'RUN': [], 'READY': []},
-            'memory_usage': [],
-            'task_types': {
-                'MATH': self.packet.getMathTasks(),
-                'INOUT': self.packet.getInOutTasks()
-            }
-        }
-        
-        self.cpu_state_counts = {
-            "ПРОСТОЙ": 0,
-            "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": 0,
-            "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": 0,
-            "ПЕРЕГРУЗКА": 0
-        }
-    
-    #изменение количества разделов памяти
-    def changeMemoryBlocksCount(self, new_count: int):
-        if new_count <= 0:
-            raise ValueError("Количество разделов памяти должно быть положительным")
-        
-        old_count = self.max_blocks_count
-        self.max_blocks_count = new_count
-        
-        current_tasks = [task for task in self.memory_blocks if task is not None]
-        
-        new_memory_blocks = [None] * new_count
-        
-        tasks_to_keep = min(len(current_tasks), new_count)
-        for i in range(tasks_to_keep):
-            new_memory_blocks[i] = current_tasks[i]
-            
-        for i in range(tasks_to_keep, len(current_tasks)):
-            task = current_tasks[i]
-            if task in self.running_tasks:
-                self.running_tasks.remove(task)
-            if task in self.io_wait_tasks:
-                self.io_wait_tasks.remove(task)
-            self.wait_queue.insert(0, task)  
-        
-        self.memory_blocks = new_memory_blocks
-        
-        self.updateCpuStateAfterMemoryChange()
-        
-        if self.output_callback:
-            self.output(f"Изменено количество разделов памяти: {old_count} -> {new_count}")
-            if len(current_tasks) > new_count:
-                self.output(f"Возвращено в очередь: {len(current_tasks) - new_count} задач")
-    
-    #обновление состояния процессора после изменения настроек памяти
-    def updateCpuStateAfterMemoryChange(self):
-        used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-        
-        if used_blocks > self.max_blocks_count:
-            self.changeCpuState(StateCPU.OVERLOADED, "(перегрузка после изменения памяти)")
-        elif self.cpu.state == StateCPU.OVERLOADED and used_blocks <= self.max_blocks_count:            
-            self.changeToNormalState()
-    
-    #проверка и автоматическая настройка количества разделов памяти
-    def checkAndAdjustMemoryBlocks(self):
-        current_load = len(self.running_tasks)        
-        if current_load < self.max_blocks_count // 2 and self.max_blocks_count > 2:
-            new_count = max(self.max_blocks_count - 1, 2)
-            self.changeMemoryBlocksCount(new_count)
-            return True
-                
-        return False
-    
-    #установка функции обратного вызова для вывода информации
-    def setOutputCallback(self, callback: Callable[[str], None]):
-        self.output_callback = callback
-    
-    #вывод сообщения через установленный флаг
-    def output(self, message: str):
-        if self.output_callback:
-            self.output_callback(message)
-    
-    #изменение состояние процессора с выводом информации о переходе из одного состояния в другое
-    def changeCpuState(self, new_state: StateCPU, reason: str = ""):
-        old_state = self.cpu.state
-        if old_state != new_state:
-            self.cpu.state = new_state
-            self.output(f"ПЕРЕКЛЮЧЕНИЕ CPU: {old_state.value} -> {new_state.value} {reason}")
-            
-            current_used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-            math_count = len([task for task in self.running_tasks if task.type == TypeTask.MATH and task.state == StateTask.RUN])
-            io_count = len([task for task in self.running_tasks if task.type == TypeTask.INOUT and task.state == StateTask.RUN])
-            self.output(f"Отладочная информация: Используется разделов={current_used_blocks}/{self.max_blocks_count}, MATH={math_count}, INOUT={io_count}")
-
-    #сбор статистики за такт
-    def collectStatistics(self):
-        used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-        self.history['memory_blocks_used'].append(used_blocks)
-        
-        current_state = self.cpu.state.value
-        self.history['cpu_states'].append(current_state)
-        
-        wait_count = len(self.wait_queue)
-        run_count = len([task for task in self.running_tasks if task.state == StateTask.RUN])
-        ready_count = len(self.ready_queue)
-        
-        self.history['task_states']['WAIT'].append(wait_count)
-        self.history['task_states']['RUN'].append(run_count)
-        self.history['task_states']['READY'].append(ready_count)
-        
-        used_memory_percent = (used_blocks / self.max_blocks_count) * 100
-        free_memory_percent = max(0, 100 - used_memory_percent)
-        self.history['memory_usage'].append(free_memory_percent)
-        
-        self.history['tacts'].append(self.current_tact)
-    
-    #возвращение счетчика состояний процессора для графика
-    def getCpuStateCounts(self):
-        return self.cpu_state_counts.copy()
-    
-    #управление переключением состояний процессора на основе текущей ситуации
-    def manageCpuStates(self):
-        self.checkOverload()
-        
-        if self.cpu.state != StateCPU.OVERLOADED:
-            if self.cpu.state == StateCPU.IDLE:
-                self.handleIdleState()
-            elif self.cpu.state == StateCPU.EXECUTING:
-                self.handleExecutingState()
-            elif self.cpu.state == StateCPU.IO_WAIT:
-                self.handleIoWaitState()
-                
-        current_state = self.cpu.state.value
-        if current_state in self.cpu_state_counts:
-            self.cpu_state_counts[current_state] += 1
-
-    #проверка перегрузки системы
-    def checkOverload(self):
-        current_used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-    
-        if current_used_blocks > self.max_blocks_count:
-            if self.cpu.state != StateCPU.OVERLOADED:
-                self.changeCpuState(StateCPU.OVERLOADED, 
-                                f"(перегрузка памяти: {current_used_blocks} > {self.max_blocks_count} разделов)")
-        else:
-            if self.cpu.state == StateCPU.OVERLOADED:
-                self.changeToNormalState()
-
-    #возвращение процессора в нормальное состояние
-    def changeToNormalState(self):
-        math_tasks = [task for task in self.running_tasks if task.type == TypeTask.MATH and task.state == StateTask.RUN]
-        io_tasks = [task for task in self.running_tasks if task.type == TypeTask.INOUT and task.state == StateTask.RUN]
-        
-        if math_tasks:
-            self.changeCpuState(StateCPU.EXECUTING, "(система восстановилась, есть MATH задачи)")
-        elif io_tasks:
-            self.changeCpuState(StateCPU.IO_WAIT, "(система восстановилась, есть INOUT задачи)")
-        else:
-            self.changeCpuState(StateCPU.IDLE, "(система восстановилась, нет активных задач)")
-
-    #обработка состояния простоя
-    def handleIdleState(self):
-        self.checkOverload()
-        if self.cpu.state == StateCPU.OVERLOADED:
-            return
-        
-        math_tasks = [task for task in self.running_tasks if task.type == TypeTask.MATH and task.state == StateTask.RUN]
-        io_tasks = [task for task in self.running_tasks if task.type == TypeTask.INOUT and task.state == StateTask.RUN]
-        
-        if math_tasks:
-            self.changeCpuState(StateCPU.EXECUTING, f"(найдены {len(math_tasks)} активных MATH задач)")
-        elif io_tasks:
-            self.changeCpuState(StateCPU.IO_WAIT, f"(найдены {len(io_tasks)} активных INOUT задач)")
-
-    #обработка состояния выполнения вычислений
-    def handleExecutingState(self):
-        self.checkOverload()
-        if self.cpu.state == StateCPU.OVERLOADED:
-            return
-        
-        math_tasks = [task for task in self.running_tasks if task.type == TypeTask.MATH and task.state == StateTask.RUN]
-        io_tasks = [task for task in self.running_tasks if task.type == TypeTask.INOUT and task.state == StateTask.RUN]
-        
-        if not math_tasks and io_tasks:
-            self.changeCpuState(StateCPU.IO_WAIT, "(MATH задачи завершены, есть активные INOUT)")
-        elif not math_tasks and not io_tasks:
-            self.changeCpuState(StateCPU.IDLE, "(все активные задачи завершены)")
-
-    #обработка состояния выполнения ввода/вывода
-    def handleIoWaitState(self):
-        self.checkOverload()
-        if self.cpu.state == StateCPU.OVERLOADED:
-            return
-        
-        io_tasks = [task for task in self.running_tasks if task.type == TypeTask.INOUT and task.state == StateTask.RUN]
-        math_tasks = [task for task in self.running_tasks if task.type == TypeTask.MATH and task.state == StateTask.RUN]
-        
-        if not io_tasks and math_tasks:
-            self.changeCpuState(StateCPU.EXECUTING, "(INOUT задачи завершены, есть активные MATH)")
-        elif not io_tasks and not math_tasks:
-            self.changeCpuState(StateCPU.IDLE, "(все активные задачи завершены)")
-    
-    #выполнение одного такта
-    def runTact(self):
-        self.current_tact += 1
-        self.output(f"\nТакт-{self.current_tact}")
-        
-        self.output(f"Начальное состояние процессора: {self.cpu.state.value}")
-        
-        used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-        self.output(f"Используется разделов: {used_blocks}/{self.max_blocks_count}")
-        
-        memory_adjusted = self.checkAndAdjustMemoryBlocks()
-        if memory_adjusted:
-            used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-            self.output(f"После настройки: {used_blocks}/{self.max_blocks_count} разделов")
-        
-        for i, task in enumerate(self.memory_blocks):
-            if task is not None:
-                task_type = task.type.value
-                self.output(f"Раздел {i+1}: Задача {task_type} {task.memory}MB {task.state.value}")
-                    
-        memory_freed = self.freeCompletedTasks()
-        
-        memory_loaded = self.loadTasksToMemory()
-        
-        if memory_freed or memory_loaded:
-            used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-            self.output(f"Разделов памяти после загрузки/выгрузки: {used_blocks}/{self.max_blocks_count}")
-                
-        self.executeTasks()        
-        self.manageCpuStates()        
-        self.collectStatistics()        
-        self.output(f"Финальное состояние процессора: {self.cpu.state.value}")
-    
-    #освобождение разделов памяти
-    def freeCompletedTasks(self) -> bool:
-        freed = False
-        for i, task in enumerate(self.memory_blocks):
-            if task and task.state == StateTask.READY:
-                self.output(f"Задача {task.num} завершена, освобождается раздел {i+1}")
-                self.memory_blocks[i] = None
-                if task in self.running_tasks:
-                    self.running_tasks.remove(task)
-                if task in self.io_wait_tasks:
-                    self.io_wait_tasks.remove(task)
-                self.ready_queue.append(task)
-                freed = True
-        return freed
-    
-    #загрузка задачи в раздел
-    def loadTasksToMemory(self) -> bool:
-        loaded = False
-    
-        for i in range(len(self.memory_blocks)):
-            if self.memory_blocks[i] is None and self.wait_queue:
-                task = self.wait_queue.pop(0)
-                self.memory_blocks[i] = task
-                self.output(f"Задача {task.num} ({task.type.value}) загружена в раздел {i+1}")
-                loaded = True
-                
-                current_used_blocks = sum(1 for block in self.memory_blocks if block is not None)
-                if current_used_blocks > self.max_blocks_count:
-                    self.output(f"ПРЕДУПРЕЖДЕНИЕ: Превышено максимальное количество разделов! ({current_used_blocks} > {self.max_blocks_count})")                   
-        return loaded
-    
-    #выполнение задачи в разделе памяти
-    def executeTasks(self):
-        for i, task in enumerate(self.memory_blocks):
-            if task and task.state == StateTask.WAIT:
-                self.cpu.useToDoTask(task)
-                self.output(f"Начато выполнение задачи {task.num} ({task.type.value}) в разделе {i+1}")
-                
-                if task.type == TypeTask.INOUT:
-                    self.io_wait_tasks.append(task)
-                
-                self.running_tasks.append(task)
-            
-            elif task and task.state == StateTask.RUN:
-                completed = task.execute()
-                self.output(f"Задача {task.num} ({task.type.value}) выполняется: {task.execution_time}/{task.required_time} тактов")
-                
-                if completed:
-                    self.output(f"Задача {task.num} ({task.type.value}) завершена!")
-                    if task in self.io_wait_tasks:
-                        self.io_wait_tasks.remove(task)
-    
-    #сброс состояния ОС к начальному (для перезапуска программы)
-    def reset(self):
-        if self.packet:
-            self.wait_queue = self.packet.tasks.copy()
-        else:
-            self.wait_queue = []
-        
-        self.ready_queue = []
-        self.running_tasks = []
-        self.io_wait_tasks = []
-        
-        self.memory_blocks = [None] * self.max_blocks_count
-        
-        self.cpu.state = StateCPU.IDLE
-        self.cpu.current_task = None
-        
-        self.current_tact = 0
-        
-        self.history = {
-            'tacts': [],
-            'memory_blocks_used': [],
-            'cpu_states': [],
-            'task_states': {'WAIT': [], 'RUN': [], 'READY': []},
-            'memory_usage': [],
-            'task_types': {
-                'MATH': self.packet.getMathTasks() if self.packet else 0,
-                'INOUT': self.packet.getInOutTasks() if self.packet else 0
-            }
-        }
-        
-        self.cpu_state_counts = {
-            "ПРОСТОЙ": 0,
-            "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": 0,
-            "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": 0,
-            "ПЕРЕГРУЗКА": 0
-        }
-        
-        if self.packet:
-            for task in self.packet.tasks:
-                task.state = StateTask.WAIT
-                task.execution_time = 0
-        
+#операционная система
+
+from packet import Packet, Task, TypeTask, StateTask
+from cpu import CPU, StateCPU
+from eventlog import EventLog, LogLevel
+from history import History
+from packetstream import PacketStream, isJsonLines
+from packetcache import loadPacket
+from scheduler import Scheduler
+from allocator import Allocator
+from controller import ShrinkController
+from preemption import RoundRobin, TaskTimes
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Deque, Dict, Iterator, List, Optional, Callable, Set, Union
+
+#снимок начального состояния ОС: по нему система возвращается к началу прогона
+#без повторной загрузки пакета
+@dataclass
+class OSSnapshot:
+    max_blocks_count: int  #количество разделов памяти
+    task_states: object = None  #сохраненные состояния задач пакета
+
+@dataclass
+class OS:
+    """Класс операционной системы для управления задачами и ресурсами"""
+    ram: int  #объем оперативной памяти в ГБ
+    max_blocks_count: int  #максимальное количество разделов памяти
+    packet: Optional[Union[Packet, PacketStream]] = None  #пакет задач для выполнения
+    memory_blocks: List[Optional[Task]] = field(default_factory=list)  #разделы памяти с задачами
+    wait_queue: Deque[Task] = field(default_factory=deque)  #очередь ожидающих задач, уже взятых из пакета
+    preempted_queue: Deque[Task] = field(default_factory=deque)  #вытесненные задачи, загружаются после всех ожидающих задач пакета
+    task_source: Optional[Iterator[Task]] = None  #задачи пакета, еще не взятые в очередь
+    pending_count: int = 0  #количество задач, еще не взятых из пакета
+    scheduler: Scheduler = field(default_factory=Scheduler)  #политика выбора задачи для загрузки (по умолчанию FIFO)
+    controller: ShrinkController = field(default_factory=ShrinkController)  #политика изменения количества разделов
+    reload_count: int = 0  #сколько задач выгружено обратно в очередь при уменьшении количества разделов
+    preemption: Optional[RoundRobin] = None  #вытеснение задач по кванту времени (None - задача выполняется до завершения)
+    task_times: TaskTimes = field(default_factory=TaskTimes)  #время оборота и отклика завершенных задач
+    allocator: Optional[Allocator] = None  #распределитель памяти RAM (None - объем памяти задач не учитывается)
+    rejected_tasks: List[Task] = field(default_factory=list)  #задачи, не помещающиеся в память даже пустой
+    ready_queue: List[Task] = field(default_factory=list)  #очередь завершенных задач
+    ready_count: int = 0  #количество завершенных задач
+    keep_ready_tasks: bool = True  #хранить ли завершенные задачи в ready_queue
+    running_tasks: Set[Task] = field(default_factory=set)  #множество выполняющихся задач
+    io_wait_tasks: Set[Task] = field(default_factory=set)  #множество задач, ожидающих ввод/вывод
+    cpu: CPU = field(default_factory=CPU)  #процессор системы (при нескольких ядрах - общее состояние процессора)
+    cpu_count: Optional[int] = None  #количество ядер; None - все задачи в памяти выполняются одновременно, без ядер
+    cores: List[CPU] = field(default_factory=list)  #ядра процессора, MATH задача выполняется, только занимая ядро
+    core_tasks: Dict[Task, int] = field(default_factory=dict)  #номер ядра по выполняемой на нем MATH задаче
+    core_state_counts: List[dict] = field(default_factory=list)  #счетчики состояний каждого ядра
+    current_tact: int = 0  #текущий такт выполнения
+    used_blocks_count: int = 0  #количество занятых разделов памяти
+    running_math_count: int = 0  #количество выполняющихся MATH задач
+    running_io_count: int = 0  #количество выполняющихся INOUT задач
+    free_blocks: List[int] = field(default_factory=list)  #куча номеров свободных разделов
+    completed_blocks: List[int] = field(default_factory=list)  #разделы с задачами, завершенными с прошлой выгрузки
+    output_callback: Optional[Callable[[str], None]] = None  #функция для вывода информации
+    log: EventLog = field(default_factory=EventLog)  #журнал событий
+    initial_snapshot: Optional[OSSnapshot] = None  #состояние сразу после загрузки пакета
+    
+    #история выполнения для статистики
+    history: History = field(default_factory=History)
+    
+    #счетчики состояний процессора
+    cpu_state_counts: dict = field(default_factory=lambda: {
+        "ПРОСТОЙ": 0,
+        "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": 0,
+        "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": 0,
+        "ПЕРЕГРУЗКА": 0
+    })
+    
+    #инициализация системы
+    #при потоковом чтении (и для файлов JSON Lines) задачи читаются из файла по мере освобождения разделов,
+    #а завершенные задачи только подсчитываются, так что память не зависит от размера пакета
+    def initialize(self, json_file: str, streaming: bool = False):
+        streaming = streaming or isJsonLines(json_file)
+        self.packet = loadPacket(json_file, streaming)
+        self.keep_ready_tasks = not streaming
+        self.ready_queue = []
+        self.openTaskSource()
+        self.memory_blocks = [None] * self.max_blocks_count
+        self.current_tact = 0
+        self.resetCounters()
+        self.rebuildBlockIndex()
+        self.cpu.state = StateCPU.IDLE
+        self.resetCores()
+        self.scheduler.reset()
+        self.controller.reset()
+        self.resetPreemption()
+        self.resetMemory()
+        
+        self.history = History(task_types={
+            'MATH': self.packet.getMathTasks(),
+            'INOUT': self.packet.getInOutTasks()
+        }, cores=len(self.cores))
+        
+        self.cpu_state_counts = {
+            "ПРОСТОЙ": 0,
+            "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": 0,
+            "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": 0,
+            "ПЕРЕГРУЗКА": 0
+        }
+        
+        self.initial_snapshot = self.snapshot()
+    
+    #изменение количества разделов памяти
+    def changeMemoryBlocksCount(self, new_count: int):
+        if new_count <= 0:
+            raise ValueError("Количество разделов памяти должно быть положительным")
+        
+        old_count = self.max_blocks_count
+        self.max_blocks_count = new_count
+        
+        current_tasks = [task for task in self.memory_blocks if task is not None]
+        
+        new_memory_blocks = [None] * new_count
+        
+        tasks_to_keep = min(len(current_tasks), new_count)
+        for i in range(tasks_to_keep):
+            new_memory_blocks[i] = current_tasks[i]
+            
+        for i in range(tasks_to_keep, len(current_tasks)):
+            task = current_tasks[i]
+            self.releaseCore(task)
+            self.releaseMemory(task)
+            if task in self.running_tasks:
+                self.running_tasks.discard(task)
+                if task.state == StateTask.RUN:
+                    self.changeRunningCount(task, -1)
+            self.io_wait_tasks.discard(task)
+            self.wait_queue.appendleft(task)
+            self.reload_count += 1
+        
+        self.memory_blocks = new_memory_blocks
+        self.used_blocks_count = tasks_to_keep
+        self.rebuildBlockIndex()
+        
+        self.updateCpuStateAfterMemoryChange()
+        
+        if self.log.isEnabled(LogLevel.INFO):
+            self.output(f"Изменено количество разделов памяти: {old_count} -> {new_count}")
+            if len(current_tasks) > new_count:
+                self.output(f"Возвращено в очередь: {len(current_tasks) - new_count} задач")
+    
+    #обновление состояния процессора после изменения настроек памяти
+    def updateCpuStateAfterMemoryChange(self):
+        used_blocks = self.used_blocks_count
+        
+        if used_blocks > self.max_blocks_count:
+            self.changeCpuState(StateCPU.OVERLOADED, "(перегрузка после изменения памяти)")
+        elif self.cpu.state == StateCPU.OVERLOADED and used_blocks <= self.max_blocks_count:            
+            self.changeToNormalState()
+    
+    #сброс счетчиков занятых разделов, выполняющихся и завершенных задач
+    def resetCounters(self):
+        self.used_blocks_count = 0
+        self.running_math_count = 0
+        self.running_io_count = 0
+        self.ready_count = 0
+        self.reload_count = 0
+    
+    #создание ядер в начальном состоянии
+    def resetCores(self):
+        if self.cpu_count is not None and self.cpu_count <= 0:
+            raise ValueError("Количество ядер должно быть положительным")
+        count = self.cpu_count or 0
+        self.cores = [CPU() for _ in range(count)]
+        self.core_tasks = {}
+        self.core_state_counts = [{state.value: 0 for state in StateCPU} for _ in range(count)]
+    
+    #освобождение ядра, занятого задачей
+    def releaseCore(self, task: Task):
+        core = self.core_tasks.pop(task, None)
+        if core is not None:
+            self.cores[core].current_task = None
+    
+    #сброс учета квантов и времени выполнения задач
+    def resetPreemption(self):
+        self.task_times.reset()
+        if self.preemption is not None:
+            self.preemption.reset()
+    
+    #освобождение всей памяти RAM
+    def resetMemory(self):
+        self.rejected_tasks = []
+        if self.allocator is not None:
+            self.allocator.reset()
+    
+    #освобождение памяти RAM, выделенной задаче
+    def releaseMemory(self, task: Task):
+        if self.allocator is not None:
+            self.allocator.release(task)
+    
+    #начало чтения задач пакета с первой
+    def openTaskSource(self):
+        self.wait_queue = deque()
+        self.preempted_queue = deque()
+        if self.packet:
+            self.task_source = self.packet.iterTasks()
+            self.pending_count = self.packet.getTasksCount()
+        else:
+            self.task_source = None
+            self.pending_count = 0
+    
+    #есть ли задачи, ожидающие загрузки
+    def hasWaitingTasks(self) -> bool:
+        return bool(self.wait_queue) or self.pending_count > 0 or bool(self.preempted_queue)
+    
+    #количество задач, ожидающих загрузки
+    def getWaitingCount(self) -> int:
+        return len(self.wait_queue) + self.pending_count + len(self.preempted_queue)
+    
+    #следующая задача для загрузки: сначала возвращенные в очередь, затем очередные из пакета, затем вытесненные
+    #при политике, отличной от FIFO, задача выбирается планировщиком из первых задач очереди;
+    #с моделью памяти выбор идет только среди задач, которым память найдется сейчас (или которые будут отклонены),
+    #остальные остаются на своих местах в очереди. None - сейчас нельзя загрузить ни одну задачу окна
+    #FIFO выбирает первую задачу всегда: если ей не хватает памяти, очередь ждет ее освобождения
+    def takeWaitingTask(self) -> Optional[Task]:
+        window = self.scheduler.window
+        if window <= 1:
+            if self.wait_queue:
+                return self.wait_queue.popleft()
+            if self.pending_count > 0:
+                self.pending_count -= 1
+                return next(self.task_source)
+            return self.preempted_queue.popleft()
+        
+        while len(self.wait_queue) < window and self.pending_count > 0:
+            self.pending_count -= 1
+            self.wait_queue.append(next(self.task_source))
+        while len(self.wait_queue) < window and self.preempted_queue:
+            self.wait_queue.append(self.preempted_queue.popleft())
+        candidates = list(itertools.islice(self.wait_queue, window))
+        positions = range(len(candidates))  #места кандидатов в очереди
+        allocator = self.allocator
+        if allocator is not None:
+            self.scheduler.seen(self, candidates)
+            positions = [i for i in positions
+                         if allocator.canFitNow(candidates[i]) or not allocator.canEverFit(candidates[i])]
+            if not positions:
+                return None
+            candidates = [candidates[i] for i in positions]
+        i = self.scheduler.select(self, candidates)
+        del self.wait_queue[positions[i]]
+        return candidates[i]
+    
+    #пересборка индексов свободных и завершенных разделов полным просмотром памяти
+    #нужна только при перестройке memory_blocks, в обычном такте индексы обновляются точечно
+    def rebuildBlockIndex(self):
+        self.free_blocks = [i for i, task in enumerate(self.memory_blocks) if task is None]
+        self.completed_blocks = [i for i, task in enumerate(self.memory_blocks)
+                                 if task is not None and task.state == StateTask.READY]
+    
+    #учет начала (delta=1) или завершения (delta=-1) выполнения задачи
+    def changeRunningCount(self, task: Task, delta: int):
+        if task.type == TypeTask.MATH:
+            self.running_math_count += delta
+        else:
+            self.running_io_count += delta
+    
+    #проверка и автоматическая настройка количества разделов памяти
+    def checkAndAdjustMemoryBlocks(self):
+        new_count = self.controller.adjust(self)
+        if new_count is None or new_count == self.max_blocks_count:
+            return False
+        self.changeMemoryBlocksCount(new_count)
+        return True
+    
+    #установка функции обратного вызова для вывода информации
+    #сообщения уровнем ниже level не формируются вовсе
+    def setOutputCallback(self, callback: Callable[[str], None], level: LogLevel = LogLevel.TRACE):
+        if self.output_callback:
+            self.log.removeSink(self.output_callback)
+        self.output_callback = callback
+        if callback:
+            self.log.addSink(callback, level)
+    
+    #вывод сообщения в журнал
+    def output(self, message: str, level: LogLevel = LogLevel.INFO):
+        self.log.log(level, message)
+    
+    #изменение состояние процессора с выводом информации о переходе из одного состояния в другое
+    def changeCpuState(self, new_state: StateCPU, reason: str = ""):
+        old_state = self.cpu.state
+        if old_state != new_state:
+            self.cpu.state = new_state
+            if not self.log.isEnabled(LogLevel.INFO):
+                return
+            self.output(f"ПЕРЕКЛЮЧЕНИЕ CPU: {old_state.value} -> {new_state.value} {reason}")
+            if not self.log.isEnabled(LogLevel.TRACE):
+                return
+            
+            self.output(f"Отладочная информация: Используется разделов={self.used_blocks_count}/{self.max_blocks_count}, MATH={self.running_math_count}, INOUT={self.running_io_count}", LogLevel.TRACE)
+
+    #сбор статистики за такт
+    #count одинаковых тактов подряд записываются одним блоком
+    def collectStatistics(self, count: int = 1):
+        used_blocks = self.used_blocks_count
+        
+        wait_count = self.getWaitingCount()
+        run_count = self.running_math_count + self.running_io_count
+        ready_count = self.ready_count
+        
+        if self.allocator is not None:
+            free_memory_percent = self.allocator.freeMemory() / self.allocator.capacity * 100
+            self.allocator.sample(count)
+        else:
+            used_memory_percent = (used_blocks / self.max_blocks_count) * 100
+            free_memory_percent = max(0, 100 - used_memory_percent)
+        
+        self.history.appendRepeated(count, self.current_tact - count + 1, used_blocks, self.cpu.state,
+                                    wait_count, run_count, ready_count, free_memory_percent,
+                                    [core.state for core in self.cores])
+    
+    #возвращение счетчика состояний процессора для графика
+    #при нескольких ядрах считаются такты каждого ядра, так что сумма равна числу тактов, умноженному на число ядер
+    def getCpuStateCounts(self):
+        return self.cpu_state_counts.copy()
+    
+    #счетчики состояний каждого ядра
+    def getCoreStateCounts(self) -> list:
+        return [counts.copy() for counts in self.core_state_counts]
+    
+    #состояния ядер по итогам такта и их учет в счетчиках (count одинаковых тактов подряд)
+    #ядро без MATH задачи ждет ввод/вывод, если есть выполняющиеся INOUT задачи, иначе простаивает
+    def countCoreStates(self, count: int = 1):
+        overloaded = self.cpu.state == StateCPU.OVERLOADED
+        for core, counts in zip(self.cores, self.core_state_counts):
+            if overloaded:
+                core.state = StateCPU.OVERLOADED
+            elif core.current_task is not None:
+                core.state = StateCPU.EXECUTING
+            elif self.running_io_count:
+                core.state = StateCPU.IO_WAIT
+            else:
+                core.state = StateCPU.IDLE
+            counts[core.state.value] += count
+            self.cpu_state_counts[core.state.value] += count
+    
+    #управление переключением состояний процессора на основе текущей ситуации
+    def manageCpuStates(self):
+        self.checkOverload()
+        
+        if self.cpu.state != StateCPU.OVERLOADED:
+            if self.cpu.state == StateCPU.IDLE:
+                self.handleIdleState()
+            elif self.cpu.state == StateCPU.EXECUTING:
+                self.handleExecutingState()
+            elif self.cpu.state == StateCPU.IO_WAIT:
+                self.handleIoWaitState()
+                
+        if self.cores:
+            self.countCoreStates()
+            return
+        current_state = self.cpu.state.value
+        if current_state in self.cpu_state_counts:
+            self.cpu_state_counts[current_state] += 1
+
+    #проверка перегрузки системы
+    def checkOverload(self):
+        current_used_blocks = self.used_blocks_count
+    
+        if current_used_blocks > self.max_blocks_count:
+            if self.cpu.state != StateCPU.OVERLOADED:
+                self.changeCpuState(StateCPU.OVERLOADED, 
+                                f"(перегрузка памяти: {current_used_blocks} > {self.max_blocks_count} разделов)")
+        else:
+            if self.cpu.state == StateCPU.OVERLOADED:
+                self.changeToNormalState()
+
+    #возвращение процессора в нормальное состояние
+    def changeToNormalState(self):
+        if self.running_math_count:
+            self.changeCpuState(StateCPU.EXECUTING, "(система восстановилась, есть MATH задачи)")
+        elif self.running_io_count:
+            self.changeCpuState(StateCPU.IO_WAIT, "(система восстановилась, есть INOUT задачи)")
+        else:
+            self.changeCpuState(StateCPU.IDLE, "(система восстановилась, нет активных задач)")
+
+    #обработка состояния простоя
+    def handleIdleState(self):
+        self.checkOverload()
+        if self.cpu.state == StateCPU.OVERLOADED:
+            return
+        
+        math_count = self.running_math_count
+        io_count = self.running_io_count
+        
+        if math_count:
+            self.changeCpuState(StateCPU.EXECUTING, f"(найдены {math_count} активных MATH задач)")
+        elif io_count:
+            self.changeCpuState(StateCPU.IO_WAIT, f"(найдены {io_count} активных INOUT задач)")
+
+    #обработка состояния выполнения вычислений
+    def handleExecutingState(self):
+        self.checkOverload()
+        if self.cpu.state == StateCPU.OVERLOADED:
+            return
+        
+        math_count = self.running_math_count
+        io_count = self.running_io_count
+        
+        if not math_count and io_count:
+            self.changeCpuState(StateCPU.IO_WAIT, "(MATH задачи завершены, есть активные INOUT)")
+        elif not math_count and not io_count:
+            self.changeCpuState(StateCPU.IDLE, "(все активные задачи завершены)")
+
+    #обработка состояния выполнения ввода/вывода
+    def handleIoWaitState(self):
+        self.checkOverload()
+        if self.cpu.state == StateCPU.OVERLOADED:
+            return
+        
+        io_count = self.running_io_count
+        math_count = self.running_math_count
+        
+        if not io_count and math_count:
+            self.changeCpuState(StateCPU.EXECUTING, "(INOUT задачи завершены, есть активные MATH)")
+        elif not io_count and not math_count:
+            self.changeCpuState(StateCPU.IDLE, "(все активные задачи завершены)")
+    
+    #выполнение одного такта
+    def runTact(self):
+        self.current_tact += 1
+        trace = self.log.isEnabled(LogLevel.TRACE)
+        if self.log.isEnabled(LogLevel.INFO):
+            self.output(f"\nТакт-{self.current_tact}")
+        
+        if trace:
+            self.output(f"Начальное состояние процессора: {self.cpu.state.value}", LogLevel.TRACE)
+            self.output(f"Используется разделов: {self.used_blocks_count}/{self.max_blocks_count}", LogLevel.TRACE)
+        
+        memory_adjusted = self.checkAndAdjustMemoryBlocks()
+        if memory_adjusted and trace:
+            self.output(f"После настройки: {self.used_blocks_count}/{self.max_blocks_count} разделов", LogLevel.TRACE)
+        
+        if trace:
+            for i, task in enumerate(self.memory_blocks):
+                if task is not None:
+                    task_type = task.type.value
+                    self.output(f"Раздел {i+1}: Задача {task_type} {task.memory}MB {task.state.value}", LogLevel.TRACE)
+                    
+        memory_freed = self.freeCompletedTasks()
+        if self.preemption is not None and self.preemptTasks():
+            memory_freed = True
+        
+        memory_loaded = self.loadTasksToMemory()
+        
+        if (memory_freed or memory_loaded) and trace:
+            self.output(f"Разделов памяти после загрузки/выгрузки: {self.used_blocks_count}/{self.max_blocks_count}", LogLevel.TRACE)
+                
+        self.executeTasks()        
+        self.manageCpuStates()        
+        self.collectStatistics()        
+        if trace:
+            self.output(f"Финальное состояние процессора: {self.cpu.state.value}", LogLevel.TRACE)
+    
+    #количество следующих тактов, в которых не произойдет ничего, кроме роста счетчиков выполнения:
+    #нечего выгружать и загружать, разделы не перенастраиваются и ни одна задача не завершится
+    #при включенном журнале такты не пропускаются, чтобы не потерять их вывод
+    def quietTactsAhead(self) -> int:
+        if self.log.isEnabled(LogLevel.INFO):
+            return 0
+        if self.completed_blocks or (self.free_blocks and self.hasWaitingTasks()):
+            return 0
+        if not self.controller.canSkip(self):
+            return 0
+        
+        preemption = self.preemption if self.preemption is not None and self.hasWaitingTasks() else None
+        quiet = None
+        for task in self.memory_blocks:
+            if task is None:
+                continue
+            if task.state != StateTask.RUN:
+                return 0
+            if self.cores and task.type == TypeTask.MATH and task not in self.core_tasks:
+                return 0
+            left = task.required_time - task.execution_time - 1
+            if preemption is not None:
+                left = min(left, preemption.quietTacts(task))
+            if quiet is None or left < quiet:
+                quiet = left
+        return quiet or 0
+    
+    #пропуск не более limit тихих тактов с заполнением истории, как при их обычном выполнении
+    #возвращает количество пропущенных тактов
+    def skipQuietTacts(self, limit: int) -> int:
+        count = min(self.quietTactsAhead(), limit)
+        if count <= 0:
+            return 0
+        
+        for task in self.memory_blocks:
+            if task is not None:
+                task.execution_time += count
+                if self.preemption is not None:
+                    self.preemption.advance(task, count)
+        
+        if self.cores:
+            self.countCoreStates(count)
+        else:
+            self.cpu_state_counts[self.cpu.state.value] += count
+        self.current_tact += count
+        self.collectStatistics(count)
+        return count
+    
+    #освобождение разделов памяти
+    def freeCompletedTasks(self) -> bool:
+        if not self.completed_blocks:
+            return False
+        info = self.log.isEnabled(LogLevel.INFO)
+        self.completed_blocks.sort()
+        for i in self.completed_blocks:
+            task = self.memory_blocks[i]
+            if info:
+                self.output(f"Задача {task.num} завершена, освобождается раздел {i+1}")
+            self.memory_blocks[i] = None
+            heapq.heappush(self.free_blocks, i)
+            self.used_blocks_count -= 1
+            self.running_tasks.discard(task)
+            self.io_wait_tasks.discard(task)
+            self.releaseMemory(task)
+            self.ready_count += 1
+            if self.keep_ready_tasks:
+                self.ready_queue.append(task)
+        self.completed_blocks = []
+        return True
+    
+    #вытеснение задач, исчерпавших квант, в конец очереди
+    #вытесняется не больше задач, чем их ждет в очереди, в порядке разделов
+    def preemptTasks(self) -> bool:
+        waiting = self.getWaitingCount()
+        if not waiting:
+            return False
+        preempted = False
+        for i, task in enumerate(self.memory_blocks):
+            if not waiting:
+                break
+            if task is None or task.state != StateTask.RUN or not self.preemption.expired(task):
+                continue
+            self.swapOut(i, task)
+            waiting -= 1
+            preempted = True
+        return preempted
+    
+    #выгрузка выполняющейся задачи из раздела в очередь вытесненных с сохранением времени выполнения
+    def swapOut(self, i: int, task: Task):
+        self.memory_blocks[i] = None
+        heapq.heappush(self.free_blocks, i)
+        self.used_blocks_count -= 1
+        if task in self.running_tasks:
+            self.running_tasks.discard(task)
+            self.changeRunningCount(task, -1)
+        self.io_wait_tasks.discard(task)
+        self.releaseCore(task)
+        self.releaseMemory(task)
+        task.changeState(StateTask.WAIT)
+        self.preemption.preempted(task)
+        self.preempted_queue.append(task)
+        if self.log.isEnabled(LogLevel.INFO):
+            self.output(f"Задача {task.num} ({task.type.value}) вытеснена из раздела {i+1}: выполнено {task.execution_time}/{task.required_time} тактов")
+    
+    #загрузка задачи в раздел
+    #при учете RAM задача, для которой сейчас нет памяти, остается первой в очереди до освобождения памяти,
+    #а задача, не помещающаяся даже в пустую память, отклоняется
+    def loadTasksToMemory(self) -> bool:
+        loaded = False
+        info = self.log.isEnabled(LogLevel.INFO)
+    
+        while self.free_blocks and self.hasWaitingTasks():
+            task = self.takeWaitingTask()
+            if task is None:
+                break
+            if self.allocator is not None:
+                if not self.allocator.canEverFit(task):
+                    self.scheduler.taken(task)
+                    self.rejected_tasks.append(task)
+                    if self.log.isEnabled(LogLevel.INFO):
+                        self.output(f"Задача {task.num} ({task.type.value}, {task.memory} МБ) отклонена: не помещается в память")
+                    continue
+                #не выделить память можно только первой задаче FIFO: она возвращается в голову очереди
+                if not self.allocator.allocate(task):
+                    self.wait_queue.appendleft(task)
+                    break
+            #планировщик забывает задачу, только когда она действительно загружена
+            self.scheduler.taken(task)
+            i = heapq.heappop(self.free_blocks)
+            self.memory_blocks[i] = task
+            self.used_blocks_count += 1
+            loaded = True
+            #задача, вытесненная уже завершенной, выгружается на следующем такте
+            if task.state == StateTask.READY:
+                self.completed_blocks.append(i)
+            if not info:
+                continue
+            self.output(f"Задача {task.num} ({task.type.value}) загружена в раздел {i+1}")
+            
+            if self.used_blocks_count > self.max_blocks_count:
+                self.output(f"ПРЕДУПРЕЖДЕНИЕ: Превышено максимальное количество разделов! ({self.used_blocks_count} > {self.max_blocks_count})")                   
+        return loaded
+    
+    #выполнение задачи в разделе памяти
+    def executeTasks(self):
+        if self.cores:
+            self.executeTasksOnCores()
+            return
+        info = self.log.isEnabled(LogLevel.INFO)
+        trace = self.log.isEnabled(LogLevel.TRACE)
+        preemption = self.preemption
+        for i, task in enumerate(self.memory_blocks):
+            if task and task.state == StateTask.WAIT:
+                if preemption is not None and self.swapIn(i, task):
+                    continue
+                self.cpu.useToDoTask(task)
+                self.task_times.started(task, self.current_tact)
+                if info:
+                    self.output(f"Начато выполнение задачи {task.num} ({task.type.value}) в разделе {i+1}")
+                
+                if task.type == TypeTask.INOUT:
+                    self.io_wait_tasks.add(task)
+                
+                self.running_tasks.add(task)
+                self.changeRunningCount(task, 1)
+            
+            elif task and task.state == StateTask.RUN:
+                completed = task.execute()
+                if trace:
+                    self.output(f"Задача {task.num} ({task.type.value}) выполняется: {task.execution_time}/{task.required_time} тактов", LogLevel.TRACE)
+                
+                if completed:
+                    self.completed_blocks.append(i)
+                    self.taskCompleted(task)
+                    if info:
+                        self.output(f"Задача {task.num} ({task.type.value}) завершена!")
+                    if task in self.running_tasks:
+                        self.changeRunningCount(task, -1)
+                    self.io_wait_tasks.discard(task)
+                elif preemption is not None:
+                    preemption.advance(task)
+    
+    #такт подгрузки вытесненной задачи в раздел; False, если задача готова выполняться
+    def swapIn(self, i: int, task: Task) -> bool:
+        if not self.preemption.swapIn(task):
+            return False
+        if self.log.isEnabled(LogLevel.TRACE):
+            self.output(f"Задача {task.num} ({task.type.value}) подгружается в раздел {i+1}", LogLevel.TRACE)
+        return True
+    
+    #учет завершения задачи в статистике времени выполнения и квантов
+    def taskCompleted(self, task: Task):
+        self.task_times.finished(task, self.current_tact)
+        if self.preemption is not None:
+            self.preemption.finished(task)
+    
+    #выполнение задач при заданном количестве ядер
+    #INOUT задачи ждут устройство и ядер не занимают, MATH задача продвигается, только пока занимает ядро
+    def executeTasksOnCores(self):
+        info = self.log.isEnabled(LogLevel.INFO)
+        trace = self.log.isEnabled(LogLevel.TRACE)
+        preemption = self.preemption
+        for i, task in enumerate(self.memory_blocks):
+            if task is None or task.state == StateTask.READY:
+                continue
+            if preemption is not None and task.state == StateTask.WAIT and self.swapIn(i, task):
+                continue
+            if task.type == TypeTask.INOUT and task.state == StateTask.WAIT:
+                task.changeState(StateTask.RUN)
+                self.task_times.started(task, self.current_tact)
+                if info:
+                    self.output(f"Начато выполнение задачи {task.num} ({task.type.value}) в разделе {i+1}")
+                self.io_wait_tasks.add(task)
+                self.running_tasks.add(task)
+                self.changeRunningCount(task, 1)
+            
+            elif task.state == StateTask.RUN and (task.type == TypeTask.INOUT or task in self.core_tasks):
+                completed = task.execute()
+                if trace:
+                    self.output(f"Задача {task.num} ({task.type.value}) выполняется: {task.execution_time}/{task.required_time} тактов", LogLevel.TRACE)
+                
+                if completed:
+                    self.completed_blocks.append(i)
+                    self.taskCompleted(task)
+                    if info:
+                        self.output(f"Задача {task.num} ({task.type.value}) завершена!")
+                    if task in self.running_tasks:
+                        self.changeRunningCount(task, -1)
+                    self.io_wait_tasks.discard(task)
+                    self.releaseCore(task)
+                elif preemption is not None:
+                    preemption.advance(task)
+        
+        self.assignCores()
+    
+    #назначение свободных ядер MATH задачам, ожидающим ядро, в порядке разделов
+    #задача начинает выполняться на такте назначения и продвигается со следующего
+    def assignCores(self):
+        free_cores = [k for k, core in enumerate(self.cores) if core.current_task is None]
+        if not free_cores:
+            return
+        info = self.log.isEnabled(LogLevel.INFO)
+        for i, task in enumerate(self.memory_blocks):
+            if (task is None or task.type != TypeTask.MATH or task.state == StateTask.READY
+                    or task in self.core_tasks):
+                continue
+            if self.preemption is not None and task in self.preemption.swapping:
+                continue
+            k = free_cores.pop(0)
+            self.cores[k].useToDoTask(task)
+            self.core_tasks[task] = k
+            self.task_times.started(task, self.current_tact)
+            if task not in self.running_tasks:
+                self.running_tasks.add(task)
+                self.changeRunningCount(task, 1)
+            if info:
+                self.output(f"Начато выполнение задачи {task.num} ({task.type.value}) в разделе {i+1} на ядре {k+1}")
+            if not free_cores:
+                return
+    
+    #снимок текущего состояния задач пакета и количества разделов
+    #предназначен для состояния до начала прогона, очереди и разделы в снимок не входят
+    def snapshot(self) -> OSSnapshot:
+        return OSSnapshot(
+            max_blocks_count=self.max_blocks_count,
+            task_states=self.packet.saveStates() if self.packet else None
+        )
+    
+    #сброс состояния ОС к начальному (для перезапуска программы)
+    #если задано max_blocks_count, следующий прогон пойдет с новым количеством разделов
+    def reset(self, max_blocks_count: int = None):
+        if max_blocks_count is None:
+            max_blocks_count = self.max_blocks_count
+        if self.initial_snapshot is None:
+            self.restore(OSSnapshot(max_blocks_count=max_blocks_count))
+        else:
+            self.restore(replace(self.initial_snapshot, max_blocks_count=max_blocks_count))
+    
+    #восстановление состояния из снимка
+    #без сохраненных состояний задачи пакета возвращаются в состояние ожидания
+    def restore(self, snapshot: OSSnapshot):
+        if snapshot.max_blocks_count <= 0:
+            raise ValueError("Количество разделов памяти должно быть положительным")
+        self.max_blocks_count = snapshot.max_blocks_count
+        if self.packet and snapshot.task_states is not None:
+            self.packet.restoreStates(snapshot.task_states)
+        elif self.packet:
+            self.packet.resetTasks()
+        self.openTaskSource()
+        
+        self.ready_queue = []
+        self.running_tasks = set()
+        self.io_wait_tasks = set()
+        
+        self.memory_blocks = [None] * self.max_blocks_count
+        self.resetCounters()
+        self.rebuildBlockIndex()
+        
+        self.cpu.state = StateCPU.IDLE
+        self.cpu.current_task = None
+        self.resetCores()
+        self.scheduler.reset()
+        self.controller.reset()
+        self.resetPreemption()
+        self.resetMemory()
+        
+        self.current_tact = 0
+        
+        self.history = History(self.history.capacity, task_types={
+            'MATH': self.packet.getMathTasks() if self.packet else 0,
+            'INOUT': self.packet.getInOutTasks() if self.packet else 0
+        }, cores=len(self.cores))
+        
+        self.cpu_state_counts = {
+            "ПРОСТОЙ": 0,
+            "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": 0,
+            "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": 0,
+            "ПЕРЕГРУЗКА": 0
+        }
+        
         self.output("Система сброшена в начальное состояние")
\ No newline at end of file
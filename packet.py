@@ -1,112 +1,225 @@
-#пакет
-from task import Task, TypeTask, StateTask
-from enum import Enum
-from dataclasses import dataclass, field
-import json
-
-#тип пакета
-class TypePacket(Enum):
-    MATH_PACK = "ВЫЧИСЛИТЕЛЬНЫЙ"
-    INOUT_PACK = "ВВОД/ВЫВОД"
-    BALANCED_PACK = "СБАЛАНСИРОВАННЫЙ"
-
-@dataclass
-class Packet:
-    tasks: list = field(default_factory=list)  #список задач в пакете
-    type: TypePacket = None  #тип пакета
-
-    #инициализация пустого пакета или пакета из файла
-    def __init__(self, filename: str = None):
-        if filename:
-            tasks_list = self.createByJson(filename)
-            self.tasks = tasks_list if len(tasks_list) > 0 else []
-            if self.tasks:
-                self.type = self.checkPacketType()
-            else:
-                self.type = None
-        else:
-            self.tasks = []
-            self.type = None
-
-    #автоматическое опредение типа пакета   
-    def checkPacketType(self):
-        inout = 0
-        math = 0
-        for task in self.tasks:  
-            if task.type == TypeTask.MATH:
-                math += 1
-            else:
-                inout += 1
-        if math == inout:
-            return TypePacket.BALANCED_PACK
-        elif math > inout:
-            return TypePacket.MATH_PACK
-        else:
-            return TypePacket.INOUT_PACK
-    
-    #получить общее количество задач
-    def getTasksCount(self):
-        return len(self.tasks)
-    
-    #получить общую память пакета
-    def getTasksMemory(self):
-        memory = 0
-        for task in self.tasks:
-            memory += task.memory
-        return memory
-    
-    #получить количество задача в состоянии ожидания выполнения
-    def getWaitTasks(self):
-        count = 0
-        for task in self.tasks:
-            if task.state == StateTask.WAIT:
-                count += 1
-        return count
-    
-    #получить количество задача в состоянии выполнения
-    def getRunTasks(self):
-        count = 0
-        for task in self.tasks:
-            if task.state == StateTask.RUN:
-                count += 1
-        return count
-    
-    #получить количество выполненых задач   
-    def getReadyTasks(self):
-        count = 0
-        for task in self.tasks:
-            if task.state == StateTask.READY:
-                count += 1
-        return count
-    
-    #получить количество математических задач
-    def getMathTasks(self):
-        count = 0
-        for task in self.tasks:
-            if task.type == TypeTask.MATH:
-                count += 1
-        return count    
-    
-    #получить количество задач ввода-вывода
-    def getInOutTasks(self):
-        count = 0
-        for task in self.tasks:
-            if task.type == TypeTask.INOUT:
-                count += 1
-        return count
-
-    #создать пакет из json-файла
-    @classmethod
-    def createByJson(cls, filename: str):
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)        
-    
-        tasks_list = []
-        for task_data in data['tasks']:
-            task = Task(
-                num=task_data['num'],
-                type=TypeTask[task_data['type']],
-                memory=task_data['memory']
-            )
-            tasks_list.append(task)
-        return tasks_list
\ No newline at end of file
+#пакет
+from task import Task, TypeTask, StateTask
+from enum import Enum
+from dataclasses import dataclass, field
+from typing import Optional
+import itertools
+import json
+import numpy as np
+
+#тип пакета
+class TypePacket(Enum):
+    MATH_PACK = "ВЫЧИСЛИТЕЛЬНЫЙ"
+    INOUT_PACK = "ВВОД/ВЫВОД"
+    BALANCED_PACK = "СБАЛАНСИРОВАННЫЙ"
+
+#определение типа пакета по количеству задач каждого типа
+def packetTypeByCounts(math: int, inout: int) -> TypePacket:
+    if math == inout:
+        return TypePacket.BALANCED_PACK
+    elif math > inout:
+        return TypePacket.MATH_PACK
+    else:
+        return TypePacket.INOUT_PACK
+
+#типы и состояния задач по их коду в таблице
+TASK_TYPES = list(TypeTask)
+TASK_STATES = list(StateTask)
+
+#коды типов и состояний задач для хранения в таблице
+TYPE_CODES = {task_type: code for code, task_type in enumerate(TASK_TYPES)}
+STATE_CODES = {state: code for code, state in enumerate(TASK_STATES)}
+
+#сколько задач создается из таблицы за один раз
+TASKS_CHUNK = 1 << 14
+
+#сводные показатели пакета
+@dataclass
+class PacketSummary:
+    count: int = 0  #количество задач
+    math: int = 0  #количество MATH задач
+    inout: int = 0  #количество INOUT задач
+    memory: int = 0  #суммарная память задач
+
+#таблица задач пакета: по массиву на каждое поле задачи
+@dataclass(eq=False)
+class TaskTable:
+    nums: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))  #номера задач
+    types: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int8))  #коды типов задач
+    memory: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))  #объем памяти задач
+    states: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int8))  #коды состояний задач
+    execution_time: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))  #время выполнения на момент смены состояния
+
+    #создание таблицы из записей вида {"num": ..., "type": ..., "memory": ...}
+    @classmethod
+    def fromRecords(cls, records: list) -> 'TaskTable':
+        count = len(records)
+        return cls(
+            nums=np.fromiter((record['num'] for record in records), dtype=np.int64, count=count),
+            types=np.fromiter((TYPE_CODES[TypeTask[record['type']]] for record in records), dtype=np.int8, count=count),
+            memory=np.fromiter((record['memory'] for record in records), dtype=np.int32, count=count),
+            states=np.full(count, STATE_CODES[StateTask.WAIT], dtype=np.int8),
+            execution_time=np.zeros(count, dtype=np.int32)
+        )
+
+    #количество задач
+    def __len__(self) -> int:
+        return len(self.nums)
+
+    #количество задач заданного типа
+    def countType(self, task_type: TypeTask) -> int:
+        return int(np.count_nonzero(self.types == TYPE_CODES[task_type]))
+
+    #количество задач в заданном состоянии
+    def countState(self, state: StateTask) -> int:
+        return int(np.count_nonzero(self.states == STATE_CODES[state]))
+
+    #суммарный объем памяти задач
+    def totalMemory(self) -> int:
+        return int(self.memory.sum(dtype=np.int64))
+
+    #сводные показатели таблицы: количество задач каждого типа и суммарная память
+    def summarize(self) -> PacketSummary:
+        type_counts = np.bincount(self.types, minlength=len(TASK_TYPES))
+        return PacketSummary(
+            count=len(self),
+            math=int(type_counts[TYPE_CODES[TypeTask.MATH]]),
+            inout=int(type_counts[TYPE_CODES[TypeTask.INOUT]]),
+            memory=self.totalMemory()
+        )
+
+    #таблица с общими неизменяемыми столбцами и собственными состояниями задач
+    def shareColumns(self) -> 'TaskTable':
+        return TaskTable(
+            nums=self.nums,
+            types=self.types,
+            memory=self.memory,
+            states=np.full(len(self), STATE_CODES[StateTask.WAIT], dtype=np.int8),
+            execution_time=np.zeros(len(self), dtype=np.int32)
+        )
+
+    #отражение смены состояния задачи
+    def setState(self, index: int, state: StateTask, execution_time: int):
+        self.states[index] = STATE_CODES[state]
+        self.execution_time[index] = execution_time
+
+    #возврат всех задач в начальное состояние
+    def resetStates(self):
+        self.states[:] = STATE_CODES[StateTask.WAIT]
+        self.execution_time[:] = 0
+
+    #поочередное создание объектов задач, связанных с таблицей, начиная со строки first
+    #столбцы переводятся в списки порциями, чтобы не дублировать в памяти весь пакет
+    def iterTasks(self, first: int = 0):
+        for start in range(first, len(self), TASKS_CHUNK):
+            end = start + TASKS_CHUNK
+            rows = zip(self.nums[start:end].tolist(), self.types[start:end].tolist(), self.memory[start:end].tolist())
+            for index, (num, type_code, memory) in enumerate(rows, start):
+                yield Task(num=num, type=TASK_TYPES[type_code], memory=memory, index=index, table=self)
+
+    #создание объектов задач, связанных с таблицей
+    def createTasks(self) -> list:
+        return list(self.iterTasks())
+
+@dataclass
+class Packet:
+    table: TaskTable = field(default_factory=TaskTable)  #таблица задач пакета
+    type: TypePacket = None  #тип пакета
+    summary: PacketSummary = field(default_factory=PacketSummary)  #сводные показатели, считаются один раз при загрузке
+    _tasks: Optional[list] = None  #объекты задач, создаются при первом обращении
+
+    #инициализация пустого пакета или пакета из файла
+    def __init__(self, filename: str = None):
+        self._tasks = None
+        if filename:
+            self.table = self.loadTable(filename)
+            self.summary = self.table.summarize()
+            self.type = self.checkPacketType() if len(self.table) > 0 else None
+        else:
+            self.table = TaskTable()
+            self.summary = PacketSummary()
+            self.type = None
+
+    #копия пакета для нового прогона: столбцы таблицы общие, состояния задач свои
+    def copy(self) -> 'Packet':
+        packet = Packet()
+        packet.table = self.table.shareColumns()
+        packet.summary = self.summary
+        packet.type = self.type
+        return packet
+
+    #список задач пакета
+    #объекты задач создаются только когда они действительно нужны (для выполнения)
+    @property
+    def tasks(self) -> list:
+        if self._tasks is None:
+            self._tasks = self.table.createTasks()
+        return self._tasks
+
+    #задачи пакета по очереди, начиная с задачи номер first по порядку в пакете
+    #если список задач еще не создан, объекты создаются по мере обращения к ним
+    def iterTasks(self, first: int = 0):
+        if self._tasks is not None:
+            return itertools.islice(self._tasks, first, None)
+        return self.table.iterTasks(first)
+
+    #автоматическое опредение типа пакета
+    def checkPacketType(self):
+        return packetTypeByCounts(self.getMathTasks(), self.getInOutTasks())
+
+    #получить общее количество задач
+    def getTasksCount(self):
+        return self.summary.count
+
+    #получить общую память пакета
+    def getTasksMemory(self):
+        return self.summary.memory
+
+    #получить количество задача в состоянии ожидания выполнения
+    def getWaitTasks(self):
+        return self.table.countState(StateTask.WAIT)
+
+    #получить количество задача в состоянии выполнения
+    def getRunTasks(self):
+        return self.table.countState(StateTask.RUN)
+
+    #получить количество выполненых задач
+    def getReadyTasks(self):
+        return self.table.countState(StateTask.READY)
+
+    #получить количество математических задач
+    def getMathTasks(self):
+        return self.summary.math
+
+    #получить количество задач ввода-вывода
+    def getInOutTasks(self):
+        return self.summary.inout
+
+    #возврат всех задач пакета в начальное состояние
+    #объекты задач не перебираются, а отбрасываются и создаются заново по мере обращения к ним
+    def resetTasks(self):
+        self.table.resetStates()
+        self._tasks = None
+
+    #копия состояний задач для последующего восстановления
+    def saveStates(self) -> tuple:
+        return self.table.states.copy(), self.table.execution_time.copy()
+
+    #восстановление сохраненных состояний задач одним копированием массивов
+    def restoreStates(self, saved: tuple):
+        states, execution_time = saved
+        np.copyto(self.table.states, states)
+        np.copyto(self.table.execution_time, execution_time)
+        self._tasks = None
+
+    #прочитать таблицу задач из json-файла
+    @classmethod
+    def loadTable(cls, filename: str) -> TaskTable:
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return TaskTable.fromRecords(data['tasks'])
+
+    #создать пакет из json-файла
+    @classmethod
+    def createByJson(cls, filename: str):
+        return cls.loadTable(filename).createTasks()
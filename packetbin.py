@@ -0,0 +1,167 @@
+#двоичный формат пакета с чтением через отображение файла в память
+#
+#заголовок: сигнатура, версия, тип пакета и готовые сводные показатели,
+#за ним записи фиксированной длины (номер, код типа, память)
+import argparse
+import os
+import struct
+from contextlib import contextmanager
+import numpy as np
+from task import TypeTask, StateTask
+from packet import Packet, PacketSummary, TaskTable, TypePacket, TYPE_CODES, STATE_CODES, packetTypeByCounts
+from packetstream import PacketStream, iterPacketRecords, isJsonLines
+
+#расширение файлов двоичных пакетов
+BINARY_EXTENSION = '.pkb'
+
+#сигнатура и версия формата
+MAGIC = b'LR1P'
+VERSION = 1
+
+#заголовок: сигнатура, версия, код типа пакета, количество задач, MATH, INOUT, суммарная память
+HEADER = struct.Struct('<4sHBxQQQQ')
+
+#запись задачи
+RECORD_DTYPE = np.dtype([('num', '<i8'), ('type', 'i1'), ('memory', '<i4')])
+
+#количество записей, собираемых перед записью в файл
+WRITE_CHUNK = 1 << 16
+
+#типы пакетов по коду в заголовке (0 - пустой пакет без типа)
+PACKET_TYPES = [None] + list(TypePacket)
+
+#файл в двоичном формате пакета
+def isBinaryPacket(filename: str) -> bool:
+    return filename.endswith(BINARY_EXTENSION)
+
+#запись файла пакета под временным именем в том же каталоге с заменой прежнего файла после записи
+#прежний пакет под этим именем может быть отображен в память загруженным пакетом или кэшем пакетов:
+#после усечения файла на месте чтение отображения завершает процесс ошибкой шины,
+#а при замене старое отображение продолжает ссылаться на прежнее содержимое
+@contextmanager
+def replaceFile(filename: str, mode: str = 'wb', **kwargs):
+    temp_filename = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(temp_filename, mode, **kwargs) as f:
+            yield f
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+#чтение заголовка двоичного пакета: тип и сводные показатели без чтения задач
+def readHeader(filename: str):
+    with open(filename, 'rb') as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"Файл {filename} слишком короткий для двоичного пакета")
+    magic, version, type_code, count, math, inout, memory = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError(f"Файл {filename} не является двоичным пакетом")
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия двоичного пакета: {version}")
+    return PACKET_TYPES[type_code], PacketSummary(count=count, math=math, inout=inout, memory=memory)
+
+#загрузка двоичного пакета: столбцы таблицы задач ссылаются на отображенный в память файл
+def loadBinaryPacket(filename: str) -> Packet:
+    packet_type, summary = readHeader(filename)
+    if summary.count:
+        records = np.memmap(filename, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(summary.count,))
+    else:
+        records = np.empty(0, dtype=RECORD_DTYPE)
+
+    packet = Packet()
+    packet.table = TaskTable(
+        nums=records['num'],
+        types=records['type'],
+        memory=records['memory'],
+        states=np.full(summary.count, STATE_CODES[StateTask.WAIT], dtype=np.int8),
+        execution_time=np.zeros(summary.count, dtype=np.int32)
+    )
+    packet.type = packet_type
+    packet.summary = summary
+    return packet
+
+#запись заголовка в начало файла
+def writeHeader(f, packet_type: TypePacket, summary: PacketSummary):
+    f.seek(0)
+    f.write(HEADER.pack(MAGIC, VERSION, PACKET_TYPES.index(packet_type),
+                        summary.count, summary.math, summary.inout, summary.memory))
+
+#запись порции задач в файл с учетом их в сводных показателях
+def writeChunk(f, rows: list, summary: PacketSummary):
+    chunk = np.array(rows, dtype=RECORD_DTYPE)
+    f.write(chunk.tobytes())
+    math = int(np.count_nonzero(chunk['type'] == TYPE_CODES[TypeTask.MATH]))
+    summary.count += len(chunk)
+    summary.math += math
+    summary.inout += len(chunk) - math
+    summary.memory += int(chunk['memory'].sum(dtype=np.int64))
+
+#запись задач в двоичный пакет
+#записи читаются и пишутся порциями, заголовок дописывается в конце
+def writeBinaryPacket(records, filename: str) -> PacketSummary:
+    summary = PacketSummary()
+    with replaceFile(filename) as f:
+        f.write(bytes(HEADER.size))
+        rows = []
+        for record in records:
+            rows.append((record['num'], TYPE_CODES[TypeTask[record['type']]], record['memory']))
+            if len(rows) >= WRITE_CHUNK:
+                writeChunk(f, rows, summary)
+                rows = []
+        if rows:
+            writeChunk(f, rows, summary)
+
+        packet_type = packetTypeByCounts(summary.math, summary.inout) if summary.count else None
+        writeHeader(f, packet_type, summary)
+    return summary
+
+#запись уже загруженного пакета в двоичный формат
+def writePacketTable(packet: Packet, filename: str):
+    table = packet.table
+    records = np.empty(len(table), dtype=RECORD_DTYPE)
+    records['num'] = table.nums
+    records['type'] = table.types
+    records['memory'] = table.memory
+    with replaceFile(filename) as f:
+        writeHeader(f, packet.type, packet.summary)
+        f.write(records.tobytes())
+
+#преобразование пакета в формате JSON или JSON Lines в двоичный
+def convertToBinary(source: str, target: str) -> PacketSummary:
+    return writeBinaryPacket(iterPacketRecords(source), target)
+
+#открыть пакет любого поддерживаемого формата
+def openPacket(filename: str, streaming: bool = False):
+    if isBinaryPacket(filename):
+        return loadBinaryPacket(filename)
+    if streaming or isJsonLines(filename):
+        return PacketStream(filename)
+    return Packet(filename)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Преобразование пакета в двоичный формат")
+    parser.add_argument('source', help="пакет в формате JSON/JSON Lines, или двоичный пакет для --info")
+    parser.add_argument('target', nargs='?', default=None,
+                        help=f"двоичный пакет (по умолчанию имя исходного с расширением {BINARY_EXTENSION})")
+    parser.add_argument('--info', action='store_true', help="только показать заголовок двоичного пакета")
+    args = parser.parse_args(argv)
+
+    if args.info:
+        packet_type, summary = readHeader(args.source)
+    else:
+        target = args.target or os.path.splitext(args.source)[0] + BINARY_EXTENSION
+        convertToBinary(args.source, target)
+        packet_type, summary = readHeader(target)
+        print(f"Записан пакет: {target}")
+
+    print(f"Тип: {packet_type.value if packet_type else '-'}")
+    print(f"Всего задач: {summary.count}")
+    print(f"MATH задач: {summary.math}")
+    print(f"INOUT задач: {summary.inout}")
+    print(f"Суммарная память: {summary.memory} МБ")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#кэш разобранных пакетов
+#
+#ключ - путь к файлу, время его изменения и размер, поэтому измененный файл разбирается заново.
+#хранятся неизменяемые столбцы таблицы задач и сводные показатели, каждый прогон
+#получает копию пакета со своими состояниями задач
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from packet import Packet
+from packetbin import BINARY_EXTENSION, isBinaryPacket, loadBinaryPacket, openPacket, writePacketTable
+from packetstream import isJsonLines
+
+#сколько пакетов держать в памяти по умолчанию
+DEFAULT_MAX_ENTRIES = 8
+
+#время изменения и размер файла: если они другие, файл изменился
+def fileStamp(filename: str) -> tuple:
+    stat = os.stat(filename)
+    return (stat.st_mtime_ns, stat.st_size)
+
+class PacketCache:
+    #конструктор
+    #directory - каталог для сохранения разобранных пакетов в двоичном формате между запусками
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, directory: str = None):
+        self.max_entries = max_entries  #наибольшее количество пакетов в памяти
+        self.directory = directory  #каталог кэша на диске (None - только в памяти)
+        self.entries = OrderedDict()  #пакеты по ключу, в порядке последнего обращения
+        self.hits = 0  #количество обращений, обслуженных из памяти
+        self.misses = 0  #количество обращений, потребовавших загрузки
+        #пакет может запрашиваться одновременно из нескольких потоков (сведения о пакете в окне
+        #загружаются в фоновом потоке); одновременный запрос того же файла ждет первой загрузки
+        self.lock = threading.Lock()
+
+    #ключ кэша для файла пакета
+    def key(self, filename: str, streaming: bool) -> tuple:
+        return (os.path.abspath(filename), *fileStamp(filename), streaming)
+
+    #путь к сохраненному на диске пакету для ключа
+    def diskPath(self, key: tuple) -> str:
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + BINARY_EXTENSION)
+
+    #загрузка пакета мимо кэша в памяти, с использованием кэша на диске
+    def load(self, filename: str, streaming: bool, key: tuple):
+        if streaming or self.directory is None or isBinaryPacket(filename):
+            return openPacket(filename, streaming)
+        path = self.diskPath(key)
+        if os.path.exists(path):
+            return loadBinaryPacket(path)
+        packet = Packet(filename)
+        os.makedirs(self.directory, exist_ok=True)
+        writePacketTable(packet, path)
+        return packet
+
+    #получить пакет: из памяти, если файл не менялся, иначе загрузить и запомнить
+    def open(self, filename: str, streaming: bool = False):
+        streaming = streaming or isJsonLines(filename)
+        key = self.key(filename, streaming)
+        with self.lock:
+            packet = self.entries.get(key)
+            if packet is None:
+                self.misses += 1
+                packet = self.load(filename, streaming, key)
+                self.entries[key] = packet
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return packet.copy()
+
+    #очистить кэш в памяти
+    def clear(self):
+        self.entries.clear()
+
+#общий кэш пакетов
+packet_cache = PacketCache()
+
+#настроить общий кэш пакетов
+def configureCache(max_entries: int = DEFAULT_MAX_ENTRIES, directory: str = None):
+    packet_cache.max_entries = max_entries
+    packet_cache.directory = directory
+    packet_cache.clear()
+
+#получить пакет через общий кэш
+def loadPacket(filename: str, streaming: bool = False):
+    return packet_cache.open(filename, streaming)
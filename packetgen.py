@@ -0,0 +1,231 @@
+#генерация пакетов задач с векторной выборкой numpy
+#
+#задачи создаются порциями: типы и объемы памяти выбираются сразу для всей порции,
+#порция записывается в файл и отбрасывается, так что память не зависит от размера пакета.
+#генератор случайных чисел инициализируется seed, поэтому один seed дает один и тот же пакет
+import argparse
+import itertools
+import os
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+import numpy as np
+from task import TypeTask
+from packet import PacketSummary, TASK_TYPES, TYPE_CODES, packetTypeByCounts
+from packetbin import HEADER, RECORD_DTYPE, isBinaryPacket, replaceFile, writeChunk, writeHeader
+from packetstream import isJsonLines
+
+#объем памяти задач по умолчанию, МБ (границы включительно)
+MATH_MEMORY = (100, 1000)
+INOUT_MEMORY = (50, 500)
+
+#задач в одной порции
+GENERATE_CHUNK = 1 << 16
+
+#диапазон доли MATH задач для каждого вида пакета; доля выбирается из него случайно
+PACKET_KINDS = {
+    'math': (0.7, 0.9),
+    'inout': (0.1, 0.3),
+    'balanced': (0.5, 0.5)
+}
+
+#коды типов задач в записях
+MATH_CODE = TYPE_CODES[TypeTask.MATH]
+INOUT_CODE = TYPE_CODES[TypeTask.INOUT]
+
+#названия типов задач по коду
+TYPE_NAMES = np.array([task_type.name for task_type in TASK_TYPES])
+
+#равномерное распределение объема памяти
+def uniformMemory(rng: np.random.Generator, low: int, high: int, size: int) -> np.ndarray:
+    return rng.integers(low, high, size=size, endpoint=True)
+
+#нормальное распределение с центром посередине диапазона; значения за его границами прижимаются к ним
+def normalMemory(rng: np.random.Generator, low: int, high: int, size: int) -> np.ndarray:
+    values = rng.normal((low + high) / 2, (high - low) / 6, size=size)
+    return np.clip(np.rint(values), low, high)
+
+#логнормальное распределение: много небольших задач и редкие крупные
+def lognormalMemory(rng: np.random.Generator, low: int, high: int, size: int) -> np.ndarray:
+    values = low + (high - low) * rng.lognormal(-1.5, 0.75, size=size)
+    return np.clip(np.rint(values), low, high)
+
+#распределения объема памяти задач по названию
+MEMORY_DISTRIBUTIONS = {
+    'uniform': uniformMemory,
+    'normal': normalMemory,
+    'lognormal': lognormalMemory
+}
+
+#генератор пакета
+#задачи разных типов перемешаны по всему пакету; без перемешивания сначала идут задачи преобладающего типа
+@dataclass
+class PacketGenerator:
+    count: int  #количество задач
+    math_ratio: float = 0.5  #доля MATH задач
+    math_memory: Tuple[int, int] = MATH_MEMORY  #границы памяти MATH задач, МБ
+    inout_memory: Tuple[int, int] = INOUT_MEMORY  #границы памяти INOUT задач, МБ
+    distribution: str = 'uniform'  #распределение объема памяти
+    shuffle: bool = True  #перемешивать задачи разных типов
+    seed: Optional[int] = None  #начальное значение генератора случайных чисел
+    first_num: int = 1  #номер первой задачи
+
+    #проверка параметров
+    def __post_init__(self):
+        if self.count < 0:
+            raise ValueError("Количество задач не может быть отрицательным")
+        if not 0 <= self.math_ratio <= 1:
+            raise ValueError("Доля MATH задач должна быть от 0 до 1")
+        for low, high in (self.math_memory, self.inout_memory):
+            if not 0 < low <= high:
+                raise ValueError(f"Неверные границы памяти задач: {low}-{high}")
+        if self.distribution not in MEMORY_DISTRIBUTIONS:
+            raise ValueError(f"Неизвестное распределение памяти: {self.distribution}")
+
+    #генератор для вида пакета из PACKET_KINDS; доля MATH задач выбирается по seed
+    @classmethod
+    def forKind(cls, kind: str, count: int, seed: Optional[int] = None, **settings) -> 'PacketGenerator':
+        low, high = PACKET_KINDS[kind]
+        math_ratio = float(np.random.default_rng(seed).uniform(low, high))
+        return cls(count, math_ratio, seed=seed, **settings)
+
+    #количество MATH задач
+    def mathCount(self) -> int:
+        return round(self.count * self.math_ratio)
+
+    #порции записей задач (массивы RECORD_DTYPE)
+    #при перемешивании количество MATH задач в порции выбирается гипергеометрическим распределением:
+    #так задачи перемешаны по всему пакету, а всего MATH задач ровно mathCount()
+    def chunks(self, chunk_size: int = GENERATE_CHUNK) -> Iterator[np.ndarray]:
+        rng = np.random.default_rng(self.seed)
+        distribution = MEMORY_DISTRIBUTIONS[self.distribution]
+        left = self.count
+        math_left = self.mathCount()
+        math_first = 2 * math_left >= self.count
+        num = self.first_num
+        while left:
+            size = min(chunk_size, left)
+            types = np.full(size, INOUT_CODE, dtype=np.int8)
+            if self.shuffle:
+                math = int(rng.hypergeometric(math_left, left - math_left, size))
+                types[:math] = MATH_CODE
+                rng.shuffle(types)
+            elif math_first:
+                math = min(size, math_left)
+                types[:math] = MATH_CODE
+            else:
+                math = max(0, size - (left - math_left))
+                types[size - math:] = MATH_CODE
+
+            is_math = types == MATH_CODE
+            memory = np.empty(size, dtype=np.int32)
+            memory[is_math] = distribution(rng, *self.math_memory, math)
+            memory[~is_math] = distribution(rng, *self.inout_memory, size - math)
+
+            records = np.empty(size, dtype=RECORD_DTYPE)
+            records['num'] = np.arange(num, num + size)
+            records['type'] = types
+            records['memory'] = memory
+            yield records
+
+            left -= size
+            math_left -= math
+            num += size
+
+    #первые rows задач пакета (для предварительного просмотра); совпадают с началом записанного пакета
+    def preview(self, rows: int) -> np.ndarray:
+        chunk = next(self.chunks(), np.empty(0, dtype=RECORD_DTYPE))
+        return chunk[:rows]
+
+#записи задач из списка словарей вида {"num": ..., "type": ..., "memory": ...}
+def recordsFromList(tasks: list) -> np.ndarray:
+    records = np.empty(len(tasks), dtype=RECORD_DTYPE)
+    records['num'] = [task['num'] for task in tasks]
+    records['type'] = [TYPE_CODES[TypeTask[task['type']]] for task in tasks]
+    records['memory'] = [task['memory'] for task in tasks]
+    return records
+
+#строки JSON для записей задач
+def formatRecords(records: np.ndarray) -> list:
+    return [f'{{"num": {num}, "type": "{name}", "memory": {memory}}}'
+            for num, name, memory in zip(records['num'].tolist(),
+                                         TYPE_NAMES[records['type']].tolist(),
+                                         records['memory'].tolist())]
+
+#учет порции задач в сводных показателях
+def countChunk(records: np.ndarray, summary: PacketSummary):
+    math = int(np.count_nonzero(records['type'] == MATH_CODE))
+    summary.count += len(records)
+    summary.math += math
+    summary.inout += len(records) - math
+    summary.memory += int(records['memory'].sum(dtype=np.int64))
+
+#запись порций задач в файл по мере их получения
+#формат выбирается по расширению: двоичный пакет, JSON Lines или JSON вида {"tasks": [...]}
+#прежний файл заменяется только после записи всего пакета (см. packetbin.replaceFile)
+def writeRecords(chunks, filename: str) -> PacketSummary:
+    summary = PacketSummary()
+    if isBinaryPacket(filename):
+        with replaceFile(filename) as f:
+            f.write(bytes(HEADER.size))
+            for records in chunks:
+                writeChunk(f, records, summary)
+            writeHeader(f, packetTypeByCounts(summary.math, summary.inout) if summary.count else None, summary)
+        return summary
+
+    json_lines = isJsonLines(filename)
+    with replaceFile(filename, 'w', encoding='utf-8') as f:
+        if not json_lines:
+            f.write('{"tasks": [\n')
+        for records in chunks:
+            if not len(records):
+                continue
+            if json_lines:
+                f.write('\n'.join(formatRecords(records)) + '\n')
+            else:
+                f.write((',\n' if summary.count else '') + ',\n'.join(formatRecords(records)))
+            countChunk(records, summary)
+        if not json_lines:
+            f.write('\n]}\n')
+    return summary
+
+#запись пакета генератора в файл; extra - задачи, дописываемые после сгенерированных
+def writePacket(generator: PacketGenerator, filename: str, extra: np.ndarray = None) -> PacketSummary:
+    chunks = generator.chunks()
+    if extra is not None and len(extra):
+        chunks = itertools.chain(chunks, [extra])
+    return writeRecords(chunks, filename)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Генерация пакета задач")
+    parser.add_argument('target', help="файл пакета: .pkb - двоичный, .jsonl - JSON Lines, иначе JSON")
+    parser.add_argument('-n', '--count', type=int, required=True, help="количество задач")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--kind', choices=list(PACKET_KINDS), help="вид пакета (доля MATH задач выбирается по seed)")
+    group.add_argument('--math-ratio', type=float, default=0.5, help="доля MATH задач")
+    parser.add_argument('--math-memory', type=int, nargs=2, default=MATH_MEMORY, metavar=('MIN', 'MAX'),
+                        help="границы памяти MATH задач, МБ")
+    parser.add_argument('--inout-memory', type=int, nargs=2, default=INOUT_MEMORY, metavar=('MIN', 'MAX'),
+                        help="границы памяти INOUT задач, МБ")
+    parser.add_argument('--distribution', choices=list(MEMORY_DISTRIBUTIONS), default='uniform',
+                        help="распределение объема памяти")
+    parser.add_argument('--grouped', action='store_true',
+                        help="не перемешивать задачи: сначала задачи преобладающего типа")
+    parser.add_argument('--seed', type=int, default=None, help="начальное значение генератора случайных чисел")
+    args = parser.parse_args(argv)
+
+    settings = dict(math_memory=tuple(args.math_memory), inout_memory=tuple(args.inout_memory),
+                    distribution=args.distribution, shuffle=not args.grouped)
+    if args.kind:
+        generator = PacketGenerator.forKind(args.kind, args.count, args.seed, **settings)
+    else:
+        generator = PacketGenerator(args.count, args.math_ratio, seed=args.seed, **settings)
+    summary = writePacket(generator, args.target)
+
+    print(f"Записан пакет: {args.target} ({os.path.getsize(args.target)} байт)")
+    print(f"Всего задач: {summary.count}")
+    print(f"MATH задач: {summary.math}")
+    print(f"INOUT задач: {summary.inout}")
+    print(f"Суммарная память: {summary.memory} МБ")
+
+if __name__ == "__main__":
+    main()
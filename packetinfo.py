@@ -0,0 +1,22 @@
+#чтение сведений о пакете в фоновом потоке, чтобы окно показывалось, не дожидаясь загрузки пакета
+import threading
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class PacketInfoLoader(QObject):
+    loaded = pyqtSignal(str, object)  #файл и загруженный пакет
+    failed = pyqtSignal(str, str)  #файл и текст ошибки
+
+    #загрузка пакета в фоновом потоке; результат передается сигналом в поток окна
+    def load(self, file: str):
+        threading.Thread(target=self.run, args=(file,), daemon=True).start()
+
+    #загрузка пакета, выполняется в фоновом потоке
+    def run(self, file: str):
+        try:
+            #модули пакетов вместе с numpy импортируются здесь, а не при запуске программы
+            from packetcache import loadPacket
+            packet = loadPacket(file)
+        except Exception as e:
+            self.failed.emit(file, str(e))
+            return
+        self.loaded.emit(file, packet)
@@ -0,0 +1,26 @@
+#запись нового пакета в фоновом потоке, чтобы окно не зависало на время записи большого пакета
+import threading
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class PacketWriter(QObject):
+    saved = pyqtSignal(str)  #файл пакета записан
+    failed = pyqtSignal(str, str)  #файл и текст ошибки
+
+    #запись пакета в фоновом потоке; результат передается сигналом в поток окна
+    #generator - генератор случайной части пакета (или None), extra - записи задач, добавленных вручную
+    #поток не фоновый (daemon): при закрытии программы начатая запись доводится до конца
+    def save(self, filename: str, generator, extra):
+        threading.Thread(target=self.run, args=(filename, generator, extra)).start()
+
+    #запись пакета, выполняется в фоновом потоке
+    def run(self, filename: str, generator, extra):
+        try:
+            from packetgen import writePacket, writeRecords
+            if generator:
+                writePacket(generator, filename, extra)
+            else:
+                writeRecords([extra], filename)
+        except Exception as e:
+            self.failed.emit(filename, str(e))
+            return
+        self.saved.emit(filename)
@@ -0,0 +1,126 @@
+#потоковое чтение пакетов, не помещающихся в память
+import itertools
+import json
+import re
+from dataclasses import dataclass
+from task import Task, TypeTask
+from packet import TypePacket, packetTypeByCounts
+
+#размер порции, читаемой из файла за раз
+CHUNK_SIZE = 1 << 16
+
+#начало массива задач в файле формата {"tasks": [...]}
+TASKS_ARRAY_START = re.compile(r'"tasks"\s*:\s*\[')
+
+#файл в формате JSON Lines (одна задача на строку)
+def isJsonLines(filename: str) -> bool:
+    return filename.endswith('.jsonl')
+
+#чтение записей задач из файла JSON Lines
+def iterJsonLines(filename: str):
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+#чтение записей задач из файла формата {"tasks": [...]} без загрузки файла целиком
+#в памяти держится только текущая порция файла
+def iterJsonTasks(filename: str, chunk_size: int = CHUNK_SIZE):
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding='utf-8') as f:
+        buffer = ''
+        match = None
+        while match is None:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError(f"В файле {filename} нет массива задач \"tasks\"")
+            buffer += chunk
+            match = TASKS_ARRAY_START.search(buffer)
+        buffer = buffer[match.end():]
+        pos = 0
+
+        while True:
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ','):
+                pos += 1
+            if pos < len(buffer):
+                if buffer[pos] == ']':
+                    return
+                try:
+                    record, end = decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    pass  #запись не поместилась в порцию целиком, нужно дочитать файл
+                else:
+                    pos = end
+                    yield record
+                    continue
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError(f"Массив задач в файле {filename} оборван")
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+#чтение записей задач в зависимости от формата файла
+def iterPacketRecords(filename: str):
+    if isJsonLines(filename):
+        return iterJsonLines(filename)
+    return iterJsonTasks(filename)
+
+#пакет, задачи которого читаются из файла по мере надобности
+#сводные показатели считаются одним проходом по файлу при создании
+@dataclass
+class PacketStream:
+    filename: str  #файл пакета
+    type: TypePacket = None  #тип пакета
+    count: int = 0  #количество задач
+    math: int = 0  #количество MATH задач
+    inout: int = 0  #количество INOUT задач
+    memory: int = 0  #суммарная память задач
+
+    #пост-инициализация: проход по файлу для подсчета сводных показателей
+    def __post_init__(self):
+        for record in iterPacketRecords(self.filename):
+            self.count += 1
+            self.memory += record['memory']
+            if TypeTask[record['type']] == TypeTask.MATH:
+                self.math += 1
+            else:
+                self.inout += 1
+        self.type = packetTypeByCounts(self.math, self.inout) if self.count else None
+
+    #задачи пакета по очереди, начиная с задачи номер first; каждый вызов начинает чтение файла заново
+    def iterTasks(self, first: int = 0):
+        for record in itertools.islice(iterPacketRecords(self.filename), first, None):
+            yield Task(num=record['num'], type=TypeTask[record['type']], memory=record['memory'])
+
+    #получить общее количество задач
+    def getTasksCount(self):
+        return self.count
+
+    #получить общую память пакета
+    def getTasksMemory(self):
+        return self.memory
+
+    #получить количество математических задач
+    def getMathTasks(self):
+        return self.math
+
+    #получить количество задач ввода-вывода
+    def getInOutTasks(self):
+        return self.inout
+
+    #копия пакета для нового прогона: состояние задач не хранится, поэтому копия не нужна
+    def copy(self) -> 'PacketStream':
+        return self
+
+    #возврат задач в начальное состояние: задачи создаются заново при каждом чтении
+    def resetTasks(self):
+        pass
+
+    #состояния задач не хранятся, сохранять нечего
+    def saveStates(self):
+        return None
+
+    #состояния задач не хранятся, восстанавливать нечего
+    def restoreStates(self, saved):
+        pass
@@ -0,0 +1,124 @@
+#вытеснение задач по кванту времени и учет времени оборота и отклика задач
+from dataclasses import dataclass, field, asdict
+from typing import Dict
+from task import Task, TypeTask
+
+#циклическое вытеснение (round robin): задача, выполнявшаяся quantum тактов подряд, выгружается
+#в конец очереди (после всех еще не запускавшихся задач пакета), если ее ждут другие задачи;
+#время выполнения задачи при этом сохраняется.
+#вернувшись в раздел, задача swap_cost тактов подгружается и только потом продолжает выполнение
+@dataclass
+class RoundRobin:
+    quantum: int = 1  #сколько тактов выполнения подряд получает задача
+    swap_cost: int = 0  #сколько тактов занимает подгрузка вытесненной задачи обратно в раздел
+    slices: Dict[Task, int] = field(default_factory=dict)  #тактов выполнения в текущем кванте по задаче
+    swapping: Dict[Task, int] = field(default_factory=dict)  #оставшиеся такты подгрузки по вытесненной задаче
+    preemptions: int = 0  #сколько раз задачи вытеснялись
+    swap_tacts: int = 0  #сколько тактов разделы были заняты подгрузкой
+
+    #проверка параметров
+    def __post_init__(self):
+        if self.quantum <= 0:
+            raise ValueError("Квант времени должен быть положительным")
+        if self.swap_cost < 0:
+            raise ValueError("Стоимость подгрузки не может быть отрицательной")
+
+    #задача выполнилась count тактов
+    def advance(self, task: Task, count: int = 1):
+        self.slices[task] = self.slices.get(task, 0) + count
+
+    #задача завершена, квант больше не считается
+    def finished(self, task: Task):
+        self.slices.pop(task, None)
+
+    #квант задачи исчерпан
+    def expired(self, task: Task) -> bool:
+        return self.slices.get(task, 0) >= self.quantum
+
+    #сколько следующих тактов задача выполняется, не исчерпав квант
+    def quietTacts(self, task: Task) -> int:
+        return self.quantum - self.slices.get(task, 0)
+
+    #задача вытеснена: квант начинается заново, при возвращении задача подгружается
+    def preempted(self, task: Task):
+        self.slices.pop(task, None)
+        self.preemptions += 1
+        if self.swap_cost:
+            self.swapping[task] = self.swap_cost
+
+    #такт подгрузки задачи в раздел; False, если задача уже подгружена и может выполняться
+    def swapIn(self, task: Task) -> bool:
+        left = self.swapping.get(task)
+        if left is None:
+            return False
+        if left == 0:
+            del self.swapping[task]
+            return False
+        self.swapping[task] = left - 1
+        self.swap_tacts += 1
+        return True
+
+    #возврат к начальному состоянию перед новым прогоном
+    def reset(self):
+        self.slices = {}
+        self.swapping = {}
+        self.preemptions = 0
+        self.swap_tacts = 0
+
+#время оборота и отклика задач одного типа
+#весь пакет поступает в начале прогона, поэтому время отсчитывается от такта 0
+@dataclass
+class TimeStats:
+    count: int = 0  #количество завершенных задач
+    turnaround: int = 0  #сумма тактов завершения
+    response: int = 0  #сумма тактов первого запуска
+    max_turnaround: int = 0  #наибольший такт завершения
+    max_response: int = 0  #наибольший такт первого запуска
+
+#учет времени оборота (до завершения) и отклика (до первого запуска) по типам задач
+@dataclass
+class TaskTimes:
+    start_tacts: Dict[Task, int] = field(default_factory=dict)  #такт первого запуска незавершенных задач
+    by_type: Dict[str, TimeStats] = field(default_factory=lambda: {task_type.name: TimeStats() for task_type in TypeTask})
+
+    #задача запущена на такте tact; повторные запуски после вытеснения не учитываются
+    def started(self, task: Task, tact: int):
+        self.start_tacts.setdefault(task, tact)
+
+    #задача завершена на такте tact
+    def finished(self, task: Task, tact: int):
+        response = self.start_tacts.pop(task, tact)
+        stats = self.by_type[task.type.name]
+        stats.count += 1
+        stats.turnaround += tact
+        stats.response += response
+        if tact > stats.max_turnaround:
+            stats.max_turnaround = tact
+        if response > stats.max_response:
+            stats.max_response = response
+
+    #средние и наибольшие значения по типам задач
+    def summary(self) -> dict:
+        return {
+            name: {
+                'count': stats.count,
+                'mean_turnaround': stats.turnaround / stats.count if stats.count else 0.0,
+                'mean_response': stats.response / stats.count if stats.count else 0.0,
+                'max_turnaround': stats.max_turnaround,
+                'max_response': stats.max_response
+            }
+            for name, stats in self.by_type.items()
+        }
+
+    #возврат к начальному состоянию перед новым прогоном
+    def reset(self):
+        self.start_tacts = {}
+        self.by_type = {task_type.name: TimeStats() for task_type in TypeTask}
+
+    #накопленные показатели для контрольной точки (такты запуска сохраняются отдельно)
+    def getState(self) -> dict:
+        return {name: asdict(stats) for name, stats in self.by_type.items()}
+
+    #восстановление показателей из контрольной точки
+    def setState(self, state: dict):
+        self.by_type = {name: TimeStats(**stats) for name, stats in state.items()}
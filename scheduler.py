@@ -0,0 +1,114 @@
+#политики выбора задачи из очереди ожидания для загрузки в освободившийся раздел
+#
+#планировщик смотрит не дальше window первых задач очереди: задачи пакета читаются лениво,
+#и выбор из всей очереди потребовал бы создать объекты для всех задач сразу
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict
+from task import Task, TypeTask
+
+#сколько задач очереди просматривает планировщик по умолчанию
+DEFAULT_WINDOW = 64
+
+#планировщик по порядку очереди (FIFO)
+@dataclass
+class Scheduler:
+    name: ClassVar[str] = 'fifo'  #название политики
+    window: int = 1  #сколько первых задач очереди рассматривать
+
+    #номер выбранной задачи в списке кандидатов (первых задач очереди)
+    def select(self, system, candidates: list) -> int:
+        return 0
+
+    #задачи окна очереди, которые рассматривались на этом такте, включая те, которым сейчас не хватило памяти
+    #(такие задачи не передаются в select, но остаются в очереди)
+    def seen(self, system, tasks: list):
+        pass
+
+    #задача выбрана и загружена в раздел
+    def taken(self, task: Task):
+        pass
+
+    #возврат к начальному состоянию перед новым прогоном
+    def reset(self):
+        pass
+
+#кратчайшая задача первой (MATH выполняется 3 такта, INOUT - 2)
+@dataclass
+class ShortestJobFirst(Scheduler):
+    name: ClassVar[str] = 'sjf'
+    window: int = DEFAULT_WINDOW
+
+    def select(self, system, candidates: list) -> int:
+        return min(range(len(candidates)), key=lambda i: candidates[i].required_time)
+
+#наиболее подходящая по памяти задача: самая большая из помещающихся в раздел,
+#а если не помещается ни одна - самая маленькая
+#размер раздела - объем RAM, поделенный на количество разделов
+@dataclass
+class MemoryBestFit(Scheduler):
+    name: ClassVar[str] = 'best-fit'
+    window: int = DEFAULT_WINDOW
+
+    def select(self, system, candidates: list) -> int:
+        partition = system.ram * 1024 / system.max_blocks_count
+        fitting = [i for i, task in enumerate(candidates) if task.memory <= partition]
+        if fitting:
+            return max(fitting, key=lambda i: candidates[i].memory)
+        return min(range(len(candidates)), key=lambda i: candidates[i].memory)
+
+#чередование типов: загружается задача того типа, которого сейчас выполняется меньше,
+#чтобы вычисления и ввод/вывод шли одновременно
+@dataclass
+class Interleave(Scheduler):
+    name: ClassVar[str] = 'interleave'
+    window: int = DEFAULT_WINDOW
+
+    def select(self, system, candidates: list) -> int:
+        wanted = TypeTask.MATH if system.running_math_count <= system.running_io_count else TypeTask.INOUT
+        for i, task in enumerate(candidates):
+            if task.type == wanted:
+                return i
+        return 0
+
+#приоритет по типу задачи со старением: приоритет ожидающей задачи растет на aging за каждый такт,
+#так что задачи низкого приоритета не ждут бесконечно
+@dataclass
+class PriorityAging(Scheduler):
+    name: ClassVar[str] = 'priority'
+    window: int = DEFAULT_WINDOW
+    priorities: Dict[TypeTask, float] = field(default_factory=lambda: {TypeTask.INOUT: 1.0, TypeTask.MATH: 0.0})  #начальный приоритет по типу
+    aging: float = 0.1  #прирост приоритета за такт ожидания
+    arrivals: Dict[Task, int] = field(default_factory=dict)  #такт, с которого задача рассматривается планировщиком
+
+    def select(self, system, candidates: list) -> int:
+        tact = system.current_tact
+        best, best_priority = 0, None
+        for i, task in enumerate(candidates):
+            arrival = self.arrivals.setdefault(task, tact)
+            priority = self.priorities[task.type] + self.aging * (tact - arrival)
+            if best_priority is None or priority > best_priority:
+                best, best_priority = i, priority
+        return best
+
+    #задача, пропущенная из-за нехватки памяти, стареет с того же такта, что и выбираемые
+    def seen(self, system, tasks: list):
+        tact = system.current_tact
+        for task in tasks:
+            self.arrivals.setdefault(task, tact)
+
+    def taken(self, task: Task):
+        self.arrivals.pop(task, None)
+
+    def reset(self):
+        self.arrivals = {}
+
+#политики по названию
+SCHEDULERS = {scheduler.name: scheduler for scheduler in (Scheduler, ShortestJobFirst, MemoryBestFit, Interleave, PriorityAging)}
+
+#создание планировщика по названию; готовый планировщик возвращается как есть
+def createScheduler(scheduler='fifo', **options) -> Scheduler:
+    if isinstance(scheduler, Scheduler):
+        return scheduler
+    if scheduler not in SCHEDULERS:
+        raise ValueError(f"Неизвестная политика планирования: {scheduler} (доступны: {', '.join(SCHEDULERS)})")
+    return SCHEDULERS[scheduler](**options)
@@ -0,0 +1,70 @@
+#выполнение симуляции в отдельном потоке, чтобы окно не зависало на время прогона
+from PyQt6.QtCore import QObject, QThread, Qt, pyqtSignal
+from simulation import Simulation, RunControl
+
+#исполнитель прогона: переносится в отдельный поток и запускает симуляцию там
+class SimulationWorker(QObject):
+    finished = pyqtSignal()  #прогон завершен (в том числе отменой)
+    failed = pyqtSignal(str)  #прогон прерван ошибкой
+
+    #конструктор
+    def __init__(self, simulation: Simulation):
+        super().__init__()
+        self.simulation = simulation
+
+    #запуск прогона, выполняется в потоке исполнителя
+    def run(self):
+        try:
+            self.simulation.start()
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.finished.emit()
+
+#поток с исполнителем прогона и управлением им
+class SimulationThread(QObject):
+    finished = pyqtSignal()  #прогон завершен (в том числе отменой)
+    failed = pyqtSignal(str)  #прогон прерван ошибкой
+
+    #конструктор
+    def __init__(self, simulation: Simulation, parent: QObject = None):
+        super().__init__(parent)
+        self.simulation = simulation
+        self.control = RunControl()
+        simulation.control = self.control
+        self.thread = QThread()
+        self.worker = SimulationWorker(simulation)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+        self.worker.failed.connect(self.failed)
+        #quit потокобезопасен и вызывается сразу из потока исполнителя,
+        #так что остановку можно дождаться, даже если поток интерфейса занят ожиданием
+        self.worker.finished.connect(self.thread.quit, Qt.ConnectionType.DirectConnection)
+        self.thread.finished.connect(self.onThreadFinished)
+
+    #запуск прогона
+    def start(self):
+        self.thread.start()
+
+    #прогон еще выполняется
+    def isRunning(self) -> bool:
+        return self.thread.isRunning()
+
+    #поток остановлен: симуляция больше не управляется извне
+    def onThreadFinished(self):
+        self.simulation.control = None
+        self.finished.emit()
+
+    #приостановить или продолжить прогон
+    def togglePause(self) -> bool:
+        if self.control.isPaused():
+            self.control.resume()
+        else:
+            self.control.pause()
+        return self.control.isPaused()
+
+    #прервать прогон и дождаться остановки потока
+    def cancel(self, wait: bool = False):
+        self.control.cancel()
+        if wait:
+            self.thread.wait()
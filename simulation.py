@@ -1,110 +1,282 @@
-#симуляция
-import time
-from osys import OS
-from packet import Packet
-from dataclasses import dataclass, field
-from typing import Optional
-
-@dataclass
-class Simulation:
-    max_blocks_count: int  #начальное количество разделов памяти
-    ram: int  #объем оперативной памяти в ГБ
-    json_file: str  #файл с задачами в формате JSON
-    max_tacts: int  #максимальное количество тактов выполнения
-    os: Optional[OS] = None  #экземпляр операционной системы
-    start_time: float = 0  #время начала симуляции
-    end_time: float = 0  #время окончания симуляции
-    total_tacts: int = 0  #фактическое количество выполненных тактов
-    memory_changes: list = field(default_factory=list)  #история изменений памяти
-    
-    #пост-инициализации
-    def __post_init__(self):
-        self.os = OS(ram=self.ram, max_blocks_count=self.max_blocks_count)
-        self.os.initialize(self.json_file)
-        self.start_time = time.time()
-        self.memory_changes = [f"Начальное количество: {self.max_blocks_count} разделов"]
-    
-    #изменения количества разделов в памяти во время выполнения
-    def changeMemoryBlocks(self, new_count: int):
-        if self.os:
-            old_count = self.max_blocks_count
-            self.os.changeMemoryBlocksCount(new_count)
-            self.max_blocks_count = new_count
-            
-            change_info = f"Такт {self.total_tacts}: {old_count} → {new_count} разделов"
-            self.memory_changes.append(change_info)
-    
-    #запуск симуляции
-    def runSimulation(self):
-        self.total_tacts = 0
-        
-        if self.os.output_callback:
-            self.os.output_callback("СТАРТ")
-            total_memory_mb = self.os.packet.getTasksMemory()
-            total_memory_gb = total_memory_mb / 1024
-            self.os.output_callback(f"Суммарно RAM пакета: {total_memory_gb:.1f} ГБ")
-            self.os.output_callback(f"Всего задач: {self.os.packet.getTasksCount()}")
-            self.os.output_callback(f"MATH задач: {self.os.packet.getMathTasks()}")
-            self.os.output_callback(f"INOUT задач: {self.os.packet.getInOutTasks()}")
-            self.os.output_callback(f"Начальное количество разделов памяти: {self.max_blocks_count}")
-        
-        for tact in range(self.max_tacts):
-            self.total_tacts = tact + 1
-            self.os.runTact()
-
-            if self.isSimOver():
-                break
-
-        self.end_time = time.time()
-        
-        if self.os.output_callback:
-            self.os.output_callback("\nФИНИШ")
-            self.os.output_callback(f"Все задачи выполнены за {self.total_tacts} тактов")
-            self.os.output_callback(f"Финальное количество разделов памяти: {self.max_blocks_count}")
-            
-            if len(self.memory_changes) > 1:
-                self.os.output_callback("\nИстория изменений разделов памяти:")
-                for change in self.memory_changes:
-                    self.os.output_callback(f"  {change}")
-    
-    #проверка условий завершения симуляции
-    def isSimOver(self) -> bool:
-        return (
-            len(self.os.wait_queue) == 0 and 
-            len(self.os.running_tasks) == 0 and 
-            len(self.os.io_wait_tasks) == 0 and
-            all(task is None or task.state.value == "ВЫПОЛНЕНА" for task in self.os.memory_blocks)
-        )
-    
-    #получить время выполнения симуляции
-    def getRunTime(self) -> float:
-        return self.end_time - self.start_time
-    
-    #история изменения разделов памяти
-    def getMemoryChanges(self) -> list:
-        return self.memory_changes.copy()
-    
-    #сброс симуляции к начальному состоянию
-    def reset(self):
-        if self.os:
-            self.os.reset() 
-    
-        self.start_time = time.time()
-        self.end_time = 0
-        self.total_tacts = 0
-        self.memory_changes = [f"Начальное количество: {self.max_blocks_count} разделов"]
-    
-    #запуск симуляции
-    def start(self):
-        self.runSimulation()
-
-"""
-if __name__ == "__main__":
-    sim = Simulation(
-        max_blocks_count=8,
-        ram=16,
-        json_file="ready_packets/balanced_big_pack.json",
-        max_tacts=100  # Количество тактов как параметр класса
-    )
-    sim.start()
+#симуляция
+import threading
+import time
+from osys import OS
+from packet import Packet
+from eventlog import LogLevel
+from history import MAX_RESERVE
+from scheduler import createScheduler
+from allocator import createAllocator
+from controller import createController
+from preemption import RoundRobin
+from packetcache import fileStamp
+from checkpoint import captureOS, restoreOS, writeCheckpoint, readCheckpoint
+from dataclasses import dataclass, field
+from typing import Optional
+
+#управление прогоном из другого потока: пауза и отмена
+class RunControl:
+    #конструктор
+    def __init__(self):
+        self.cancelled = False  #прогон нужно прервать
+        self.running = threading.Event()  #снят, пока прогон на паузе
+        self.running.set()
+
+    #приостановить прогон
+    def pause(self):
+        self.running.clear()
+
+    #продолжить прогон
+    def resume(self):
+        self.running.set()
+
+    #прервать прогон, в том числе стоящий на паузе
+    def cancel(self):
+        self.cancelled = True
+        self.running.set()
+
+    #прогон на паузе
+    def isPaused(self) -> bool:
+        return not self.running.is_set()
+
+    #вызывается симуляцией перед каждым тактом: ждет снятия паузы, True - прогон нужно прервать
+    def shouldStop(self) -> bool:
+        self.running.wait()
+        return self.cancelled
+
+@dataclass
+class Simulation:
+    max_blocks_count: int  #начальное количество разделов памяти
+    ram: int  #объем оперативной памяти в ГБ
+    json_file: str  #файл с задачами в формате JSON
+    max_tacts: int  #максимальное количество тактов выполнения
+    os: Optional[OS] = None  #экземпляр операционной системы
+    start_time: float = 0  #время начала симуляции
+    end_time: float = 0  #время окончания симуляции
+    total_tacts: int = 0  #фактическое количество выполненных тактов
+    memory_changes: list = field(default_factory=list)  #история изменений памяти
+    time_limit: Optional[float] = None  #ограничение времени выполнения в секундах
+    timed_out: bool = False  #симуляция прервана по ограничению времени
+    event_driven: bool = False  #пропускать такты, в которых ничего не меняется, кроме счетчиков выполнения
+    streaming: bool = False  #читать задачи из файла по мере надобности, не загружая пакет целиком
+    checkpoint_file: Optional[str] = None  #файл контрольной точки
+    checkpoint_every: int = 0  #сохранять контрольную точку каждые checkpoint_every тактов (0 - не сохранять)
+    last_checkpoint: int = 0  #такт последней сохраненной контрольной точки
+    cpu_count: Optional[int] = None  #количество ядер процессора (None - без учета ядер)
+    scheduler: object = 'fifo'  #политика выбора задачи для загрузки: название из scheduler.SCHEDULERS или готовый планировщик
+    memory_model: Optional[str] = None  #модель памяти RAM из allocator.MEMORY_MODELS (None - объем памяти задач не учитывается)
+    partition_sizes: Optional[list] = None  #размеры фиксированных разделов в МБ (по умолчанию RAM делится поровну)
+    controller: object = 'shrink'  #политика изменения количества разделов: название из controller.CONTROLLERS или готовая политика
+    quantum: Optional[int] = None  #квант времени в тактах для вытеснения задач (None или 0 - задача выполняется до завершения)
+    swap_cost: int = 0  #сколько тактов вытесненная задача подгружается обратно в раздел
+    control: Optional[RunControl] = None  #управление прогоном из другого потока (пауза и отмена)
+    cancelled: bool = False  #симуляция прервана отменой
+    packet_stamp: Optional[tuple] = None  #время изменения и размер файла пакета при загрузке
+    
+    #пост-инициализации
+    def __post_init__(self):
+        self.os = OS(ram=self.ram, max_blocks_count=self.max_blocks_count, cpu_count=self.cpu_count,
+                     scheduler=createScheduler(self.scheduler), controller=createController(self.controller))
+        if self.quantum:
+            self.os.preemption = RoundRobin(quantum=self.quantum, swap_cost=self.swap_cost)
+        if self.memory_model:
+            self.os.allocator = createAllocator(self.memory_model, self.ram, self.max_blocks_count, self.partition_sizes)
+        #отметка берется до загрузки: если файл изменится во время загрузки, он будет считаться измененным
+        self.packet_stamp = fileStamp(self.json_file)
+        self.os.initialize(self.json_file, streaming=self.streaming)
+        self.os.history.reserve(min(self.max_tacts, MAX_RESERVE))
+        self.start_time = time.time()
+        self.memory_changes = [f"Начальное количество: {self.max_blocks_count} разделов"]
+    
+    #изменения количества разделов в памяти во время выполнения
+    def changeMemoryBlocks(self, new_count: int):
+        if self.os:
+            old_count = self.max_blocks_count
+            self.os.changeMemoryBlocksCount(new_count)
+            self.max_blocks_count = new_count
+            
+            change_info = f"Такт {self.total_tacts}: {old_count} → {new_count} разделов"
+            self.memory_changes.append(change_info)
+    
+    #запуск симуляции
+    #при resume=True прогон продолжается с текущего такта (после загрузки контрольной точки)
+    def runSimulation(self, resume: bool = False):
+        if not resume:
+            self.total_tacts = 0
+            self.last_checkpoint = 0
+        self.timed_out = False
+        self.cancelled = False
+        
+        if not resume and self.os.log.isEnabled(LogLevel.SUMMARY):
+            self.os.output("СТАРТ", LogLevel.SUMMARY)
+            total_memory_mb = self.os.packet.getTasksMemory()
+            total_memory_gb = total_memory_mb / 1024
+            self.os.output(f"Суммарно RAM пакета: {total_memory_gb:.1f} ГБ", LogLevel.SUMMARY)
+            self.os.output(f"Всего задач: {self.os.packet.getTasksCount()}", LogLevel.SUMMARY)
+            self.os.output(f"MATH задач: {self.os.packet.getMathTasks()}", LogLevel.SUMMARY)
+            self.os.output(f"INOUT задач: {self.os.packet.getInOutTasks()}", LogLevel.SUMMARY)
+            self.os.output(f"Начальное количество разделов памяти: {self.max_blocks_count}", LogLevel.SUMMARY)
+            if self.cpu_count:
+                self.os.output(f"Количество ядер: {self.cpu_count}", LogLevel.SUMMARY)
+            if self.os.scheduler.name != 'fifo':
+                self.os.output(f"Политика планирования: {self.os.scheduler.name}", LogLevel.SUMMARY)
+            if self.os.allocator is not None:
+                self.os.output(f"Модель памяти: {self.os.allocator.name}, {self.os.allocator.capacity} МБ", LogLevel.SUMMARY)
+            if self.os.preemption is not None:
+                self.os.output(f"Квант времени: {self.quantum} тактов, подгрузка: {self.swap_cost} тактов", LogLevel.SUMMARY)
+        
+        while self.total_tacts < self.max_tacts:
+            if self.control is not None and self.control.shouldStop():
+                self.cancelled = True
+                break
+            
+            if self.event_driven:
+                self.total_tacts += self.os.skipQuietTacts(self.max_tacts - self.total_tacts)
+                if self.total_tacts >= self.max_tacts:
+                    break
+            
+            self.total_tacts += 1
+            self.os.runTact()
+
+            if self.isSimOver():
+                break
+
+            if self.time_limit is not None and time.time() - self.start_time >= self.time_limit:
+                self.timed_out = True
+                break
+
+            if self.checkpoint_every and self.total_tacts - self.last_checkpoint >= self.checkpoint_every:
+                self.saveCheckpoint(self.checkpoint_file)
+
+        self.end_time = time.time()
+        
+        if self.os.log.isEnabled(LogLevel.SUMMARY):
+            self.os.output("\nФИНИШ", LogLevel.SUMMARY)
+            if self.cancelled:
+                self.os.output(f"Симуляция отменена после {self.total_tacts} тактов", LogLevel.SUMMARY)
+            else:
+                self.os.output(f"Все задачи выполнены за {self.total_tacts} тактов", LogLevel.SUMMARY)
+            self.os.output(f"Финальное количество разделов памяти: {self.max_blocks_count}", LogLevel.SUMMARY)
+            if self.os.allocator is not None:
+                self.os.output(f"Средняя фрагментация памяти: {self.os.allocator.meanFragmentation() * 100:.1f}%", LogLevel.SUMMARY)
+            if self.os.rejected_tasks:
+                self.os.output(f"Отклонено задач, не помещающихся в память: {len(self.os.rejected_tasks)}", LogLevel.SUMMARY)
+            if self.os.preemption is not None:
+                self.os.output(f"Вытеснений: {self.os.preemption.preemptions}, тактов подгрузки: {self.os.preemption.swap_tacts}", LogLevel.SUMMARY)
+                for name, times in self.os.task_times.summary().items():
+                    if times['count']:
+                        self.os.output(f"{name}: среднее время оборота {times['mean_turnaround']:.1f}, "
+                                       f"отклика {times['mean_response']:.1f} тактов", LogLevel.SUMMARY)
+            
+            if len(self.memory_changes) > 1:
+                self.os.output("\nИстория изменений разделов памяти:", LogLevel.SUMMARY)
+                for change in self.memory_changes:
+                    self.os.output(f"  {change}", LogLevel.SUMMARY)
+    
+    #проверка условий завершения симуляции
+    def isSimOver(self) -> bool:
+        return (
+            not self.os.hasWaitingTasks() and 
+            len(self.os.running_tasks) == 0 and 
+            len(self.os.io_wait_tasks) == 0 and
+            all(task is None or task.state.value == "ВЫПОЛНЕНА" for task in self.os.memory_blocks)
+        )
+    
+    #получить время выполнения симуляции
+    def getRunTime(self) -> float:
+        return self.end_time - self.start_time
+    
+    #история изменения разделов памяти
+    def getMemoryChanges(self) -> list:
+        return self.memory_changes.copy()
+    
+    #сброс симуляции к начальному состоянию
+    #пакет не перечитывается, поэтому повторный прогон с другими max_tacts или количеством разделов дешев
+    def reset(self, max_tacts: int = None, max_blocks_count: int = None):
+        if max_tacts is not None:
+            self.max_tacts = max_tacts
+        if max_blocks_count is not None:
+            self.max_blocks_count = max_blocks_count
+        if self.os:
+            self.os.reset(self.max_blocks_count)
+            self.os.history.reserve(min(self.max_tacts, MAX_RESERVE))
+    
+        self.start_time = time.time()
+        self.end_time = 0
+        self.total_tacts = 0
+        self.timed_out = False
+        self.cancelled = False
+        self.memory_changes = [f"Начальное количество: {self.max_blocks_count} разделов"]
+    
+    #не изменился ли файл пакета с момента загрузки; reset() повторяет прогон загруженного пакета,
+    #поэтому для измененного файла нужна новая симуляция
+    def isPacketCurrent(self) -> bool:
+        try:
+            return fileStamp(self.json_file) == self.packet_stamp
+        except OSError:
+            return False
+    
+    #запуск симуляции
+    def start(self):
+        self.runSimulation()
+    
+    #продолжение симуляции с текущего такта
+    def resume(self):
+        self.runSimulation(resume=True)
+    
+    #сохранение контрольной точки: состояние ОС и параметры симуляции
+    def saveCheckpoint(self, filename: str):
+        meta, arrays = captureOS(self.os)
+        meta['simulation'] = {
+            'settings': {
+                'max_blocks_count': self.max_blocks_count,
+                'ram': self.ram,
+                'json_file': self.json_file,
+                'max_tacts': self.max_tacts,
+                'event_driven': self.event_driven,
+                'streaming': self.streaming,
+                'cpu_count': self.cpu_count,
+                'scheduler': self.os.scheduler.name,
+                'memory_model': self.memory_model,
+                'partition_sizes': self.partition_sizes,
+                'controller': self.os.controller.name,
+                'quantum': self.quantum,
+                'swap_cost': self.swap_cost
+            },
+            'total_tacts': self.total_tacts,
+            'memory_changes': self.memory_changes
+        }
+        writeCheckpoint(filename, meta, arrays)
+        self.last_checkpoint = self.total_tacts
+    
+    #симуляция, восстановленная из контрольной точки; продолжается вызовом resume()
+    #overrides заменяет сохраненные параметры, например max_tacts или event_driven,
+    #так что из одной точки можно запустить несколько разных продолжений
+    @classmethod
+    def fromCheckpoint(cls, filename: str, **overrides) -> 'Simulation':
+        meta, arrays = readCheckpoint(filename)
+        saved = meta['simulation']
+        max_blocks_count = overrides.pop('max_blocks_count', None)
+        settings = dict(saved['settings'])
+        settings.update(overrides)
+        sim = cls(**settings)
+        restoreOS(sim.os, meta, arrays)
+        sim.os.history.reserve(min(sim.max_tacts, MAX_RESERVE))
+        sim.max_blocks_count = sim.os.max_blocks_count
+        sim.total_tacts = saved['total_tacts']
+        sim.last_checkpoint = sim.total_tacts
+        sim.memory_changes = list(saved['memory_changes'])
+        if max_blocks_count is not None and max_blocks_count != sim.max_blocks_count:
+            sim.changeMemoryBlocks(max_blocks_count)
+        return sim
+
+"""
+if __name__ == "__main__":
+    sim = Simulation(
+        max_blocks_count=8,
+        ram=16,
+        json_file="ready_packets/balanced_big_pack.json",
+        max_tacts=100  # Количество тактов как параметр класса
+    )
+    sim.start()
 """
\ No newline at end of file
@@ -1,314 +1,423 @@
-import pyqtgraph as pg
-import numpy as np
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QGridLayout, QLabel)
-from PyQt6.QtCore import Qt
-
-class Statistics(QWidget):    
-    #конструктор
-    def __init__(self, simulation):
-        super().__init__()
-        self.simulation = simulation
-        self.initUI()
-    
-    #сбор данных из истории выполнения ОС
-    def collectRealData(self):
-        history = self.simulation.os.history.copy()
-        # Добавляем счетчики состояний CPU
-        history['cpu_state_counts'] = self.simulation.os.getCpuStateCounts()
-        return history
-    
-    #инициализация визуализации
-    def initUI(self):
-        main_layout = QVBoxLayout()
-        
-        title = QLabel("СТАТИСТИКА РАБОТЫ ОПЕРАЦИОННОЙ СИСТЕМЫ")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 14pt; font-weight: bold; margin: 10px; color: #2c3e50;")
-        main_layout.addWidget(title)
-        
-        self.info_container = QWidget()
-        self.info_layout = QVBoxLayout(self.info_container)
-        main_layout.addWidget(self.info_container)
-        
-        self.setupGraphs()
-        
-        graphs_container = QWidget()
-        self.graphs_layout = QGridLayout(graphs_container)
-        self.graphs_layout.setSpacing(10)
-        self.graphs_layout.setContentsMargins(10, 10, 10, 10)
-        
-        graphs_info = [
-            (self.memory_plot, "Использование разделов памяти", ["Используемые разделы"]),
-            (self.cpu_plot, "Распределение состояний процессора", [
-                "Красный - ПРОСТОЙ", 
-                "Зеленый - ВЫПОЛНЕНИЕ", 
-                "Синий - ОЖИДАНИЕ В/В", 
-                "Оранжевый - ПЕРЕГРУЗКА"
-            ]),
-            (self.tasks_plot, "Статусы задач", [
-                "ОЖИДАНИЕ", 
-                "ВЫПОЛНЕНИЕ", 
-                "ВЫПОЛНЕНО"
-            ]),
-            (self.types_plot, "Типы задач", [
-                "MATH задачи", 
-                "INOUT задачи"
-            ]),
-            (self.free_mem_plot, "Свободная память", ["Свободная память %"]),
-            (self.efficiency_plot, "Эффективность выполнения", ["% завершенных задач"])
-        ]
-        
-        for i, (graph, title_text, legends) in enumerate(graphs_info):
-            row = i // 3
-            col = i % 3
-            
-            graph_container = QWidget()
-            graph_container.setStyleSheet("background-color: white; border: 1px solid #ccc; border-radius: 5px;")
-            graph_layout = QVBoxLayout(graph_container)
-            graph_layout.setContentsMargins(5, 5, 5, 5)
-            graph_layout.setSpacing(5)
-            
-            title_label = QLabel(title_text)
-            title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            title_label.setStyleSheet("font-size: 10pt; font-weight: bold; color: #3333FF; padding: 5px;")
-            graph_layout.addWidget(title_label)
-            
-            if legends:
-                legend_container = QWidget()
-                legend_layout = QVBoxLayout(legend_container)
-                legend_layout.setContentsMargins(5, 0, 5, 0)
-                legend_layout.setSpacing(2)
-                
-                for legend_text in legends:
-                    legend_label = QLabel(legend_text)
-                    legend_label.setStyleSheet("font-size: 8pt; color: #666;")
-                    legend_layout.addWidget(legend_label)
-                
-                graph_layout.addWidget(legend_container)
-                
-            graph.setMinimumSize(300, 180)
-            graph.setMaximumSize(300, 180)
-            graph_layout.addWidget(graph)
-            
-            self.graphs_layout.addWidget(graph_container, row, col)
-        
-        main_layout.addWidget(graphs_container)
-        self.setLayout(main_layout)
-        
-        self.updateCharts()
-    
-    #обновление информации о симуляции
-    def updateSimulationInfo(self):
-        for i in reversed(range(self.info_layout.count())):
-            widget = self.info_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        
-        history = self.collectRealData()
-        
-        info_text = f"Всего тактов: {self.simulation.total_tacts} | " \
-                   f"MATH задач: {history['task_types']['MATH']} | " \
-                   f"INOUT задач: {history['task_types']['INOUT']} | " \
-                   f"Разделов памяти: {self.simulation.max_blocks_count}"
-        info_label = QLabel(info_text)
-        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info_label.setStyleSheet("font-size: 12pt; color: #666; margin: 5px;")
-        self.info_layout.addWidget(info_label)
-        
-        memory_changes = self.simulation.getMemoryChanges()
-        if len(memory_changes) > 1:
-            changes_text = "Изменения памяти: " + " → ".join([change.split(": ")[1].split(" ")[0] for change in memory_changes])
-            changes_label = QLabel(changes_text)
-            changes_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            changes_label.setStyleSheet("font-size: 11pt; color: #2c3e50; margin: 3px; font-style: italic;")
-            self.info_layout.addWidget(changes_label)
-    
-    #настройка графиков
-    def setupGraphs(self):
-        self.memory_plot = pg.PlotWidget()
-        self.memory_plot.setBackground('w')
-        self.memory_plot.setLabel('left', 'Количество разделов')
-        self.memory_plot.setLabel('bottom', 'Такты')
-        self.memory_plot.showGrid(x=True, y=True, alpha=0.3)
-        self.memory_plot.setYRange(0, self.simulation.max_blocks_count)
-        self.memory_curve = self.memory_plot.plot(pen=pg.mkPen('b', width=3))
-        
-        self.cpu_plot = pg.PlotWidget()
-        self.cpu_plot.setBackground('w')
-        self.cpu_plot.setLabel('left', 'Количество тактов')
-        self.cpu_plot.setLabel('bottom', 'Состояния процессора')
-        self.cpu_plot.showGrid(x=True, y=True, alpha=0.3)
-        
-        self.cpu_bars = None
-            
-        self.tasks_plot = pg.PlotWidget()
-        self.tasks_plot.setBackground('w')
-        self.tasks_plot.setLabel('left', 'Количество задач')
-        self.tasks_plot.setLabel('bottom', 'Такты')
-        self.tasks_plot.showGrid(x=True, y=True, alpha=0.3)
-        
-        task_colors = {
-            'WAIT': '#ff6b6b',
-            'RUN': '#4ecdc4',  
-            'READY': '#45b7d1'
-        }
-        
-        self.task_curves = {}
-        for state, color in task_colors.items():
-            self.task_curves[state] = self.tasks_plot.plot(pen=pg.mkPen(color, width=3))
-            
-        self.types_plot = pg.PlotWidget()
-        self.types_plot.setBackground('w')
-        self.types_pie = pg.PlotItem()
-        self.types_plot.setCentralItem(self.types_pie)
-        
-        self.free_mem_plot = pg.PlotWidget()
-        self.free_mem_plot.setBackground('w')
-        self.free_mem_plot.setLabel('left', 'Проценты')
-        self.free_mem_plot.setLabel('bottom', 'Такты')
-        self.free_mem_plot.showGrid(x=True, y=True, alpha=0.3)
-        self.free_mem_plot.setYRange(0, 100)
-        self.free_mem_curve = self.free_mem_plot.plot(pen=pg.mkPen('g', width=3))
-        
-        self.efficiency_plot = pg.PlotWidget()
-        self.efficiency_plot.setBackground('w')
-        self.efficiency_plot.setLabel('left', 'Проценты')
-        self.efficiency_plot.setLabel('bottom', 'Такты')
-        self.efficiency_plot.showGrid(x=True, y=True, alpha=0.3)
-        self.efficiency_plot.setYRange(0, 100)
-        self.efficiency_curve = self.efficiency_plot.plot(pen=pg.mkPen('purple', width=3))
-    
-    #обновление графиков реальными данными
-    def updateCharts(self):
-        self.updateSimulationInfo()
-        
-        history = self.collectRealData()
-        
-        if not history['tacts']:
-            self.showNoDataMessage()
-            return
-            
-        tacts = history['tacts']
-        
-        if history['memory_blocks_used']:
-            self.memory_curve.setData(tacts, history['memory_blocks_used'])
-            
-            self.memory_plot.setYRange(0, self.simulation.max_blocks_count)
-            
-        if 'cpu_state_counts' in history:
-            state_counts = history['cpu_state_counts']
-            
-            print("=== ДАННЫЕ СОСТОЯНИЙ CPU ===")
-            print(f"Всего тактов: {len(history['tacts'])}")
-            print(f"Счетчики состояний: {state_counts}")
-            print("============================")
-            
-            all_states = ["ПРОСТОЙ", "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ", "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА", "ПЕРЕГРУЗКА"]
-            for state in all_states:
-                if state not in state_counts:
-                    state_counts[state] = 0
-                    
-            states = list(state_counts.keys())
-            counts = list(state_counts.values())
-            
-            colors = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#ffa726']
-            
-            if self.cpu_bars:
-                self.cpu_plot.removeItem(self.cpu_bars)
-                
-            bg = pg.BarGraphItem(x=range(len(states)), height=counts, width=0.6, brushes=colors)
-            self.cpu_plot.addItem(bg)
-            self.cpu_bars = bg
-            
-            self.cpu_plot.getAxis('bottom').setTicks([[(i, self.getShortStateName(state)) for i, state in enumerate(states)]])
-            self.cpu_plot.setXRange(-0.5, len(states) - 0.5)
-            
-            max_count = max(counts) if counts else 1
-            self.cpu_plot.setYRange(0, max_count * 1.1)
-            
-        for state, curve in self.task_curves.items():
-            if state in history['task_states'] and history['task_states'][state]:
-                curve.setData(tacts, history['task_states'][state])
-                
-        self.updatePieChart()
-        
-        if history['memory_usage']:
-            self.free_mem_curve.setData(tacts, history['memory_usage'])
-            
-        if history['task_states']['READY']:
-            total_tasks = sum(history['task_types'].values())
-            completed_tasks = history['task_states']['READY']
-            completion_rate = [(tasks / total_tasks) * 100 if total_tasks > 0 else 0 
-                            for tasks in completed_tasks]
-            self.efficiency_curve.setData(tacts, completion_rate)
-
-    #получение сокращенного названия состояния процессора
-    def getShortStateName(self, full_name: str) -> str:
-        short_names = {
-            "ПРОСТОЙ": "ПРОСТОЙ",
-            "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": "ВЫЧИСЛЕНИЯ", 
-            "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": "ОЖИДАНИЕ В/В",
-            "ПЕРЕГРУЗКА": "ПЕРЕГРУЗКА"
-        }
-        return short_names.get(full_name, full_name)
-    
-    #вывод сообщения об отсутствии данных
-    def showNoDataMessage(self):
-        for graph in [self.memory_plot, self.cpu_plot, self.tasks_plot, 
-                     self.free_mem_plot, self.efficiency_plot]:
-            graph.clear()
-            text = pg.TextItem("Нет данных для отображения", color='red', anchor=(0.5, 0.5))
-            text.setPos(5, 0)
-            graph.addItem(text)
-    
-    #обновление круговой диаграммы
-    def updatePieChart(self):
-        history = self.collectRealData()
-        math_count = history['task_types']['MATH']
-        inout_count = history['task_types']['INOUT']
-        
-        self.types_pie.clear()
-        
-        if math_count == 0 and inout_count == 0:
-            text = pg.TextItem("Нет данных", color='red', anchor=(0.5, 0.5))
-            text.setPos(0, 0)
-            self.types_pie.addItem(text)
-            return
-            
-        total_tasks = math_count + inout_count
-        math_angle = 2 * np.pi * math_count / total_tasks
-        
-        math_angles = np.linspace(0, math_angle, 100)
-        math_x = np.cos(math_angles) * 0.8
-        math_y = np.sin(math_angles) * 0.8
-        math_curve = pg.PlotCurveItem(math_x, math_y, pen=pg.mkPen('#ff6b6b', width=4))
-        self.types_pie.addItem(math_curve)
-        
-        inout_angles = np.linspace(math_angle, 2 * np.pi, 100)
-        inout_x = np.cos(inout_angles) * 0.8
-        inout_y = np.sin(inout_angles) * 0.8
-        inout_curve = pg.PlotCurveItem(inout_x, inout_y, pen=pg.mkPen('#4ecdc4', width=4))
-        self.types_pie.addItem(inout_curve)
-        
-        text_math = pg.TextItem("MATH", color='#ff6b6b', anchor=(0.5, 0.5))
-        text_math.setPos(0.4, 0.4)
-        self.types_pie.addItem(text_math)
-        
-        text_inout = pg.TextItem("INOUT", color='#4ecdc4', anchor=(0.5, 0.5))
-        text_inout.setPos(-0.4, -0.4)
-        self.types_pie.addItem(text_inout)
-        
-        if total_tasks > 0:
-            percent_math = pg.TextItem(f"{math_count/total_tasks*100:.1f}%", 
-                                     color='#ff6b6b', anchor=(0.5, 0.5))
-            percent_math.setPos(0.2, 0.2)
-            self.types_pie.addItem(percent_math)
-            
-            percent_inout = pg.TextItem(f"{inout_count/total_tasks*100:.1f}%", 
-                                      color='#4ecdc4', anchor=(0.5, 0.5))
-            percent_inout.setPos(-0.2, -0.2)
-            self.types_pie.addItem(percent_inout)
-    
-    #метод для полного обновления статистики после новой симуляции
-    def refreshStatistics(self):
+import pyqtgraph as pg
+import numpy as np
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QGridLayout, QLabel)
+from PyQt6.QtCore import Qt, QTimer
+from downsample import MinMaxLevels
+
+#частота обновления графиков во время прогона, кадров в секунду
+LIVE_FPS = 10
+
+#состояния процессора в порядке столбцов диаграммы и цвета столбцов
+CPU_STATE_NAMES = ["ПРОСТОЙ", "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ", "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА", "ПЕРЕГРУЗКА"]
+CPU_STATE_COLORS = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#ffa726']
+
+#точек в дуге круговой диаграммы
+PIE_ARC_POINTS = 100
+
+#ширина графика в пикселях, пока она еще не известна
+DEFAULT_PLOT_WIDTH = 300
+
+#столбцы истории, которые выводятся на графики прореженными
+DECIMATED_COLUMNS = ('memory_blocks_used', 'WAIT', 'RUN', 'READY', 'memory_usage')
+
+class Statistics(QWidget):    
+    #конструктор
+    def __init__(self, simulation):
+        super().__init__()
+        self.simulation = simulation
+        self.drawn_history = None  #история, такты которой выведены на графики
+        self.drawn_size = 0  #сколько тактов этой истории уже выведено
+        self.completion_rate = np.empty(0, dtype=np.float64)  #% завершенных задач по выведенным тактам
+        self.levels = {name: MinMaxLevels() for name in DECIMATED_COLUMNS}  #уровни прореживания столбцов
+        self.drawn_columns = {}  #выведенные такты столбцов истории и % завершенных задач
+        self.drawn_keys = {}  #по графику: сколько тактов, какой участок и при какой ширине выведено
+        self.pie_counts = None  #количество задач по типам на круговой диаграмме
+        self.no_data_items = []  #надписи об отсутствии данных
+        #во время прогона графики обновляются по таймеру не чаще LIVE_FPS раз в секунду
+        self.live_timer = QTimer(self)
+        self.live_timer.timeout.connect(self.updateLive)
+        self.initUI()
+    
+    #сбор данных из истории выполнения ОС
+    #столбцы истории передаются без копирования
+    def collectRealData(self):
+        history = self.simulation.os.history.views()
+        # Добавляем счетчики состояний CPU
+        history['cpu_state_counts'] = self.simulation.os.getCpuStateCounts()
+        return history
+    
+    #инициализация визуализации
+    def initUI(self):
+        main_layout = QVBoxLayout()
+        
+        title = QLabel("СТАТИСТИКА РАБОТЫ ОПЕРАЦИОННОЙ СИСТЕМЫ")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title.setStyleSheet("font-size: 14pt; font-weight: bold; margin: 10px; color: #2c3e50;")
+        main_layout.addWidget(title)
+        
+        self.info_container = QWidget()
+        self.info_layout = QVBoxLayout(self.info_container)
+        main_layout.addWidget(self.info_container)
+        
+        self.info_label = QLabel()
+        self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.info_label.setStyleSheet("font-size: 12pt; color: #666; margin: 5px;")
+        self.info_layout.addWidget(self.info_label)
+        
+        self.changes_label = QLabel()
+        self.changes_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.changes_label.setStyleSheet("font-size: 11pt; color: #2c3e50; margin: 3px; font-style: italic;")
+        self.info_layout.addWidget(self.changes_label)
+        
+        self.setupGraphs()
+        
+        graphs_container = QWidget()
+        self.graphs_layout = QGridLayout(graphs_container)
+        self.graphs_layout.setSpacing(10)
+        self.graphs_layout.setContentsMargins(10, 10, 10, 10)
+        
+        graphs_info = [
+            (self.memory_plot, "Использование разделов памяти", ["Используемые разделы"]),
+            (self.cpu_plot, "Распределение состояний процессора", [
+                "Красный - ПРОСТОЙ", 
+                "Зеленый - ВЫПОЛНЕНИЕ", 
+                "Синий - ОЖИДАНИЕ В/В", 
+                "Оранжевый - ПЕРЕГРУЗКА"
+            ]),
+            (self.tasks_plot, "Статусы задач", [
+                "ОЖИДАНИЕ", 
+                "ВЫПОЛНЕНИЕ", 
+                "ВЫПОЛНЕНО"
+            ]),
+            (self.types_plot, "Типы задач", [
+                "MATH задачи", 
+                "INOUT задачи"
+            ]),
+            (self.free_mem_plot, "Свободная память", ["Свободная память %"]),
+            (self.efficiency_plot, "Эффективность выполнения", ["% завершенных задач"])
+        ]
+        
+        for i, (graph, title_text, legends) in enumerate(graphs_info):
+            row = i // 3
+            col = i % 3
+            
+            graph_container = QWidget()
+            graph_container.setStyleSheet("background-color: white; border: 1px solid #ccc; border-radius: 5px;")
+            graph_layout = QVBoxLayout(graph_container)
+            graph_layout.setContentsMargins(5, 5, 5, 5)
+            graph_layout.setSpacing(5)
+            
+            title_label = QLabel(title_text)
+            title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            title_label.setStyleSheet("font-size: 10pt; font-weight: bold; color: #3333FF; padding: 5px;")
+            graph_layout.addWidget(title_label)
+            
+            if legends:
+                legend_container = QWidget()
+                legend_layout = QVBoxLayout(legend_container)
+                legend_layout.setContentsMargins(5, 0, 5, 0)
+                legend_layout.setSpacing(2)
+                
+                for legend_text in legends:
+                    legend_label = QLabel(legend_text)
+                    legend_label.setStyleSheet("font-size: 8pt; color: #666;")
+                    legend_layout.addWidget(legend_label)
+                
+                graph_layout.addWidget(legend_container)
+                
+            graph.setMinimumSize(300, 180)
+            graph.setMaximumSize(300, 180)
+            graph_layout.addWidget(graph)
+            
+            self.graphs_layout.addWidget(graph_container, row, col)
+        
+        main_layout.addWidget(graphs_container)
+        self.setLayout(main_layout)
+        
+        self.updateCharts()
+    
+    #обновление информации о симуляции
+    def updateSimulationInfo(self):
+        task_types = self.simulation.os.history.task_types
+        
+        self.info_label.setText(f"Всего тактов: {self.simulation.total_tacts} | "
+                                f"MATH задач: {task_types['MATH']} | "
+                                f"INOUT задач: {task_types['INOUT']} | "
+                                f"Разделов памяти: {self.simulation.max_blocks_count}")
+        
+        memory_changes = self.simulation.getMemoryChanges()
+        if len(memory_changes) > 1:
+            self.changes_label.setText("Изменения памяти: " + " → ".join([change.split(": ")[1].split(" ")[0] for change in memory_changes]))
+        self.changes_label.setVisible(len(memory_changes) > 1)
+    
+    #настройка графиков
+    def setupGraphs(self):
+        self.memory_plot = pg.PlotWidget()
+        self.memory_plot.setBackground('w')
+        self.memory_plot.setLabel('left', 'Количество разделов')
+        self.memory_plot.setLabel('bottom', 'Такты')
+        self.memory_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.memory_plot.setYRange(0, self.simulation.max_blocks_count)
+        self.memory_curve = self.memory_plot.plot(pen=pg.mkPen('b', width=3))
+        
+        self.cpu_plot = pg.PlotWidget()
+        self.cpu_plot.setBackground('w')
+        self.cpu_plot.setLabel('left', 'Количество тактов')
+        self.cpu_plot.setLabel('bottom', 'Состояния процессора')
+        self.cpu_plot.showGrid(x=True, y=True, alpha=0.3)
+        
+        #столбцы создаются один раз, дальше меняется только их высота
+        self.cpu_bars = pg.BarGraphItem(x=range(len(CPU_STATE_NAMES)), height=[0] * len(CPU_STATE_NAMES),
+                                        width=0.6, brushes=CPU_STATE_COLORS)
+        self.cpu_plot.addItem(self.cpu_bars)
+        self.cpu_plot.getAxis('bottom').setTicks([[(i, self.getShortStateName(state)) for i, state in enumerate(CPU_STATE_NAMES)]])
+        self.cpu_plot.setXRange(-0.5, len(CPU_STATE_NAMES) - 0.5)
+            
+        self.tasks_plot = pg.PlotWidget()
+        self.tasks_plot.setBackground('w')
+        self.tasks_plot.setLabel('left', 'Количество задач')
+        self.tasks_plot.setLabel('bottom', 'Такты')
+        self.tasks_plot.showGrid(x=True, y=True, alpha=0.3)
+        
+        task_colors = {
+            'WAIT': '#ff6b6b',
+            'RUN': '#4ecdc4',  
+            'READY': '#45b7d1'
+        }
+        
+        self.task_curves = {}
+        for state, color in task_colors.items():
+            self.task_curves[state] = self.tasks_plot.plot(pen=pg.mkPen(color, width=3))
+            
+        self.types_plot = pg.PlotWidget()
+        self.types_plot.setBackground('w')
+        self.types_pie = pg.PlotItem()
+        self.types_plot.setCentralItem(self.types_pie)
+        self.setupPieChart()
+        
+        self.free_mem_plot = pg.PlotWidget()
+        self.free_mem_plot.setBackground('w')
+        self.free_mem_plot.setLabel('left', 'Проценты')
+        self.free_mem_plot.setLabel('bottom', 'Такты')
+        self.free_mem_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.free_mem_plot.setYRange(0, 100)
+        self.free_mem_curve = self.free_mem_plot.plot(pen=pg.mkPen('g', width=3))
+        
+        self.efficiency_plot = pg.PlotWidget()
+        self.efficiency_plot.setBackground('w')
+        self.efficiency_plot.setLabel('left', 'Проценты')
+        self.efficiency_plot.setLabel('bottom', 'Такты')
+        self.efficiency_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.efficiency_plot.setYRange(0, 100)
+        self.efficiency_curve = self.efficiency_plot.plot(pen=pg.mkPen('purple', width=3))
+        
+        #кривые графиков: кривая, уровни прореживания, выводимые значения
+        #% завершенных задач пропорционален числу завершенных задач, поэтому прореживается по его уровням
+        self.plot_curves = {
+            self.memory_plot: [(self.memory_curve, 'memory_blocks_used', 'memory_blocks_used')],
+            self.tasks_plot: [(curve, state, state) for state, curve in self.task_curves.items()],
+            self.free_mem_plot: [(self.free_mem_curve, 'memory_usage', 'memory_usage')],
+            self.efficiency_plot: [(self.efficiency_curve, 'READY', 'completion_rate')]
+        }
+        #при масштабировании, прокрутке и включении автомасштаба видимый участок прореживается заново
+        for plot in self.plot_curves:
+            plot.sigXRangeChanged.connect(lambda *args, plot=plot: self.redrawPlot(plot))
+            plot.getViewBox().sigStateChanged.connect(lambda *args, plot=plot: self.redrawPlot(plot))
+    
+    #обновление графиков реальными данными
+    def updateCharts(self):
+        self.updateSimulationInfo()
+        
+        history = self.simulation.os.history
+        size = len(history)
+        
+        if size == 0:
+            self.showNoDataMessage()
+            return
+        
+        self.hideNoDataMessage()
+        self.drawHistory(history, size)
+        
+        state_counts = self.simulation.os.getCpuStateCounts()
+        
+        print("=== ДАННЫЕ СОСТОЯНИЙ CPU ===")
+        print(f"Всего тактов: {size}")
+        print(f"Счетчики состояний: {state_counts}")
+        print("============================")
+        
+        self.updateCpuBars(state_counts)
+        self.updatePieChart()
+    
+    #начало обновления графиков во время прогона
+    def startLive(self, fps: int = LIVE_FPS):
+        self.hideNoDataMessage()
+        self.live_timer.start(max(1, round(1000 / fps)))
+    
+    #окончание обновления графиков во время прогона
+    def stopLive(self):
+        self.live_timer.stop()
+    
+    #кадр обновления во время прогона: на графики добавляются только новые такты
+    #история дописывается потоком симуляции, поэтому сначала берется ее размер,
+    #а столбцы читаются только до него (записанные такты потом не меняются)
+    def updateLive(self):
+        history = self.simulation.os.history
+        if not self.drawHistory(history, len(history)):
+            return
+        self.updateSimulationInfo()
+        self.updateCpuBars(self.simulation.os.getCpuStateCounts())
+        self.updatePieChart()
+    
+    #вывод первых size тактов истории на графики; возвращает False, если новых тактов нет
+    #уровни прореживания и % завершенных задач досчитываются только для новых тактов
+    def drawHistory(self, history, size: int) -> bool:
+        if history is not self.drawn_history or size < self.drawn_size:
+            self.drawn_history = history
+            self.drawn_size = 0
+            self.drawn_keys = {}
+            for levels in self.levels.values():
+                levels.clear()
+        start = self.drawn_size
+        if size == start:
+            return False
+        
+        columns = {name: history.column(name)[:size] for name in ('tacts', *DECIMATED_COLUMNS)}
+        for name, levels in self.levels.items():
+            levels.update(columns[name])
+        self.updateCompletionRate(columns['READY'], start, sum(history.task_types.values()))
+        columns['completion_rate'] = self.completion_rate[:size]
+        self.drawn_columns = columns
+        self.drawn_size = size
+        
+        for plot in self.plot_curves:
+            self.redrawPlot(plot)
+        self.memory_plot.setYRange(0, self.simulation.max_blocks_count)
+        return True
+    
+    #вывод видимого участка кривых графика: на пиксель ширины приходится не больше двух точек
+    #(наименьшее и наибольшее значение), так что время отрисовки не зависит от длины прогона
+    def redrawPlot(self, plot):
+        if not self.drawn_size:
+            return
+        tacts = self.drawn_columns['tacts']
+        view_box = plot.getViewBox()
+        if view_box.autoRangeEnabled()[0]:
+            start, end = 0, self.drawn_size
+        else:
+            (left, right), _ = view_box.viewRange()
+            start = max(int(np.searchsorted(tacts, left)) - 1, 0)
+            end = min(int(np.searchsorted(tacts, right, side='right')) + 1, self.drawn_size)
+        max_buckets = int(view_box.width()) or DEFAULT_PLOT_WIDTH
+        key = (self.drawn_size, start, end, max_buckets)
+        if self.drawn_keys.get(plot) == key:
+            return
+        self.drawn_keys[plot] = key
+        for curve, levels_name, values_name in self.plot_curves[plot]:
+            points = self.levels[levels_name].select(start, end, max_buckets)
+            curve.setData(tacts[points], self.drawn_columns[values_name][points], skipFiniteCheck=True)
+    
+    #% завершенных задач для тактов с start по len(completed_tasks); массив растет удвоением
+    def updateCompletionRate(self, completed_tasks: np.ndarray, start: int, total_tasks: int):
+        size = len(completed_tasks)
+        if size > len(self.completion_rate):
+            grown = np.empty(max(size, len(self.completion_rate) * 2), dtype=np.float64)
+            grown[:start] = self.completion_rate[:start]
+            self.completion_rate = grown
+        if total_tasks > 0:
+            np.multiply(completed_tasks[start:], 100 / total_tasks, out=self.completion_rate[start:size])
+        else:
+            self.completion_rate[start:size] = 0
+    
+    #высота столбцов состояний процессора
+    def updateCpuBars(self, state_counts: dict):
+        counts = [state_counts.get(state, 0) for state in CPU_STATE_NAMES]
+        self.cpu_bars.setOpts(height=counts)
+        max_count = max(counts) if counts else 1
+        self.cpu_plot.setYRange(0, max(max_count, 1) * 1.1)
+
+    #получение сокращенного названия состояния процессора
+    def getShortStateName(self, full_name: str) -> str:
+        short_names = {
+            "ПРОСТОЙ": "ПРОСТОЙ",
+            "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ": "ВЫЧИСЛЕНИЯ", 
+            "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА": "ОЖИДАНИЕ В/В",
+            "ПЕРЕГРУЗКА": "ПЕРЕГРУЗКА"
+        }
+        return short_names.get(full_name, full_name)
+    
+    #вывод сообщения об отсутствии данных
+    #элементы графиков не удаляются: у кривых убираются данные, чтобы следующий прогон вывел их снова
+    def showNoDataMessage(self):
+        self.hideNoDataMessage()
+        self.drawn_history = None
+        self.drawn_size = 0
+        self.drawn_keys = {}
+        for curve in [self.memory_curve, self.free_mem_curve, self.efficiency_curve, *self.task_curves.values()]:
+            curve.setData([], [])
+        self.cpu_bars.setOpts(height=[0] * len(CPU_STATE_NAMES))
+        for graph in [self.memory_plot, self.cpu_plot, self.tasks_plot, 
+                     self.free_mem_plot, self.efficiency_plot]:
+            text = pg.TextItem("Нет данных для отображения", color='red', anchor=(0.5, 0.5))
+            text.setPos(5, 0)
+            graph.addItem(text)
+            self.no_data_items.append((graph, text))
+    
+    #удаление сообщений об отсутствии данных
+    def hideNoDataMessage(self):
+        for graph, text in self.no_data_items:
+            graph.removeItem(text)
+        self.no_data_items = []
+    
+    #создание элементов круговой диаграммы; дальше меняются только их данные
+    def setupPieChart(self):
+        self.math_arc = pg.PlotCurveItem(pen=pg.mkPen('#ff6b6b', width=4))
+        self.inout_arc = pg.PlotCurveItem(pen=pg.mkPen('#4ecdc4', width=4))
+        
+        text_math = pg.TextItem("MATH", color='#ff6b6b', anchor=(0.5, 0.5))
+        text_math.setPos(0.4, 0.4)
+        text_inout = pg.TextItem("INOUT", color='#4ecdc4', anchor=(0.5, 0.5))
+        text_inout.setPos(-0.4, -0.4)
+        
+        self.percent_math = pg.TextItem("", color='#ff6b6b', anchor=(0.5, 0.5))
+        self.percent_math.setPos(0.2, 0.2)
+        self.percent_inout = pg.TextItem("", color='#4ecdc4', anchor=(0.5, 0.5))
+        self.percent_inout.setPos(-0.2, -0.2)
+        
+        self.pie_items = [self.math_arc, self.inout_arc, text_math, text_inout, self.percent_math, self.percent_inout]
+        for item in self.pie_items:
+            self.types_pie.addItem(item)
+        
+        self.pie_no_data = pg.TextItem("Нет данных", color='red', anchor=(0.5, 0.5))
+        self.pie_no_data.setPos(0, 0)
+        self.types_pie.addItem(self.pie_no_data)
+    
+    #обновление круговой диаграммы; дуги пересчитываются, только если изменилось количество задач
+    def updatePieChart(self):
+        task_types = self.simulation.os.history.task_types
+        math_count = task_types['MATH']
+        inout_count = task_types['INOUT']
+        if self.pie_counts == (math_count, inout_count):
+            return
+        self.pie_counts = (math_count, inout_count)
+        
+        total_tasks = math_count + inout_count
+        self.pie_no_data.setVisible(total_tasks == 0)
+        for item in self.pie_items:
+            item.setVisible(total_tasks > 0)
+        if total_tasks == 0:
+            return
+            
+        math_angle = 2 * np.pi * math_count / total_tasks
+        
+        math_angles = np.linspace(0, math_angle, PIE_ARC_POINTS)
+        self.math_arc.setData(np.cos(math_angles) * 0.8, np.sin(math_angles) * 0.8)
+        
+        inout_angles = np.linspace(math_angle, 2 * np.pi, PIE_ARC_POINTS)
+        self.inout_arc.setData(np.cos(inout_angles) * 0.8, np.sin(inout_angles) * 0.8)
+        
+        self.percent_math.setText(f"{math_count/total_tasks*100:.1f}%")
+        self.percent_inout.setText(f"{inout_count/total_tasks*100:.1f}%")
+    
+    #метод для полного обновления статистики после новой симуляции
+    def refreshStatistics(self):
         self.updateCharts()
\ No newline at end of file
@@ -0,0 +1,172 @@
+#параллельный перебор параметров симуляции
+import argparse
+import csv
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from batch import buildGrid
+from simulation import Simulation
+from scheduler import SCHEDULERS
+from allocator import MEMORY_MODELS
+from controller import CONTROLLERS
+
+#состояния процессора в порядке столбцов таблицы
+CPU_STATES = ["ПРОСТОЙ", "ВЫПОЛНЕНИЕ ВЫЧИСЛЕНИЙ", "ОЖИДАНИЕ ЗАВЕРШЕНИЯ ВВОДА/ВЫВОДА", "ПЕРЕГРУЗКА"]
+
+#сокращенные названия состояний для заголовка таблицы
+CPU_STATE_COLUMNS = ["idle", "executing", "io_wait", "overloaded"]
+
+#поля строки итоговой таблицы
+TABLE_FIELDS = ['json_file', 'packet_type', 'max_blocks_count', 'ram', 'max_tacts', 'cpu_count', 'scheduler', 'memory_model', 'controller', 'quantum', 'swap_cost', 'status', 'total_tacts',
+                'completed', 'rejected', 'reloads', 'final_blocks', 'preemptions', 'throughput',
+                'math_turnaround', 'math_response', 'inout_turnaround', 'inout_response'] + CPU_STATE_COLUMNS + ['fragmentation', 'run_time']
+
+#запуск одной симуляции в рабочем процессе
+#возвращает только сводку, а не полную историю, чтобы не гонять ее между процессами
+def runSweepItem(config: dict, time_limit: float = None, event_driven: bool = False) -> dict:
+    row = dict(config)
+    try:
+        sim = Simulation(time_limit=time_limit, event_driven=event_driven, **config)
+        sim.start()
+    except Exception as e:
+        row.update(status=f"error: {e}", packet_type='-', total_tacts=0, completed=0, rejected=0, reloads=0, final_blocks=0, preemptions=0, throughput=0.0,
+                   math_turnaround=0.0, math_response=0.0, inout_turnaround=0.0, inout_response=0.0,
+                   fragmentation=0.0, run_time=0.0)
+        row.update(dict.fromkeys(CPU_STATE_COLUMNS, 0))
+        return row
+
+    completed = sim.os.ready_count
+    counts = sim.os.getCpuStateCounts()
+    row.update(
+        status="timeout" if sim.timed_out else "ok",
+        packet_type=sim.os.packet.type.value if sim.os.packet.type else '-',
+        total_tacts=sim.total_tacts,
+        completed=completed,
+        rejected=len(sim.os.rejected_tasks),
+        reloads=sim.os.reload_count,
+        final_blocks=sim.os.max_blocks_count,
+        preemptions=sim.os.preemption.preemptions if sim.os.preemption is not None else 0,
+        fragmentation=sim.os.allocator.meanFragmentation() if sim.os.allocator is not None else 0.0,
+        throughput=completed / sim.total_tacts if sim.total_tacts else 0.0,
+        run_time=sim.getRunTime()
+    )
+    for state, column in zip(CPU_STATES, CPU_STATE_COLUMNS):
+        row[column] = counts.get(state, 0)
+    for name, times in sim.os.task_times.summary().items():
+        row[f"{name.lower()}_turnaround"] = times['mean_turnaround']
+        row[f"{name.lower()}_response"] = times['mean_response']
+    return row
+
+#запуск всех комбинаций параметров на пуле процессов
+#результаты возвращаются в порядке сетки независимо от порядка завершения
+def runSweep(grid: list, time_limit: float = None, workers: int = None, event_driven: bool = False) -> list:
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(grid) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(runSweepItem, grid, [time_limit] * len(grid), [event_driven] * len(grid),
+                                 chunksize=chunksize))
+
+#вывод итоговой таблицы в текстовом виде
+def writeTable(rows: list, stream):
+    cells = [[str(field) for field in TABLE_FIELDS]]
+    for row in rows:
+        cells.append([f"{row[field]:.3f}" if isinstance(row[field], float) else str(row[field])
+                      for field in TABLE_FIELDS])
+    widths = [max(len(line[i]) for line in cells) for i in range(len(TABLE_FIELDS))]
+    for line in cells:
+        stream.write("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() + "\n")
+
+#вывод итоговой таблицы в формате csv
+def writeCsv(rows: list, stream):
+    writer = csv.DictWriter(stream, fieldnames=TABLE_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+#разбор диапазона вида 1-64 или списка значений через запятую
+def parseRange(text: str) -> list:
+    values = []
+    for part in text.split(','):
+        if '-' in part:
+            start, end = part.split('-', 1)
+            values.extend(range(int(start), int(end) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+#разбор списка названий политик планирования через запятую
+def parseNames(text: str) -> list:
+    names = [name.strip() for name in text.split(',') if name.strip()]
+    for name in names:
+        if name not in SCHEDULERS:
+            raise argparse.ArgumentTypeError(f"неизвестная политика: {name}")
+    return names
+
+#разбор списка моделей памяти через запятую
+def parseMemoryModels(text: str) -> list:
+    models = [model.strip() for model in text.split(',') if model.strip()]
+    for model in models:
+        if model not in MEMORY_MODELS:
+            raise argparse.ArgumentTypeError(f"неизвестная модель памяти: {model}")
+    return models
+
+#разбор списка политик изменения количества разделов через запятую
+def parseControllers(text: str) -> list:
+    names = [name.strip() for name in text.split(',') if name.strip()]
+    for name in names:
+        if name not in CONTROLLERS:
+            raise argparse.ArgumentTypeError(f"неизвестная политика: {name}")
+    return names
+
+#разбор аргументов командной строки
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(description="Параллельный перебор параметров симуляции")
+    parser.add_argument('packets', nargs='*',
+                        help="файлы пакетов (по умолчанию все пакеты из ready_packets/)")
+    parser.add_argument('-b', '--blocks', type=parseRange, default=parseRange("1-64"),
+                        help="количество разделов памяти, например 1-64 или 2,4,8")
+    parser.add_argument('-r', '--ram', type=parseRange, default=parseRange("1-128"),
+                        help="объем RAM в ГБ, например 1-128 или 4,16")
+    parser.add_argument('-t', '--tacts', type=parseRange, default=[1000],
+                        help="максимальное количество тактов")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="количество процессов (по умолчанию по числу ядер)")
+    parser.add_argument('-c', '--cpus', type=parseRange, default=[None],
+                        help="количество ядер процессора, например 1-8 (по умолчанию без учета ядер)")
+    parser.add_argument('-s', '--schedulers', type=parseNames, default=['fifo'],
+                        help=f"политики планирования через запятую ({', '.join(SCHEDULERS)})")
+    parser.add_argument('-m', '--memory-models', type=parseMemoryModels, default=[None],
+                        help=f"модели памяти через запятую ({', '.join(MEMORY_MODELS)}); по умолчанию объем памяти не учитывается")
+    parser.add_argument('--controllers', type=parseControllers, default=['shrink'],
+                        help=f"политики изменения количества разделов через запятую ({', '.join(CONTROLLERS)})")
+    parser.add_argument('-q', '--quantums', type=parseRange, default=[None],
+                        help="кванты времени в тактах для вытеснения задач, например 0-4 (0 - без вытеснения)")
+    parser.add_argument('--swap-costs', type=parseRange, default=[0],
+                        help="сколько тактов вытесненная задача подгружается обратно, например 0,1,2")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="ограничение времени одной симуляции в секундах")
+    parser.add_argument('--event-driven', action='store_true',
+                        help="пропускать такты, в которых ничего не меняется")
+    parser.add_argument('-f', '--format', choices=['table', 'csv'], default='table',
+                        help="формат вывода")
+    parser.add_argument('-o', '--output', default=None,
+                        help="файл для вывода (по умолчанию stdout)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parseArgs(argv)
+    packets = args.packets or sorted(glob.glob('ready_packets/*.json'))
+
+    grid = buildGrid(packets, args.blocks, args.ram, args.tacts, args.cpus, args.schedulers, args.memory_models,
+                     args.controllers, args.quantums, args.swap_costs)
+    rows = runSweep(grid, time_limit=args.timeout, workers=args.workers, event_driven=args.event_driven)
+
+    write = writeCsv if args.format == 'csv' else writeTable
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write(rows, f)
+    else:
+        write(rows, sys.stdout)
+
+if __name__ == "__main__":
+    main()
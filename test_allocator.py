@@ -0,0 +1,125 @@
+#проверка распределителей памяти по простому эталону на случайных последовательностях выделения и освобождения
+#
+#эталон перебирает все свободные разделы и области линейно с теми же правилами выбора при равенстве
+import random
+import unittest
+from allocator import FixedPartitions, MaxTree, VariablePartitions
+from task import Task, TypeTask
+
+#эталон фиксированных разделов: наименьший подходящий свободный раздел, при равенстве - с меньшим номером
+class ReferenceFixed:
+    def __init__(self, sizes):
+        self.sizes = sizes
+        self.free = set(range(len(sizes)))
+        self.allocations = {}
+
+    def allocate(self, task):
+        fitting = [(self.sizes[i], i) for i in self.free if self.sizes[i] >= task.memory]
+        if not fitting:
+            return False
+        i = min(fitting)[1]
+        self.free.remove(i)
+        self.allocations[task] = i
+        return True
+
+    def release(self, task):
+        self.free.add(self.allocations.pop(task))
+
+    def fragmentation(self):
+        reserved = sum(self.sizes[i] for i in self.allocations.values())
+        used = sum(task.memory for task in self.allocations)
+        return (reserved - used) / reserved if reserved else 0.0
+
+#эталон переменных разделов: свободные области вычисляются заново как промежутки между выделенными
+class ReferenceVariable:
+    def __init__(self, capacity, fit):
+        self.capacity = capacity
+        self.fit = fit
+        self.allocations = {}
+
+    def holes(self):
+        holes = []
+        position = 0
+        for start, size in sorted(self.allocations.values()):
+            if not size:
+                continue
+            if start > position:
+                holes.append((position, start - position))
+            position = max(position, start + size)
+        if position < self.capacity:
+            holes.append((position, self.capacity - position))
+        return holes
+
+    def allocate(self, task):
+        fitting = [(start, size) for start, size in self.holes() if size >= max(task.memory, 1)]
+        if not fitting:
+            return False
+        if self.fit == 'first':
+            start = fitting[0][0]
+        elif self.fit == 'best':
+            start = min(fitting, key=lambda hole: (hole[1], hole[0]))[0]
+        else:
+            start = max(fitting, key=lambda hole: (hole[1], hole[0]))[0]
+        self.allocations[task] = (start, task.memory)
+        return True
+
+    def release(self, task):
+        del self.allocations[task]
+
+    def fragmentation(self):
+        holes = self.holes()
+        free = sum(size for start, size in holes)
+        return 1 - max(size for start, size in holes) / free if free else 0.0
+
+class TestMaxTree(unittest.TestCase):
+    def test_findFirst(self):
+        rng = random.Random(1)
+        for size in (1, 5, 16, 37):
+            tree = MaxTree(size)
+            values = [0] * size
+            for _ in range(300):
+                i = rng.randrange(size)
+                values[i] = rng.randrange(10)
+                tree.set(i, values[i])
+                minimum = rng.randrange(1, 11)
+                start = rng.randrange(size + 1)
+                expected = next((j for j in range(start, size) if values[j] >= minimum), -1)
+                self.assertEqual(tree.findFirst(minimum, start), expected)
+                self.assertEqual(tree.max(), max(values))
+
+class TestAllocators(unittest.TestCase):
+    #случайная последовательность: выделение новой задачи или освобождение одной из размещенных
+    def run_sequence(self, allocator, reference, seed, steps=2000, max_memory=40):
+        rng = random.Random(seed)
+        live = []
+        for step in range(steps):
+            if live and rng.random() < 0.45:
+                task = live.pop(rng.randrange(len(live)))
+                allocator.release(task)
+                reference.release(task)
+            else:
+                task = Task(step, TypeTask.MATH, rng.randint(0, max_memory))
+                placed = allocator.allocate(task)
+                self.assertEqual(placed, reference.allocate(task), f"шаг {step}")
+                if placed:
+                    self.assertEqual(allocator.allocations[task], reference.allocations[task], f"шаг {step}")
+                    live.append(task)
+            self.assertAlmostEqual(allocator.fragmentation(), reference.fragmentation())
+            #восстановление из контрольной точки не должно менять дальнейшее размещение
+            if step % 500 == 499:
+                allocator.setAllocations(allocator.getAllocations())
+
+    def test_fixed(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            sizes = [rng.choice((8, 16, 24, 40)) for _ in range(rng.randint(1, 64))]
+            self.run_sequence(FixedPartitions(sizes), ReferenceFixed(sizes), seed)
+
+    def test_variable(self):
+        for fit in ('first', 'best', 'worst'):
+            for seed in range(5):
+                capacity = random.Random(seed).choice((64, 300, 1000))
+                self.run_sequence(VariablePartitions(capacity, fit), ReferenceVariable(capacity, fit), seed)
+
+if __name__ == "__main__":
+    unittest.main()
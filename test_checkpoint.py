@@ -0,0 +1,86 @@
+#проверка контрольных точек: прогон, продолженный с точки, должен совпасть с непрерывным
+import glob
+import os
+import tempfile
+import unittest
+from packetgen import PacketGenerator, writePacket
+from simulation import Simulation
+from test_eventdriven import PACKETS_DIR, firstDifference
+
+#количество разделов памяти
+BLOCK_COUNTS = (1, 3, 8)
+
+#такты, на которых сохраняется контрольная точка
+CUTS = (1, 5, 13, 40)
+
+#режимы прогона, состояние которых сохраняется по-разному
+MODES = (
+    {},
+    {'streaming': True},
+    {'cpu_count': 2},
+    {'cpu_count': 2, 'streaming': True},
+    {'event_driven': True},
+    {'quantum': 2, 'swap_cost': 1},
+    {'memory_model': 'first-fit', 'scheduler': 'priority'},
+    {'controller': 'adaptive'}
+)
+
+#прогон без ограничения длины
+MAX_TACTS = 100000
+
+#состояние завершенного прогона для сравнения
+def finalState(sim: Simulation) -> tuple:
+    system = sim.os
+    return (sim.total_tacts, system.current_tact, system.ready_count, system.cpu_state_counts,
+            system.getCoreStateCounts(), [task.num for task in system.ready_queue],
+            [task and task.num for task in system.memory_blocks], sim.memory_changes)
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.directory.name, 'checkpoint.npz')
+        #двоичный пакет подлиннее: точки сохраняются и посреди отображенного в память файла
+        self.binary_packet = os.path.join(self.directory.name, 'packet.pkb')
+        writePacket(PacketGenerator(300, seed=7), self.binary_packet)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertSameRun(self, full: Simulation, resumed: Simulation):
+        self.assertIsNone(firstDifference(full.os.history.asDict(), resumed.os.history.asDict()))
+        self.assertEqual(finalState(full), finalState(resumed))
+
+    def test_resume_matches_uninterrupted_run(self):
+        packets = sorted(glob.glob(os.path.join(PACKETS_DIR, '*.json*'))) + [self.binary_packet]
+        for json_file in packets:
+            for blocks in BLOCK_COUNTS:
+                for mode in MODES:
+                    settings = dict(max_blocks_count=blocks, ram=16, json_file=json_file, **mode)
+                    full = Simulation(max_tacts=MAX_TACTS, **settings)
+                    full.start()
+                    for cut in CUTS:
+                        with self.subTest(cut=cut, **settings):
+                            part = Simulation(max_tacts=cut, **settings)
+                            part.start()
+                            if part.isSimOver():
+                                continue
+                            part.saveCheckpoint(self.checkpoint)
+                            resumed = Simulation.fromCheckpoint(self.checkpoint, max_tacts=MAX_TACTS)
+                            resumed.resume()
+                            self.assertSameRun(full, resumed)
+
+    #точки, сохраняемые по ходу прогона: последняя продолжается до того же результата
+    def test_periodic_checkpoint(self):
+        for mode in ({}, {'cpu_count': 2, 'streaming': True}):
+            with self.subTest(**mode):
+                full = Simulation(max_blocks_count=2, ram=16, json_file=self.binary_packet, max_tacts=MAX_TACTS,
+                                  checkpoint_file=self.checkpoint, checkpoint_every=50, **mode)
+                full.start()
+                resumed = Simulation.fromCheckpoint(self.checkpoint)
+                self.assertGreater(resumed.total_tacts, 0)
+                self.assertLess(resumed.total_tacts, full.total_tacts)
+                resumed.resume()
+                self.assertSameRun(full, resumed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#проверка событийного режима: пропуск тихих тактов не должен менять результат прогона
+#
+#история и счетчики состояний процессора сравниваются с прогоном по тактам на пакетах из ready_packets
+import glob
+import os
+import unittest
+from controller import CONTROLLERS
+from simulation import Simulation
+
+PACKETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ready_packets')
+
+#количество разделов памяти
+BLOCK_COUNTS = (1, 2, 3, 4, 8, 16, 64)
+
+#ограничения длины прогона: обрыв посреди выполнения задач и прогон до конца пакета
+MAX_TACTS = (3, 7, 100000)
+
+#дополнительные режимы, в которых тихие такты считаются иначе
+MODES = (
+    {},
+    {'cpu_count': 2},
+    {'quantum': 2, 'swap_cost': 1},
+    {'memory_model': 'best-fit', 'scheduler': 'priority'}
+)
+
+#первое расхождение двух историй: столбец и такт (None, если истории совпадают)
+#сравнение целиком через assertEqual строило бы разницу длинных списков слишком долго
+def firstDifference(stepped: dict, skipped: dict):
+    for name in stepped.keys() | skipped.keys():
+        left, right = stepped.get(name), skipped.get(name)
+        if isinstance(left, dict) and isinstance(right, dict):
+            difference = firstDifference(left, right)
+            if difference is not None:
+                return (name,) + difference
+        elif left != right:
+            if not isinstance(left, list) or not isinstance(right, list):
+                return (name, left, right)
+            tact = next((i for i, (a, b) in enumerate(zip(left, right)) if a != b), min(len(left), len(right)))
+            return (name, tact, left[tact:tact + 1], right[tact:tact + 1])
+    return None
+
+class TestEventDriven(unittest.TestCase):
+    def run_pair(self, **settings):
+        results = []
+        for event_driven in (False, True):
+            sim = Simulation(event_driven=event_driven, **settings)
+            sim.start()
+            results.append((sim.os.history.asDict(), sim.os.cpu_state_counts, sim.os.getCoreStateCounts(),
+                            sim.total_tacts))
+        return results
+
+    def test_matches_tact_stepping(self):
+        packets = sorted(glob.glob(os.path.join(PACKETS_DIR, '*.json*')))
+        self.assertTrue(packets)
+        for json_file in packets:
+            for controller in CONTROLLERS:
+                for blocks in BLOCK_COUNTS:
+                    for max_tacts in MAX_TACTS:
+                        for mode in MODES:
+                            settings = dict(max_blocks_count=blocks, ram=16, json_file=json_file,
+                                            max_tacts=max_tacts, controller=controller, **mode)
+                            with self.subTest(**settings):
+                                stepped, skipped = self.run_pair(**settings)
+                                self.assertIsNone(firstDifference(stepped[0], skipped[0]))
+                                self.assertEqual(stepped[1:], skipped[1:])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#проверка загрузки задач планировщиком с окном при нехватке памяти
+import json
+import os
+import tempfile
+import unittest
+from scheduler import PriorityAging
+from simulation import Simulation
+from task import TypeTask
+
+#первой задаче хватает памяти, вторая не поместится, пока первая не выгружена, третья помещается сразу
+TASKS = [
+    {"num": 1, "type": "MATH", "memory": 900},
+    {"num": 2, "type": "MATH", "memory": 300},
+    {"num": 3, "type": "INOUT", "memory": 100}
+]
+
+class TestWindowedLoading(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.json_file = os.path.join(self.directory.name, 'packet.json')
+        with open(self.json_file, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": TASKS}, f)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def simulation(self, scheduler) -> Simulation:
+        return Simulation(max_blocks_count=3, ram=1, json_file=self.json_file, max_tacts=100,
+                          memory_model='first-fit', scheduler=scheduler)
+
+    def loaded(self, sim: Simulation) -> list:
+        return sorted(task.num for task in sim.os.memory_blocks if task is not None)
+
+    #задача, которой не хватило памяти, остается на своем месте в очереди и продолжает стареть,
+    #а вместо нее загружается другая задача окна
+    def test_skips_task_without_memory(self):
+        scheduler = PriorityAging(priorities={TypeTask.MATH: 1.0, TypeTask.INOUT: 0.0})
+        sim = self.simulation(scheduler)
+        sim.os.runTact()
+        arrival = {task.num: tact for task, tact in scheduler.arrivals.items()}
+        self.assertEqual(self.loaded(sim), [1, 3])
+        self.assertEqual([task.num for task in sim.os.wait_queue], [2])
+        sim.os.runTact()
+        self.assertEqual({task.num: tact for task, tact in scheduler.arrivals.items()}, arrival)
+        sim.resume()
+        self.assertTrue(sim.isSimOver())
+        self.assertEqual(scheduler.arrivals, {})
+
+    #FIFO ждет освобождения памяти для первой задачи очереди
+    def test_fifo_blocks_head_of_line(self):
+        sim = self.simulation('fifo')
+        sim.os.runTact()
+        self.assertEqual(self.loaded(sim), [1])
+        self.assertEqual([task.num for task in sim.os.wait_queue], [2])
+
+if __name__ == "__main__":
+    unittest.main()